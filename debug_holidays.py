@@ -14,7 +14,6 @@ logging.basicConfig(
     format='%(levelname)s: %(message)s'
 )
 
-import pytz
 from datetime import datetime, timedelta
 from src.context.metadata import (
     get_holidays,
@@ -1,6 +1,9 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
+import re
 from pathlib import Path
 import sys
 
@@ -12,21 +15,17 @@ try:
     _ENV_LOADED = True
 except Exception:
     # Simple fallback: parse a local .env file (KEY=VALUE) if it exists.
+    # One regex pass finds every KEY=VALUE line, skipping blanks and # comments.
+    _ENV_LINE = re.compile(r'^[ \t]*([^#\s=][^=\n]*?)[ \t]*=(.*)$', re.MULTILINE)
     _env_path = Path(__file__).with_name('.env')
     if _env_path.exists():
         try:
-            with _env_path.open('r', encoding='utf-8') as fh:
-                for raw in fh:
-                    line = raw.strip()
-                    if not line or line.startswith('#'):
-                        continue
-                    if '=' not in line:
-                        continue
-                    key, val = line.split('=', 1)
-                    key = key.strip()
-                    val = val.strip().strip('"').strip("'")
-                    if key and val and key not in os.environ:
-                        os.environ[key] = val
+            _env = {}
+            for key, val in _ENV_LINE.findall(_env_path.read_text(encoding='utf-8')):
+                val = val.strip().strip('"').strip("'")
+                if val:
+                    _env.setdefault(key, val)  # First definition wins
+            os.environ.update({k: v for k, v in _env.items() if k not in os.environ})
             _ENV_LOADED = True
         except Exception:
             _ENV_LOADED = False
@@ -62,9 +61,19 @@ PARAMS = {
 
 print(f"Requesting data for Webcam ID: {WEBCAM_ID}...")
 
+# One session for both requests: keep-alive connections and transient gateway errors
+# retried with a short backoff. The API key header is only sent to the Windy API,
+# not to the image host.
+session = requests.Session()
+session.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+))
+
 # --- 3. FETCH WEBCAM DATA ---
 try:
-    response = requests.get(API_URL, headers=HEADERS, params=PARAMS)
+    response = session.get(API_URL, headers=HEADERS, params=PARAMS, timeout=(5, 30))
     response.raise_for_status()  # Raises an exception for bad status codes (4xx or 5xx)
     webcam_data = response.json()
     
@@ -81,15 +90,18 @@ try:
     print(f"Successfully retrieved image URL: {image_url}")
 
     # --- 5. DOWNLOAD AND SAVE IMAGE ---
-    image_response = requests.get(image_url)
-    image_response.raise_for_status() 
-
-    with open(OUTPUT_FILENAME, 'wb') as f:
-        f.write(image_response.content)
+    # Stream the JPEG to disk in chunks instead of holding the whole body in memory
+    with session.get(image_url, stream=True, timeout=(5, 60)) as image_response:
+        image_response.raise_for_status()
+        with open(OUTPUT_FILENAME, 'wb', buffering=1024 * 1024) as f:
+            for chunk in image_response.iter_content(chunk_size=64 * 1024):
+                f.write(chunk)
 
     print(f"\n✅ SUCCESS! Image saved as {OUTPUT_FILENAME}")
     print(f"The LLM can now process this file for your blog post.")
 
 except requests.exceptions.RequestException as e:
     print(f"❌ An error occurred during the API request: {e}")
-    # Handle specific Windy API errors here (e.g., 401 for bad key)
\ No newline at end of file
+    # Handle specific Windy API errors here (e.g., 401 for bad key)
+finally:
+    session.close()
\ No newline at end of file
@@ -53,6 +53,10 @@ def main():
                 metadata={"hnsw:space": "cosine"}
             )
             logger.info("✅ Recreated collection")
+            
+            # The int8 index mirrors the collection, so clear it too
+            if retriever.quantized_index is not None:
+                retriever.quantized_index.clear()
         except Exception as e:
             logger.warning(f"Could not delete collection (may not exist): {e}")
     
@@ -14,13 +14,13 @@ import sys
 import argparse
 from pathlib import Path
 from datetime import datetime
-import pytz
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from src.service import run_observation_cycle, run_simulation_cycle
 from src.config import LOCATION_TIMEZONE
+from src.tz_cache import get_tz
 from src.context.metadata import get_time_of_day
 import logging
 
@@ -64,7 +64,7 @@ if __name__ == '__main__':
     
     try:
         # Determine observation type from current time
-        location_tz = pytz.timezone(LOCATION_TIMEZONE)
+        location_tz = get_tz(LOCATION_TIMEZONE)
         current_time = datetime.now(location_tz)
         current_hour = current_time.hour
         time_of_day = get_time_of_day(current_hour)
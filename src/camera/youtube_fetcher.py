@@ -1,9 +1,12 @@
 """Fetch live frames from YouTube streams using yt-dlp and FFmpeg."""
+import os
 import subprocess
 import hashlib
+import re
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional, Tuple
 import json
 import logging
 
@@ -15,6 +18,13 @@ logger = logging.getLogger(__name__)
 CACHE_METADATA_FILE = IMAGES_DIR / '.cache_metadata.json'
 IMAGE_CACHE_TTL_MINUTES = 30  # Cache expires after 30 minutes
 
+# Resolved stream URLs stay valid for hours, so captures reuse one instead of
+# running yt-dlp (several round-trips to YouTube) every time
+STREAM_URL_FALLBACK_TTL_SECONDS = 3600  # When the URL carries no expiry
+STREAM_URL_EXPIRY_MARGIN_SECONDS = 300  # Re-resolve this long before it expires
+_EXPIRE_PATTERN = re.compile(r'[/?&]expire[=/](\d+)')
+_stream_url_cache: Dict[str, Tuple[str, float]] = {}  # youtube_url -> (stream_url, expires_at)
+
 
 def _load_cache_metadata():
     """Load cache metadata."""
@@ -28,12 +38,18 @@ def _load_cache_metadata():
 
 
 def _save_cache_metadata(metadata):
-    """Save cache metadata."""
+    """Save cache metadata using atomic write."""
+    temp_file = CACHE_METADATA_FILE.with_suffix('.json.tmp')
     try:
-        with open(CACHE_METADATA_FILE, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        temp_file.write_text(json.dumps(metadata, indent=2))
+        os.replace(temp_file, CACHE_METADATA_FILE)
     except Exception as e:
         logger.error(f"Failed to save cache metadata: {e}")
+        if temp_file.exists():
+            try:
+                temp_file.unlink()
+            except Exception:
+                pass
 
 
 def _get_image_hash(image_path: Path) -> str:
@@ -91,6 +107,36 @@ def _get_youtube_stream_url(youtube_url: str) -> str:
         )
 
 
+def _stream_url_expiry(stream_url: str) -> float:
+    """Get the epoch time a resolved stream URL should be re-resolved by."""
+    # googlevideo URLs carry their expiry as expire=<epoch> or /expire/<epoch>/
+    match = _EXPIRE_PATTERN.search(stream_url)
+    if match:
+        return int(match.group(1)) - STREAM_URL_EXPIRY_MARGIN_SECONDS
+    return time.time() + STREAM_URL_FALLBACK_TTL_SECONDS
+
+
+def _get_stream_url(youtube_url: str, refresh: bool = False) -> Tuple[str, bool]:
+    """
+    Get the direct stream URL, reusing the last resolved one until it expires.
+    
+    Args:
+        youtube_url: YouTube URL (watch or live)
+        refresh: If True, resolve a new URL even if one is cached
+        
+    Returns:
+        Tuple of (stream_url, from_cache)
+    """
+    cached = _stream_url_cache.get(youtube_url)
+    if not refresh and cached and time.time() < cached[1]:
+        logger.info("✅ Reusing resolved stream URL")
+        return cached[0], True
+    
+    stream_url = _get_youtube_stream_url(youtube_url)
+    _stream_url_cache[youtube_url] = (stream_url, _stream_url_expiry(stream_url))
+    return stream_url, False
+
+
 def _capture_frame_with_ffmpeg(stream_url: str, output_path: Path) -> bool:
     """Capture a single frame from stream using FFmpeg."""
     ffmpeg_cmd = [
@@ -168,9 +214,9 @@ def fetch_latest_image(force_refresh: bool = False) -> Path:
     # Capture new frame
     logger.info(f"Capturing live frame from YouTube stream: {YOUTUBE_STREAM_URL}")
     
-    # Get stream URL using yt-dlp
+    # Get stream URL using yt-dlp (or the last one resolved, while still valid)
     try:
-        stream_url = _get_youtube_stream_url(YOUTUBE_STREAM_URL)
+        stream_url, from_cache = _get_stream_url(YOUTUBE_STREAM_URL)
     except Exception as e:
         logger.error(f"Failed to get YouTube stream URL: {e}")
         raise
@@ -181,7 +227,17 @@ def fetch_latest_image(force_refresh: bool = False) -> Path:
     image_path = IMAGES_DIR / filename
     
     success = _capture_frame_with_ffmpeg(stream_url, image_path)
+    if not success and from_cache:
+        # The stream may have restarted under a new URL - resolve it again and retry once
+        logger.info("Capture from reused stream URL failed, resolving a fresh one")
+        try:
+            stream_url, _ = _get_stream_url(YOUTUBE_STREAM_URL, refresh=True)
+        except Exception as e:
+            logger.error(f"Failed to get YouTube stream URL: {e}")
+            raise
+        success = _capture_frame_with_ffmpeg(stream_url, image_path)
     if not success:
+        _stream_url_cache.pop(YOUTUBE_STREAM_URL, None)
         raise Exception("Failed to capture frame with FFmpeg")
     
     # Calculate hash and update cache
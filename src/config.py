@@ -21,6 +21,9 @@ HUGO_SITE_PATH = Path(os.getenv('HUGO_SITE_PATH', './hugo')).resolve()
 HUGO_BUILD_ON_UPDATE = os.getenv('HUGO_BUILD_ON_UPDATE', 'true').lower() == 'true'
 HUGO_PUBLIC_DIR = HUGO_SITE_PATH / 'public'
 
+# Pulse news API timeouts in milliseconds: "connect,read", or a single value for the read timeout
+PULSE_TIMEOUT_MS = os.getenv('PULSE_TIMEOUT_MS', '3050,7000')
+
 # Deployment Configuration
 DEPLOY_ENABLED = os.getenv('DEPLOY_ENABLED', 'false').lower() == 'true'
 DEPLOY_METHOD = os.getenv('DEPLOY_METHOD', 'rsync').lower()  # 'rsync' or 'scp'
@@ -45,6 +48,18 @@ HUGO_STATIC_IMAGES_DIR = HUGO_SITE_PATH / 'static' / 'images'
 MEMORY_RETENTION_DAYS = int(os.getenv('MEMORY_RETENTION_DAYS', '30'))
 MAX_MEMORY_ENTRIES = int(os.getenv('MAX_MEMORY_ENTRIES', '50'))
 
+# Embedding Configuration
+# 'auto' runs the memory embedding model on ONNX Runtime when onnxruntime/optimum are
+# installed and falls back to PyTorch otherwise; 'onnx' or 'torch' force a backend
+EMBEDDING_BACKEND = os.getenv('EMBEDDING_BACKEND', 'auto').lower()
+# CPU threads for embedding inference (default: all cores)
+EMBEDDING_THREADS = max(1, int(os.getenv('EMBEDDING_THREADS', '0')) or os.cpu_count() or 4)
+# Precision of the PyTorch embedding forward pass: fp32, fp16 or bf16 (default: fp32).
+# Half precision halves matmul bandwidth; on CPU it runs under torch.autocast
+EMBEDDING_PRECISION = os.getenv('EMBEDDING_PRECISION', 'fp32').lower()
+# Optional ONNX file within the model repo, e.g. 'onnx/model_qint8_avx512_vnni.onnx' for int8 weights
+EMBEDDING_ONNX_FILE = os.getenv('EMBEDDING_ONNX_FILE', '')
+
 # Model Configuration
 PROMPT_GENERATION_MODEL = 'openai/gpt-oss-20b'
 VISION_MODEL = 'meta-llama/llama-4-maverick-17b-128e-instruct'
@@ -55,6 +70,7 @@ MEMORY_SUMMARIZATION_MODEL = 'llama-3.1-8b-instant'  # Cheap model for memory su
 DIARY_WRITING_MODEL = os.getenv('DIARY_WRITING_MODEL', VISION_MODEL)
 
 # Prompt Generation Configuration
+# Off by default: the direct template combination needs no extra LLM call per cycle
 USE_PROMPT_OPTIMIZATION = os.getenv('USE_PROMPT_OPTIMIZATION', 'false').lower() == 'true'
 
 # Web Search Configuration
@@ -100,8 +116,8 @@ if YOUTUBE_STREAM_URL and not ('youtube.com' in YOUTUBE_STREAM_URL or 'youtu.be'
 
 # Validate timezone
 try:
-    import pytz
-    pytz.timezone(LOCATION_TIMEZONE)
+    from .tz_cache import get_tz
+    get_tz(LOCATION_TIMEZONE)
 except Exception as e:
     raise ValueError(f"Invalid timezone: {LOCATION_TIMEZONE} - {e}")
 
@@ -111,6 +127,12 @@ if not HUGO_SITE_PATH.exists():
 if not (HUGO_SITE_PATH / 'hugo.toml').exists() and not (HUGO_SITE_PATH / 'config.toml').exists():
     raise ValueError(f"HUGO_SITE_PATH does not appear to be a valid Hugo site: {HUGO_SITE_PATH}")
 
+if EMBEDDING_BACKEND not in ['auto', 'onnx', 'torch']:
+    raise ValueError(f"Invalid EMBEDDING_BACKEND: {EMBEDDING_BACKEND}. Must be 'auto', 'onnx' or 'torch'")
+
+if EMBEDDING_PRECISION not in ['fp32', 'fp16', 'bf16']:
+    raise ValueError(f"Invalid EMBEDDING_PRECISION: {EMBEDDING_PRECISION}. Must be 'fp32', 'fp16' or 'bf16'")
+
 # Validate deployment config if enabled
 if DEPLOY_ENABLED:
     if not DEPLOY_DESTINATION:
@@ -1,6 +1,6 @@
 """Generate context metadata (date/time, weather, etc.) for prompts."""
 from datetime import datetime, timedelta
-import pytz
+from functools import lru_cache
 from typing import Dict, List, Optional
 import logging
 
@@ -8,7 +8,8 @@ from ..config import ROBOT_NAME, LOCATION_LATITUDE, LOCATION_LONGITUDE, LOCATION
 
 # New Orleans, Louisiana timezone (Central Time)
 from ..config import LOCATION_TIMEZONE
-LOCATION_TZ = pytz.timezone(LOCATION_TIMEZONE)
+from ..tz_cache import get_tz
+LOCATION_TZ = get_tz(LOCATION_TIMEZONE)
 
 logger = logging.getLogger(__name__)
 
@@ -261,7 +262,7 @@ def get_upcoming_holidays(date: datetime, days_ahead: int = 30) -> List[Dict]:
                     logger.info(f"🎄 Found upcoming holiday: {holiday_name} in {i} days ({check_date_str})")
                 else:
                     # Log holidays we're filtering out for debugging
-                    logger.debug(f"Filtered out minor holiday: {holiday_name} on {check_date_str}")
+                    logger.debug("Filtered out minor holiday: %s on %s", holiday_name, check_date_str)
         
         # Sort by days until
         upcoming.sort(key=lambda x: x['days_until'])
@@ -269,8 +270,8 @@ def get_upcoming_holidays(date: datetime, days_ahead: int = 30) -> List[Dict]:
         # Debug: log if no holidays found
         if not upcoming and holidays_found_in_dict > 0:
             logger.warning(f"Found {holidays_found_in_dict} holiday(s) in date range but all were filtered out as minor holidays")
-        elif not upcoming:
-            # Check a few specific dates to see what's happening
+        elif not upcoming and logger.isEnabledFor(logging.DEBUG):
+            # Check a few specific dates to see what's happening (debug diagnostics only)
             sample_dates = [(date_only + timedelta(days=i)).strftime('%Y-%m-%d') for i in [1, 11, 25] if i <= days_ahead]
             logger.debug(f"No upcoming holidays found. Checked {days_ahead} days from {date_only}. Sample dates: {sample_dates}")
             # Check if Christmas is actually in the dict
@@ -286,8 +287,9 @@ def get_upcoming_holidays(date: datetime, days_ahead: int = 30) -> List[Dict]:
         return upcoming
     except Exception as e:
         logger.warning(f"Error detecting upcoming holidays: {e}")
-        import traceback
-        logger.debug(f"Traceback: {traceback.format_exc()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            import traceback
+            logger.debug(f"Traceback: {traceback.format_exc()}")
         return []
 
 
@@ -571,19 +573,35 @@ def get_context_metadata(weather_data: Dict = None, observation_type: str = None
     # Get current time in location timezone
     now = datetime.now(LOCATION_TZ)
     
+    # Determine observation type if not provided
+    if observation_type is None:
+        observation_type = "morning" if get_time_of_day(now.hour) == "morning" else "evening"
+    
+    # Everything except the weather only changes by the minute, so repeated calls
+    # (e.g. a burst of manual triggers) reuse it. Copy so callers can add keys freely.
+    metadata = dict(_minute_metadata(now.replace(second=0, microsecond=0), observation_type))
+    metadata['weather'] = weather_data or {}
+    return metadata
+
+
+@lru_cache(maxsize=8)
+def _minute_metadata(now: datetime, observation_type: str) -> Dict:
+    """
+    Build the weather-independent context metadata for one minute.
+    
+    Args:
+        now: Current time in location timezone, truncated to the minute
+        observation_type: Type of observation ('morning' or 'evening')
+        
+    Returns:
+        Dictionary with context metadata (weather left empty). Shared between
+        calls, so get_context_metadata hands out copies.
+    """
     # Day of week names
     day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
     month_names = ['January', 'February', 'March', 'April', 'May', 'June',
                    'July', 'August', 'September', 'October', 'November', 'December']
     
-    # Determine observation type if not provided
-    if observation_type is None:
-        time_of_day_str = get_time_of_day(now.hour)
-        if time_of_day_str == "morning":
-            observation_type = "morning"
-        else:
-            observation_type = "evening"
-    
     metadata = {
         # Date/Time
         'date': now.strftime('%B %d, %Y'),  # "December 11, 2025"
@@ -612,8 +630,8 @@ def get_context_metadata(weather_data: Dict = None, observation_type: str = None
         # Robot info
         'robot_name': ROBOT_NAME,
         
-        # Weather (if provided)
-        'weather': weather_data or {}
+        # Weather (filled in per call by get_context_metadata)
+        'weather': {}
     }
     
     # Add moon phase (if available)
@@ -1,4 +1,5 @@
 """Generate Hugo blog posts and build the site."""
+import os
 import subprocess
 from pathlib import Path
 from datetime import datetime
@@ -14,9 +15,10 @@ from ..config import (
     DEPLOY_ENABLED,
     DEPLOY_METHOD,
     DEPLOY_DESTINATION,
-    DEPLOY_SSH_KEY
+    DEPLOY_SSH_KEY,
+    ROBOT_NAME
 )
-from ..context.metadata import LOCATION_TZ
+from ..context.metadata import LOCATION_TZ, format_date_for_title
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +48,6 @@ class HugoGenerator:
         # Generate title from context metadata first (needed for image filename)
         post_title = ""
         if context_metadata:
-            from ..context.metadata import format_date_for_title
             try:
                 post_title = format_date_for_title(context_metadata)
                 # If news-based, add indicator to title
@@ -96,7 +97,6 @@ class HugoGenerator:
             post_path = self.content_dir / post_filename
         
         # Create front matter and content
-        from ..config import ROBOT_NAME
         tags = ["robot-diary", "observation", "b3n-t5-mnt"]
         if is_news_based:
             tags.append("news-transmission")
@@ -160,7 +160,7 @@ tags = {tags}
                 check=True
             )
             logger.info("✅ Hugo site built successfully")
-            logger.debug(f"Hugo output: {result.stdout}")
+            logger.debug("Hugo output: %s", result.stdout)
             return True
         except subprocess.CalledProcessError as e:
             logger.error(f"❌ Hugo build failed: {e}")
@@ -209,7 +209,6 @@ tags = {tags}
                     
                     # Fix permissions (SSH requires 600 for private keys)
                     try:
-                        import os
                         os.chmod(ssh_key_path, 0o600)
                     except Exception as e:
                         logger.warning(f"Could not set key permissions: {e}")
@@ -231,7 +230,7 @@ tags = {tags}
                     check=True
                 )
                 logger.info("✅ Site deployed successfully via rsync")
-                logger.debug(f"Rsync output: {result.stdout}")
+                logger.debug("Rsync output: %s", result.stdout)
                 return True
                 
             elif DEPLOY_METHOD == 'scp':
@@ -245,7 +244,6 @@ tags = {tags}
                     
                     # Fix permissions (SSH requires 600 for private keys)
                     try:
-                        import os
                         os.chmod(ssh_key_path, 0o600)
                     except Exception as e:
                         logger.warning(f"Could not set key permissions: {e}")
@@ -264,7 +262,7 @@ tags = {tags}
                     check=True
                 )
                 logger.info("✅ Site deployed successfully via scp")
-                logger.debug(f"Scp output: {result.stdout}")
+                logger.debug("Scp output: %s", result.stdout)
                 return True
             else:
                 logger.error(f"❌ Unknown deployment method: {DEPLOY_METHOD}")
@@ -6,13 +6,18 @@ import logging
 import random
 from datetime import datetime, timedelta
 from typing import List
-import pytz
 from groq import Groq
 
-from ..config import GROQ_API_KEY, PROMPT_GENERATION_MODEL, VISION_MODEL, MEMORY_SUMMARIZATION_MODEL, USE_PROMPT_OPTIMIZATION, DIARY_WRITING_MODEL
+from ..config import GROQ_API_KEY, PROMPT_GENERATION_MODEL, VISION_MODEL, MEMORY_SUMMARIZATION_MODEL, USE_PROMPT_OPTIMIZATION, DIARY_WRITING_MODEL, LOCATION_TIMEZONE, ENABLE_WEB_SEARCH
+from ..context.metadata import format_context_for_prompt, format_weather_for_prompt
+from ..tz_cache import get_tz
+from .prompts import WRITING_INSTRUCTIONS, ROBOT_IDENTITY
 
 logger = logging.getLogger(__name__)
 
+# Location timezone for prompts built without context metadata
+LOCATION_TZ = get_tz(LOCATION_TIMEZONE)
+
 
 class GroqClient:
     """Client for interacting with Groq API."""
@@ -50,12 +55,10 @@ class GroqClient:
         # Format context information
         context_text = ""
         if context_metadata:
-            from ..context.metadata import format_context_for_prompt
             context_text = format_context_for_prompt(context_metadata)
         
         weather_text = ""
         if weather_data:
-            from ..context.metadata import format_weather_for_prompt
             weather_text = format_weather_for_prompt(weather_data)
         
         # Format news articles/headlines if available
@@ -160,7 +163,6 @@ class GroqClient:
         logger.info("=" * 60)
         
         # Build base template with randomized identity
-        from ..llm.prompts import WRITING_INSTRUCTIONS
         randomized_base_template = f"""{randomized_identity}
 {WRITING_INSTRUCTIONS}"""
         
@@ -241,7 +243,10 @@ class GroqClient:
             return self.generate_direct_prompt(recent_memory, base_prompt_template, 
                                              context_metadata, weather_data, memory_count, days_since_first)
         
-        # Use LLM-based optimization if flag is enabled
+        # Use LLM-based optimization if flag is enabled.
+        # The result is deliberately not cached: each request carries freshly randomized
+        # style/perspective/focus selections and the current time, so reusing an earlier
+        # prompt for "similar" context would repeat the same instructions across entries.
         logger.info(f"Generating dynamic prompt using {PROMPT_GENERATION_MODEL}...")
         
         # NOTE: We no longer pre-load memories into the prompt
@@ -251,12 +256,10 @@ class GroqClient:
         # Format context information
         context_text = ""
         if context_metadata:
-            from ..context.metadata import format_context_for_prompt
             context_text = format_context_for_prompt(context_metadata)
         
         weather_text = ""
         if weather_data:
-            from ..context.metadata import format_weather_for_prompt
             weather_text = format_weather_for_prompt(weather_data)
         
         # Format news articles/headlines if available
@@ -462,13 +465,11 @@ Generate ONLY the optimized prompt text, ready to be used with the vision model.
             current_time = context_metadata.get('time', '')
             timezone = context_metadata.get('timezone', 'EST')
         else:
-            from ..config import LOCATION_TIMEZONE
-            location_tz = pytz.timezone(LOCATION_TIMEZONE)
-            now = datetime.now(location_tz)
+            now = datetime.now(LOCATION_TZ)
             current_date = now.strftime('%B %d, %Y')
             day_of_week = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'][now.weekday()]
             current_time = now.strftime('%I:%M %p')
-            timezone = 'CST' if now.astimezone(location_tz).dst() == timedelta(0) else 'CDT'
+            timezone = 'CST' if now.dst() == timedelta(0) else 'CDT'
         
         # Determine observation type and narrative context
         obs_type = context_metadata.get('observation_type', 'evening') if context_metadata else 'evening'
@@ -490,7 +491,6 @@ Generate ONLY the optimized prompt text, ready to be used with the vision model.
         # Browser search is a built-in Groq tool for GPT-OSS-120B
         # We don't need to add it to the tools list - it's automatically available
         # Just log that it's available
-        from ..config import ENABLE_WEB_SEARCH
         if ENABLE_WEB_SEARCH and self._supports_browser_search():
             logger.info("🌐 Browser search tool available - robot can search the web for current information (built-in Groq tool)")
         
@@ -606,7 +606,7 @@ Important reminders:
                                 search_args = json.loads(tc.function.arguments)
                                 search_query = search_args.get("query", "")
                                 logger.info(f"🌐 Robot requested web search: '{search_query}'")
-                            except:
+                            except (AttributeError, TypeError, ValueError):
                                 logger.info("🌐 Robot requested web search (query parsing failed)")
                     
                     # Handle memory tool calls
@@ -621,7 +621,7 @@ Important reminders:
                                 # Normalize function name - some models add "functions/" prefix
                                 if function_name.startswith("functions/"):
                                     function_name = function_name.replace("functions/", "", 1)
-                                    logger.debug(f"Normalized function name from '{tool_call.function.name}' to '{function_name}'")
+                                    logger.debug("Normalized function name from '%s' to '%s'", tool_call.function.name, function_name)
                                 
                                 try:
                                     function_args = json.loads(tool_call.function.arguments)
@@ -830,13 +830,11 @@ Provide a comprehensive description that emphasizes dynamic elements and include
             timezone = context_metadata.get('timezone', 'EST')
         else:
             # Fallback: calculate from current time
-            from ..config import LOCATION_TIMEZONE
-            location_tz = pytz.timezone(LOCATION_TIMEZONE)
-            now = datetime.now(location_tz)
+            now = datetime.now(LOCATION_TZ)
             current_date = now.strftime('%B %d, %Y')  # "December 11, 2025"
             day_of_week = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'][now.weekday()]
             current_time = now.strftime('%I:%M %p')
-            timezone = 'CST' if now.astimezone(location_tz).dst() == timedelta(0) else 'CDT'
+            timezone = 'CST' if now.dst() == timedelta(0) else 'CDT'
         
         # Determine observation type and narrative context
         obs_type = "evening"
@@ -873,7 +871,6 @@ Provide a comprehensive description that emphasizes dynamic elements and include
         # Browser search is a built-in Groq tool for GPT-OSS-120B
         # We don't need to add it to the tools list - it's automatically available
         # Just log that it's available
-        from ..config import ENABLE_WEB_SEARCH
         if ENABLE_WEB_SEARCH and self._supports_browser_search():
             logger.info("🌐 Browser search tool available - robot can search the web for current information (built-in Groq tool)")
         
@@ -884,7 +881,6 @@ Provide a comprehensive description that emphasizes dynamic elements and include
         # Generate randomized search suggestions (only if web search is enabled)
         search_suggestions = []
         web_search_guidance = ""
-        from ..config import ENABLE_WEB_SEARCH
         if ENABLE_WEB_SEARCH and self._supports_browser_search():
             search_suggestions = self._get_randomized_search_suggestions(context_metadata)
             search_suggestions_text = ""
@@ -1020,7 +1016,7 @@ STYLE GUIDANCE: While you may use technical terminology and think in mechanical
                                 search_args = json.loads(tc.function.arguments)
                                 search_query = search_args.get("query", "")
                                 logger.info(f"🌐 Robot requested web search: '{search_query}'")
-                            except:
+                            except (AttributeError, TypeError, ValueError):
                                 logger.info("🌐 Robot requested web search (query parsing failed)")
                     
                     # Handle memory tool calls
@@ -1035,7 +1031,7 @@ STYLE GUIDANCE: While you may use technical terminology and think in mechanical
                                 # Normalize function name - some models add "functions/" prefix
                                 if function_name.startswith("functions/"):
                                     function_name = function_name.replace("functions/", "", 1)
-                                    logger.debug(f"Normalized function name from '{tool_call.function.name}' to '{function_name}'")
+                                    logger.debug("Normalized function name from '%s' to '%s'", tool_call.function.name, function_name)
                                 
                                 try:
                                     function_args = json.loads(tool_call.function.arguments)
@@ -1133,10 +1129,9 @@ STYLE GUIDANCE: While you may use technical terminology and think in mechanical
         try:
             # Format date for prompt
             try:
-                from datetime import datetime
                 dt = datetime.fromisoformat(date.replace('Z', '+00:00'))
                 formatted_date = dt.strftime('%B %d, %Y')
-            except:
+            except (AttributeError, TypeError, ValueError):
                 formatted_date = date
             
             summary_prompt = f"""Summarize this diary entry from a maintenance robot's observation, preserving:
@@ -1167,7 +1162,7 @@ Provide ONLY the summary, no explanation."""
             )
             
             summary = response.choices[0].message.content.strip()
-            logger.debug(f"Generated LLM summary for observation #{observation_id}: {summary[:100]}...")
+            logger.debug("Generated LLM summary for observation #%s: %.100s...", observation_id, summary)
             return summary
             
         except Exception as e:
@@ -1192,10 +1187,9 @@ Provide ONLY the summary, no explanation."""
             date = entry.get('date', 'Unknown date')
             # Try to parse ISO date for better formatting
             try:
-                from datetime import datetime
                 dt = datetime.fromisoformat(date.replace('Z', '+00:00'))
                 formatted_date = dt.strftime('%B %d, %Y')
-            except:
+            except (AttributeError, TypeError, ValueError):
                 formatted_date = date
             # Handle both hybrid retriever format (has 'text') and old format
             if 'text' in entry:
@@ -1245,7 +1239,6 @@ Provide ONLY the summary, no explanation."""
         Generate style variation instructions to avoid repetitive posts.
         Returns different writing styles/focuses to encourage variety.
         """
-        import random
         
         style_options = [
     # Detail-focused styles
@@ -1392,7 +1385,6 @@ Provide ONLY the summary, no explanation."""
     
     def _get_perspective_shift(self) -> str:
         """Generate perspective variation instructions."""
-        import random
         
         perspectives = [
             # Human-like perspectives
@@ -1445,7 +1437,6 @@ Provide ONLY the summary, no explanation."""
     
     def _get_focus_instruction(self, context_metadata: dict) -> str:
         """Generate focus instructions based on context."""
-        import random
         
         focus_options = []
         
@@ -1592,7 +1583,6 @@ Provide ONLY the summary, no explanation."""
     
     def _get_creative_challenge(self) -> str:
         """Generate a random creative challenge to encourage innovation."""
-        import random
         
         challenges = [
             "Try an unexpected metaphor for what you see - use your robotic perspective to make a comparison humans wouldn't think of",
@@ -1762,7 +1752,6 @@ Provide ONLY the summary, no explanation."""
         Build identity prompt with randomized subset of backstory points.
         Always includes condensed core identity, randomly selects 2-3 backstory points.
         """
-        from ..llm.prompts import ROBOT_IDENTITY
         
         # Extract core identity (first 3 paragraphs) and condense
         lines = ROBOT_IDENTITY.split('\n')
@@ -1797,9 +1786,10 @@ You are a curious and compassionate observer of human nature, an Ethnographer. Y
                 break
         
         # Build randomized identity
+        backstory_block = '\n'.join(selected_backstory)
         randomized = f"""{condensed_core}
 INTERNAL BACKSTORY (these inform your perspective but are not facts to announce):
-{chr(10).join(selected_backstory)}
+{backstory_block}
 {closing_paragraph}"""
         
         logger.info(f"📚 Selected {len(selected_backstory)} of {len(backstory_points)} backstory points")
@@ -1807,7 +1797,6 @@ INTERNAL BACKSTORY (these inform your perspective but are not facts to announce)
     
     def _get_reflection_instructions(self) -> str:
         """Randomly determine if we should include special reflection types."""
-        import random
         
         # 50% chance for a "musing" event, otherwise no special instruction
         if random.random() < 0.50:
@@ -1954,7 +1943,6 @@ INTERNAL BACKSTORY (these inform your perspective but are not facts to announce)
         Returns:
             List of 3 search query strings
         """
-        import random
         
         # Base pool of search topics (always available)
         search_topics = [
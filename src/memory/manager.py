@@ -8,12 +8,52 @@ import logging
 from ..config import MEMORY_DIR, MEMORY_RETENTION_DAYS, MAX_MEMORY_ENTRIES
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 MEMORY_FILE = MEMORY_DIR / 'observations.json'
 SCHEDULE_FILE = MEMORY_DIR / 'schedule.json'
 
 
+def _file_signature(path: Path) -> Optional[tuple]:
+    """
+    Identify a file's current contents without reading it.
+    
+    Saves replace files atomically, so every save gets a new inode.
+    
+    Returns:
+        Tuple of (path, inode, mtime_ns, size), or None if the file is missing
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (str(path), st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when it's installed."""
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """
+    Serialize to indented UTF-8 JSON bytes, using orjson when it's installed.
+    
+    Both paths produce the same 2-space layout; orjson writes non-ASCII
+    text as UTF-8 rather than escaping it.
+    """
+    if orjson is None:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+
 class MemoryManager:
     """Manages robot memory/observations."""
     
@@ -22,6 +62,10 @@ class MemoryManager:
         self._ensure_memory_file()
         # Initialize hybrid retriever (lazy initialization)
         self._hybrid_retriever = None
+        # Last schedule read or written, as (file signature, next_observation)
+        self._schedule_cache = None
+        # Last memory list read or written, as (file signature, entries)
+        self._memory_cache = None
     
     def _get_hybrid_retriever(self):
         """Lazy initialization of hybrid retriever."""
@@ -43,16 +87,26 @@ class MemoryManager:
             self._save_memory([])
     
     def _load_memory(self) -> List[Dict]:
-        """Load memory from file with error recovery."""
-        if not self.memory_file.exists():
+        """
+        Load memory from file with error recovery.
+        
+        The parsed list is kept in memory and the file is only re-read when it
+        changes on disk. Callers get their own list (entries are shared, read-only).
+        """
+        signature = _file_signature(self.memory_file)
+        if signature is None:
             return []
+        if self._memory_cache is not None and self._memory_cache[0] == signature:
+            return list(self._memory_cache[1])
         
         try:
-            with open(self.memory_file, 'r') as f:
+            with open(self.memory_file, 'rb') as f:
                 content = f.read().strip()
                 if not content:
                     return []
-                return json.loads(content)
+                memory = _json_loads(content)
+                self._memory_cache = (signature, memory)
+                return list(memory)
         except json.JSONDecodeError as e:
             logger.error(f"JSON decode error loading memory: {e}")
             logger.warning("Memory file appears corrupted. Attempting to recover...")
@@ -76,8 +130,8 @@ class MemoryManager:
             temp_file = self.memory_file.with_suffix('.json.tmp')
             
             # Write JSON to temp file
-            with open(temp_file, 'w') as f:
-                json.dump(memory, f, indent=2)
+            with open(temp_file, 'wb') as f:
+                f.write(_json_dumps(memory))
                 # Ensure data is flushed to disk
                 f.flush()
                 import os
@@ -86,6 +140,7 @@ class MemoryManager:
             # Atomic rename (works on most filesystems)
             # This ensures the original file is only replaced if write succeeds
             temp_file.replace(self.memory_file)
+            self._memory_cache = (_file_signature(self.memory_file), list(memory))
             logger.debug(f"Memory saved successfully ({len(memory)} entries)")
             
         except Exception as e:
@@ -108,6 +163,9 @@ class MemoryManager:
             diary_entry: The generated diary entry text
             image_url: Original image URL (optional)
             llm_client: Optional GroqClient instance for generating LLM summaries
+            
+        Returns:
+            ID of the new observation
         """
         memory = self._load_memory()
         
@@ -151,6 +209,8 @@ class MemoryManager:
         retriever = self._get_hybrid_retriever()
         if retriever:
             retriever.add_memory_to_chroma(observation)
+        
+        return observation_id
     
     def get_recent_memory(self, count: int = 10) -> List[Dict]:
         """
@@ -239,6 +299,19 @@ class MemoryManager:
         memory = self._load_memory()
         return len(memory)
     
+    def get_memory_state(self) -> Dict:
+        """
+        Get the memory statistics an observation cycle needs, from a single load.
+        
+        Returns:
+            Dictionary with 'total_count' and 'first_observation_date' (datetime or None)
+        """
+        memory = self._load_memory()
+        return {
+            'total_count': len(memory),
+            'first_observation_date': self._first_observation_date(memory)
+        }
+    
     def get_first_observation_date(self) -> Optional[datetime]:
         """
         Get the date of the first observation.
@@ -246,7 +319,11 @@ class MemoryManager:
         Returns:
             Datetime of first observation, or None if no observations exist
         """
-        memory = self._load_memory()
+        return self._first_observation_date(self._load_memory())
+    
+    @staticmethod
+    def _first_observation_date(memory: List[Dict]) -> Optional[datetime]:
+        """Parse the date of the first entry in a loaded memory list."""
         if not memory:
             return None
         
@@ -261,23 +338,37 @@ class MemoryManager:
         
         return None
     
+    @staticmethod
+    def _schedule_signature() -> Optional[tuple]:
+        """Identify the current schedule file contents without reading them."""
+        return _file_signature(SCHEDULE_FILE)
+    
     def get_next_scheduled_time(self) -> Optional[Dict]:
         """
         Get the next scheduled observation time from memory.
         
+        The parsed schedule is kept in memory and the file is only re-read
+        when it changes on disk (e.g. written by another process).
+        
         Returns:
             Dictionary with 'datetime' (ISO string) and 'type' ('morning' or 'evening'), or None
         """
-        if not SCHEDULE_FILE.exists():
+        signature = self._schedule_signature()
+        if signature is None:
             return None
+        if self._schedule_cache is not None and self._schedule_cache[0] == signature:
+            next_observation = self._schedule_cache[1]
+            return dict(next_observation) if next_observation is not None else None
         
         try:
-            with open(SCHEDULE_FILE, 'r') as f:
+            with open(SCHEDULE_FILE, 'rb') as f:
                 content = f.read().strip()
                 if not content:
                     return None
-                schedule = json.loads(content)
-                return schedule.get('next_observation')
+                schedule = _json_loads(content)
+                next_observation = schedule.get('next_observation')
+                self._schedule_cache = (signature, next_observation)
+                return dict(next_observation) if next_observation is not None else None
         except json.JSONDecodeError as e:
             logger.error(f"JSON decode error loading schedule: {e}")
             logger.warning("Schedule file appears corrupted. Attempting to recover...")
@@ -298,24 +389,34 @@ class MemoryManager:
         """
         Save the next scheduled observation time to memory using atomic write.
         
+        Saving the schedule that is already on disk is skipped, so re-saving an
+        unchanged schedule costs no fsync'd write.
+        
         Args:
             next_time: Next observation datetime
             obs_type: Type of observation ('morning' or 'evening')
         """
+        next_observation = {
+            'datetime': next_time.isoformat(),
+            'type': obs_type
+        }
+        if (self._schedule_cache is not None
+                and self._schedule_cache[1] == next_observation
+                and self._schedule_cache[0] == self._schedule_signature()):
+            logger.debug(f"Next scheduled time unchanged: {next_time.isoformat()} ({obs_type})")
+            return
+        
         try:
             schedule = {
-                'next_observation': {
-                    'datetime': next_time.isoformat(),
-                    'type': obs_type
-                },
+                'next_observation': next_observation,
                 'last_updated': datetime.now().isoformat()
             }
             
             # Write to temporary file first
             temp_file = SCHEDULE_FILE.with_suffix('.json.tmp')
             
-            with open(temp_file, 'w') as f:
-                json.dump(schedule, f, indent=2)
+            with open(temp_file, 'wb') as f:
+                f.write(_json_dumps(schedule))
                 # Ensure data is flushed to disk
                 f.flush()
                 import os
@@ -323,6 +424,7 @@ class MemoryManager:
             
             # Atomic rename
             temp_file.replace(SCHEDULE_FILE)
+            self._schedule_cache = (self._schedule_signature(), schedule['next_observation'])
             logger.debug(f"Saved next scheduled time: {next_time.isoformat()} ({obs_type})")
             
         except Exception as e:
@@ -88,7 +88,7 @@ class MemoryQueryTools:
                     from datetime import datetime
                     dt = datetime.fromisoformat(date.replace('Z', '+00:00'))
                     formatted_date = dt.strftime('%B %d, %Y')
-                except:
+                except (AttributeError, TypeError, ValueError):
                     formatted_date = date
                 
                 formatted.append(f"Observation #{mem_id} ({formatted_date}): {text[:300]}{'...' if len(text) > 300 else ''}")
@@ -128,7 +128,7 @@ class MemoryQueryTools:
                     from datetime import datetime
                     dt = datetime.fromisoformat(date.replace('Z', '+00:00'))
                     formatted_date = dt.strftime('%B %d, %Y')
-                except:
+                except (AttributeError, TypeError, ValueError):
                     formatted_date = date
                 
                 formatted.append(f"Observation #{mem_id} ({formatted_date}): {text[:300]}{'...' if len(text) > 300 else ''}")
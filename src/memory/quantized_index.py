@@ -0,0 +1,206 @@
+"""Compact int8 copy of memory embeddings for fast local similarity search."""
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# all-MiniLM-L6-v2 embeddings are L2-normalized, so every component lies in [-1, 1]
+# and a single global scale maps them onto the full int8 range.
+INT8_SCALE = 127.0
+
+# Number of Hamming-distance candidates rescored with the int8 embeddings.
+# Collections no larger than this are scanned exactly.
+BINARY_RESCORE_CANDIDATES = 200
+
+# Set bits per byte value, for popcounts over packed binary embeddings
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def quantize_int8(embeddings) -> np.ndarray:
+    """
+    Scalar-quantize normalized float embeddings to int8.
+
+    Args:
+        embeddings: Array of shape (N, dim) or (dim,) with components in [-1, 1]
+
+    Returns:
+        int8 array with the same shape (4x smaller than float32)
+    """
+    scaled = np.rint(np.asarray(embeddings, dtype=np.float32) * INT8_SCALE)
+    return np.clip(scaled, -127, 127).astype(np.int8)
+
+
+def dequantize_int8(quantized: np.ndarray) -> np.ndarray:
+    """Map int8 embeddings back to approximate float32 values."""
+    return quantized.astype(np.float32) / INT8_SCALE
+
+
+def quantize_binary(embeddings) -> np.ndarray:
+    """
+    Quantize embeddings to 1 bit per dimension (the sign), packed into uint8.
+
+    A 384-dim embedding becomes 48 bytes.
+    """
+    return np.packbits(np.asarray(embeddings) > 0, axis=-1)
+
+
+def hamming_distances(binary_matrix: np.ndarray, binary_query: np.ndarray) -> np.ndarray:
+    """Hamming distance between each packed row and a packed query."""
+    return _POPCOUNT[np.bitwise_xor(binary_matrix, binary_query)].sum(axis=1, dtype=np.int32)
+
+
+class QuantizedEmbeddingIndex:
+    """
+    int8 scalar-quantized embedding matrix keyed by memory ID, persisted as .npz.
+
+    ChromaDB always stores float32 vectors, so this index keeps a 4x smaller
+    copy that can be scanned locally with a single matrix-vector product.
+    Large indexes are first narrowed down by Hamming distance over packed
+    sign bits (32x smaller than float32) before int8 rescoring.
+
+    Every add() rewrites the whole .npz, so a save costs O(N) in the index
+    size. That is fine for the one memory added per observation cycle; bulk
+    loads should pass all their IDs to a single add() call, as the ChromaDB
+    migration does.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.ids: List[str] = []
+        self.embeddings: Optional[np.ndarray] = None
+        self.binary: Optional[np.ndarray] = None
+        self._positions: Dict[str, int] = {}
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, mem_id: str) -> bool:
+        return mem_id in self._positions
+
+    def _load(self):
+        """Load the index from disk (starts empty if missing or unreadable)."""
+        if not self.path.exists():
+            return
+        try:
+            with np.load(self.path) as data:
+                self.ids = [str(i) for i in data['ids']]
+                self.embeddings = data['embeddings'].astype(np.int8, copy=False)
+            self.binary = quantize_binary(self.embeddings)
+            self._positions = {mem_id: pos for pos, mem_id in enumerate(self.ids)}
+            logger.debug(f"Loaded int8 embedding index ({len(self.ids)} entries)")
+        except Exception as e:
+            logger.warning(f"Failed to load int8 embedding index: {e}. Starting empty.")
+            self.ids = []
+            self.embeddings = None
+            self.binary = None
+            self._positions = {}
+
+    def _save(self):
+        """Save the index using atomic write to prevent corruption."""
+        temp_file = self.path.with_suffix('.npz.tmp')
+        try:
+            with open(temp_file, 'wb') as f:
+                np.savez(f, ids=np.array(self.ids), embeddings=self.embeddings)
+            os.replace(temp_file, self.path)
+        except Exception as e:
+            logger.error(f"Error saving int8 embedding index: {e}")
+            if temp_file.exists():
+                try:
+                    temp_file.unlink()
+                except Exception:
+                    pass
+
+    def add(self, ids: Sequence[str], embeddings):
+        """
+        Quantize and store embeddings, replacing any existing rows with the same ID.
+
+        The full index is saved to disk once per call.
+
+        Args:
+            ids: Memory IDs (as strings, matching ChromaDB IDs)
+            embeddings: Float array of shape (len(ids), dim)
+        """
+        if len(ids) == 0:
+            return
+        quantized = quantize_int8(np.asarray(embeddings).reshape(len(ids), -1))
+
+        new_rows = []
+        new_ids = []
+        replaced = []
+        for mem_id, row in zip(ids, quantized):
+            mem_id = str(mem_id)
+            pos = self._positions.get(mem_id)
+            if pos is None:
+                self._positions[mem_id] = len(self.ids) + len(new_ids)
+                new_ids.append(mem_id)
+                new_rows.append(row)
+            elif pos >= len(self.ids):
+                # Repeated within this call; the last embedding wins
+                new_rows[pos - len(self.ids)] = row
+            else:
+                self.embeddings[pos] = row
+                replaced.append(pos)
+
+        # The sign of an int8 component matches the sign of the float it came from,
+        # so only the rows that changed need new binary codes
+        if replaced:
+            self.binary[replaced] = quantize_binary(self.embeddings[replaced])
+        if new_rows:
+            stacked = np.stack(new_rows)
+            stacked_binary = quantize_binary(stacked)
+            if self.embeddings is None:
+                self.embeddings = stacked
+                self.binary = stacked_binary
+            else:
+                self.embeddings = np.vstack([self.embeddings, stacked])
+                self.binary = np.vstack([self.binary, stacked_binary])
+            self.ids.extend(new_ids)
+
+        self._save()
+
+    def clear(self):
+        """Remove every entry and delete the index file."""
+        self.ids = []
+        self.embeddings = None
+        self.binary = None
+        self._positions = {}
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def search(self, query_embedding, top_k: int) -> List[str]:
+        """
+        Find the IDs of the most similar stored embeddings.
+
+        Args:
+            query_embedding: Normalized float query vector
+            top_k: Number of IDs to return
+
+        Returns:
+            Memory IDs ordered from most to least similar
+        """
+        if self.embeddings is None or top_k <= 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+
+        # Coarse prefilter: keep the candidates closest in Hamming distance
+        candidates = np.arange(len(self.ids))
+        if len(self.ids) > BINARY_RESCORE_CANDIDATES:
+            distances = hamming_distances(self.binary, quantize_binary(query))
+            candidates = np.argpartition(distances, BINARY_RESCORE_CANDIDATES - 1)[:BINARY_RESCORE_CANDIDATES]
+
+        # Rescore with int8 embeddings. The quantization scale is a global constant,
+        # so ranking by the raw dot product matches ranking by dequantized cosine similarity
+        scores = self.embeddings[candidates].astype(np.float32) @ query
+
+        k = min(top_k, len(candidates))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [self.ids[i] for i in candidates[top]]
@@ -1,14 +1,31 @@
 """Hybrid memory retrieval using ChromaDB for semantic search and temporal continuity."""
+import heapq
+import importlib.util
 import json
 import logging
+import mmap
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Optional, Set
-from datetime import datetime
+from typing import List, Dict, Optional, Set, Tuple
+
+from ..config import (
+    MEMORY_DIR, EMBEDDING_BACKEND, EMBEDDING_ONNX_FILE, EMBEDDING_THREADS, EMBEDDING_PRECISION
+)
 
 # Disable ChromaDB telemetry before importing
 os.environ['ANONYMIZED_TELEMETRY'] = 'False'
 
+# OpenMP/MKL read their thread counts when torch is first imported
+os.environ.setdefault('OMP_NUM_THREADS', str(EMBEDDING_THREADS))
+os.environ.setdefault('MKL_NUM_THREADS', str(EMBEDDING_THREADS))
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     import chromadb
     try:
@@ -16,21 +33,52 @@ try:
     except ImportError:
         Settings = None  # New API doesn't need Settings
     from sentence_transformers import SentenceTransformer
+    from .quantized_index import QuantizedEmbeddingIndex
     CHROMA_AVAILABLE = True
 except ImportError:
     CHROMA_AVAILABLE = False
     Settings = None
     logging.warning("ChromaDB or sentence-transformers not available. Semantic search will be disabled.")
 
-from ..config import MEMORY_DIR
-
 logger = logging.getLogger(__name__)
 
 MEMORY_FILE = MEMORY_DIR / 'observations.json'
 CHROMA_DB_PATH = MEMORY_DIR / 'chroma_db'
+INT8_INDEX_PATH = MEMORY_DIR / 'embeddings_int8.npz'
 COLLECTION_NAME = "robot_memories"
 EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"  # Lightweight, local embedding model
 
+_MONTHS = (
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+)
+
+
+def _month_from_iso(date_str: str) -> Optional[str]:
+    """Month name from an ISO-8601 date ("2024-01-05..."), without parsing the whole timestamp."""
+    month = date_str[5:7]
+    if date_str[4:5] == '-' and month.isdigit() and 1 <= int(month) <= 12:
+        return _MONTHS[int(month) - 1]
+    return None
+
+
+def _context_query_fields(context_metadata: Dict):
+    """Yield (label, value) pairs for build_context_query, in query order."""
+    if not context_metadata:
+        return
+    
+    weather = context_metadata.get('weather')
+    if isinstance(weather, dict):
+        yield 'weather', weather.get('currently', {}).get('summary', '')
+    elif isinstance(weather, str):
+        yield 'weather', weather
+    
+    yield 'time', context_metadata.get('time_of_day')
+    
+    date_str = context_metadata.get('date')
+    if isinstance(date_str, str):
+        yield 'month', _month_from_iso(date_str)
+
 
 class HybridMemoryRetriever:
     """
@@ -41,17 +89,31 @@ class HybridMemoryRetriever:
     Always falls back to temporal memories if ChromaDB is unavailable.
     """
     
+    # int8 copy of the stored embeddings (None until ChromaDB is initialized)
+    quantized_index = None
+    
+    # torch dtype to autocast encode() to on CPU (None runs the model as loaded)
+    _autocast_dtype = None
+    
+    # Max number of context-query embeddings kept by _embed_context
+    CONTEXT_EMBEDDING_CACHE_SIZE = 64
+    
     def __init__(self, memory_file: Path = MEMORY_FILE):
         self.memory_file = memory_file
         self.chroma_available = False
         self.collection = None
         self.embedding_model = None
+        # Recent context-query embeddings, least recently used first
+        self._context_embeddings = OrderedDict()
         
         if CHROMA_AVAILABLE:
             try:
                 self._initialize_chroma()
                 self.chroma_available = True
                 logger.info("ChromaDB initialized successfully")
+                
+                # Pay the first-encode cost (kernel init, tokenizer, thread pools) off the hot path
+                threading.Thread(target=self._warm_up_embedding_model, daemon=True).start()
             except Exception as e:
                 # Catch all exceptions including PanicException from Rust bindings via pyo3
                 # PanicException is a subclass of Exception, so this will catch it
@@ -92,8 +154,92 @@ class HybridMemoryRetriever:
         
         # Load embedding model
         logger.info(f"Loading embedding model: {EMBEDDING_MODEL_NAME}")
-        self.embedding_model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+        self._configure_torch_threads()
+        self.embedding_model = self._load_embedding_model()
         logger.info("Embedding model loaded successfully")
+        
+        # Compact int8 copy of the embeddings for local similarity search
+        self.quantized_index = QuantizedEmbeddingIndex(INT8_INDEX_PATH)
+    
+    def _configure_torch_threads(self):
+        """
+        Use every core for intra-op parallelism and a single inter-op thread.
+        
+        MiniLM is one sequential graph, so intra-op threads are what speed up encode();
+        the defaults are often misconfigured in containers.
+        """
+        try:
+            import torch
+        except ImportError:
+            return
+        
+        torch.set_num_threads(EMBEDDING_THREADS)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Can only be set once, before any inter-op parallel work has started
+            pass
+        logger.debug(f"torch threads: intra-op={EMBEDDING_THREADS}, inter-op=1")
+    
+    def _load_embedding_model(self):
+        """
+        Load the sentence-transformers model, preferring the ONNX Runtime backend.
+        
+        ONNX Runtime applies graph fusions (and int8 weights when EMBEDDING_ONNX_FILE
+        points at a quantized export), which is several times faster than PyTorch
+        eager mode on CPU. encode() keeps the same signature either way.
+        """
+        onnx_installed = all(
+            importlib.util.find_spec(name) is not None for name in ('onnxruntime', 'optimum')
+        )
+        if EMBEDDING_BACKEND == 'onnx' or (EMBEDDING_BACKEND == 'auto' and onnx_installed):
+            model_kwargs = {'provider': 'CPUExecutionProvider'}
+            if EMBEDDING_ONNX_FILE:
+                model_kwargs['file_name'] = EMBEDDING_ONNX_FILE
+            try:
+                model = SentenceTransformer(EMBEDDING_MODEL_NAME, backend='onnx', model_kwargs=model_kwargs)
+                logger.info("Using ONNX Runtime backend for embeddings")
+                return model
+            except Exception as e:
+                logger.warning(f"Failed to load ONNX embedding backend: {e}. Falling back to PyTorch.")
+        
+        return self._apply_precision(SentenceTransformer(EMBEDDING_MODEL_NAME))
+    
+    def _apply_precision(self, model):
+        """
+        Switch the PyTorch model to EMBEDDING_PRECISION.
+        
+        On CUDA the weights are cast directly; on CPU encode() runs under torch.autocast
+        so bf16/fp16 matmuls are used where the hardware supports them.
+        """
+        if EMBEDDING_PRECISION == 'fp32':
+            return model
+        
+        import torch
+        dtype = torch.float16 if EMBEDDING_PRECISION == 'fp16' else torch.bfloat16
+        if model.device.type == 'cuda':
+            model = model.to(dtype)
+        else:
+            self._autocast_dtype = dtype
+        logger.info(f"Embedding model running in {EMBEDDING_PRECISION} on {model.device.type}")
+        return model
+    
+    def _warm_up_embedding_model(self):
+        """Run a throwaway encode so the first real query hits a warmed-up model."""
+        try:
+            self._encode("warmup", convert_to_numpy=True)
+            logger.debug("Embedding model warmed up")
+        except Exception as e:
+            logger.debug(f"Embedding model warm-up failed: {e}")
+    
+    def _encode(self, sentences, **kwargs):
+        """Encode text with the embedding model at the configured precision."""
+        if self._autocast_dtype is None:
+            return self.embedding_model.encode(sentences, **kwargs)
+        
+        import torch
+        with torch.autocast('cpu', dtype=self._autocast_dtype):
+            return self.embedding_model.encode(sentences, **kwargs)
     
     def get_recent_temporal_memories(self, count: int = 5) -> List[Dict]:
         """
@@ -110,9 +256,8 @@ class HybridMemoryRetriever:
                     return []
                 memories = json.loads(content)
             
-            # Sort by date descending (most recent first)
-            memories.sort(key=lambda m: m.get('date', ''), reverse=True)
-            return memories[:count]
+            # Top-k by date, most recent first (no need to sort the whole list)
+            return heapq.nlargest(count, memories, key=lambda m: m.get('date', ''))
         except Exception as e:
             logger.error(f"Error loading recent temporal memories: {e}")
             return []
@@ -121,37 +266,40 @@ class HybridMemoryRetriever:
         """
         Build semantic query from context metadata (weather, time, etc.).
         """
-        parts = []
-        
-        if context_metadata:
-            # Add weather information if available
-            weather = context_metadata.get('weather')
-            if weather:
-                if isinstance(weather, dict):
-                    # Extract key weather details
-                    conditions = weather.get('currently', {}).get('summary', '')
-                    if conditions:
-                        parts.append(f"weather: {conditions}")
-                elif isinstance(weather, str):
-                    parts.append(f"weather: {weather}")
-            
-            # Add time of day if available
-            time_of_day = context_metadata.get('time_of_day')
-            if time_of_day:
-                parts.append(f"time: {time_of_day}")
-            
-            # Add date/season context
-            date_str = context_metadata.get('date')
-            if date_str:
-                try:
-                    date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                    month = date_obj.strftime('%B')
-                    parts.append(f"month: {month}")
-                except:
-                    pass
-        
+        parts = [f"{key}: {value}" for key, value in _context_query_fields(context_metadata) if value]
         return " ".join(parts) if parts else "recent observations"
     
+    def _semantic_search(self, query_emb, top_k: int) -> Tuple[List[str], List[Dict]]:
+        """
+        Find the stored documents most similar to a query embedding.
+        
+        Scans the int8 index locally when it covers the whole collection,
+        otherwise falls back to a ChromaDB query.
+        
+        Returns:
+            Tuple of (documents, metadatas)
+        """
+        index = self.quantized_index
+        if index is not None and len(index) > 0 and len(index) == self.collection.count():
+            top_ids = index.search(query_emb, top_k)
+            results = self.collection.get(ids=top_ids)
+            documents = results.get('documents') or []
+            metadatas = results.get('metadatas') or [{}] * len(documents)
+            return documents, metadatas
+        
+        # Query ChromaDB
+        results = self.collection.query(
+            query_embeddings=query_emb.reshape(1, -1),
+            n_results=top_k
+        )
+        
+        # Extract results (ChromaDB nests them per query embedding)
+        if results and results.get('documents') and len(results['documents']) > 0:
+            documents = results['documents'][0]
+            metadatas = results['metadatas'][0] if results.get('metadatas') else [{}] * len(documents)
+            return documents, metadatas
+        return [], []
+    
     def get_hybrid_memories(
         self,
         query_text: Optional[str] = None,
@@ -196,25 +344,17 @@ class HybridMemoryRetriever:
         semantic_memories = []
         if self.chroma_available and self.collection and self.embedding_model:
             try:
-                # Build query text if not provided
-                if not query_text and context_metadata:
-                    query_text = self.build_context_query(context_metadata)
-                
+                # Embed the query (built from context metadata if not provided)
+                query_emb = None
                 if query_text:
-                    # Embed the query
-                    query_emb = self.embedding_model.encode(query_text).tolist()
-                    
-                    # Query ChromaDB
-                    results = self.collection.query(
-                        query_embeddings=[query_emb],
-                        n_results=semantic_top_k
-                    )
+                    query_emb = self._encode(query_text, convert_to_numpy=True)
+                elif context_metadata:
+                    query_emb = self._embed_context(context_metadata)
+                
+                if query_emb is not None:
+                    documents, metadatas = self._semantic_search(query_emb, semantic_top_k)
                     
-                    # Extract results
-                    if results and results.get('documents') and len(results['documents']) > 0:
-                        documents = results['documents'][0]
-                        metadatas = results['metadatas'][0] if results.get('metadatas') else [{}] * len(documents)
-                        
+                    if documents:
                         for doc, meta in zip(documents, metadatas):
                             mem_id = meta.get('id')
                             # Try to parse ID as int if it's a string
@@ -246,6 +386,68 @@ class HybridMemoryRetriever:
         
         return all_memories
     
+    def _embed_context(self, context_metadata: Dict):
+        """
+        Embed the context query for this metadata, reusing recent embeddings.
+        
+        The cache is keyed on the raw fields build_context_query uses, so a repeated
+        context (same weather, time of day and month) skips both the string building
+        and the encode.
+        """
+        key = tuple(_context_query_fields(context_metadata))
+        cache = self._context_embeddings
+        try:
+            query_emb = cache.get(key)
+        except TypeError:
+            # Unhashable metadata values; embed without caching
+            return self._encode(self.build_context_query(context_metadata), convert_to_numpy=True)
+        
+        if query_emb is not None:
+            cache.move_to_end(key)
+            return query_emb
+        
+        query_emb = self._encode(self.build_context_query(context_metadata), convert_to_numpy=True)
+        cache[key] = query_emb
+        if len(cache) > self.CONTEXT_EMBEDDING_CACHE_SIZE:
+            cache.popitem(last=False)
+        return query_emb
+    
+    def _existing_chroma_ids(self, mem_ids: List[str]) -> Set[str]:
+        """
+        Find which memories are already stored in ChromaDB, with a single lookup.
+        
+        Placeholder documents (like "Entry X") are deleted so they get re-added.
+        
+        Returns:
+            IDs that have a real document stored
+        """
+        if not mem_ids:
+            return set()
+        
+        existing = self.collection.get(ids=list(dict.fromkeys(mem_ids)), include=['documents'])
+        if not existing or not existing.get('ids'):
+            return set()
+        
+        stored = set()
+        placeholders = []
+        for mem_id, doc in zip(existing['ids'], existing.get('documents') or []):
+            # If it's a placeholder, delete and re-add
+            if doc and doc.strip().startswith("Entry ") and len(doc.strip()) < 20:
+                logger.debug(f"Memory {mem_id} has placeholder text, updating...")
+                placeholders.append(mem_id)
+            else:
+                stored.add(mem_id)
+        if placeholders:
+            self.collection.delete(ids=placeholders)
+        return stored
+    
+    def _needs_chroma_add(self, mem_id: str) -> bool:
+        """Check whether a memory still needs to be added to ChromaDB."""
+        if mem_id in self._existing_chroma_ids([mem_id]):
+            logger.debug(f"Memory {mem_id} already exists in ChromaDB, skipping")
+            return False
+        return True
+    
     def add_memory_to_chroma(self, memory: Dict) -> bool:
         """
         Add a new memory to ChromaDB.
@@ -268,27 +470,12 @@ class HybridMemoryRetriever:
             
             # Check if memory already exists in ChromaDB
             mem_id = str(memory.get('id'))
-            existing = self.collection.get(ids=[mem_id])
-            if existing and existing.get('ids') and len(existing['ids']) > 0:
-                # Check if the existing document is just a placeholder (like "Entry X")
-                existing_docs = existing.get('documents', [])
-                if existing_docs and len(existing_docs) > 0:
-                    existing_doc = existing_docs[0]
-                    # If it's a placeholder, delete and re-add
-                    if existing_doc.strip().startswith("Entry ") and len(existing_doc.strip()) < 20:
-                        logger.debug(f"Memory {mem_id} has placeholder text, updating...")
-                        self.collection.delete(ids=[mem_id])
-                    else:
-                        logger.debug(f"Memory {mem_id} already exists in ChromaDB, skipping")
-                        return True
+            if not self._needs_chroma_add(mem_id):
+                return True
             
-            # Generate embedding
-            emb = self.embedding_model.encode(text)
-            # Convert to list if it's a numpy array
-            if hasattr(emb, 'tolist'):
-                emb = emb.tolist()
-            elif not isinstance(emb, list):
-                emb = list(emb)
+            # Generate embedding as a (1, dim) float32 array - ChromaDB accepts
+            # numpy arrays directly, so there's no need to box every float into a list
+            emb = self._encode(text, convert_to_numpy=True)
             
             # Add to ChromaDB
             self.collection.add(
@@ -298,8 +485,10 @@ class HybridMemoryRetriever:
                     'date': memory.get('date', '')
                 }],
                 ids=[mem_id],
-                embeddings=[emb]
+                embeddings=emb.reshape(1, -1)
             )
+            if self.quantized_index is not None:
+                self.quantized_index.add([mem_id], emb.reshape(1, -1))
             
             logger.debug(f"Added memory {mem_id} to ChromaDB")
             return True
@@ -308,6 +497,25 @@ class HybridMemoryRetriever:
             logger.error(f"Failed to add memory to ChromaDB: {e}")
             return False
     
+    def _load_all_memories(self) -> List[Dict]:
+        """
+        Parse the whole memory file for migration.
+        
+        With orjson the file is memory-mapped and parsed in place instead of being
+        copied into a Python string first.
+        """
+        if self.memory_file.stat().st_size == 0:
+            return []
+        
+        if orjson is None:
+            content = self.memory_file.read_text(encoding='utf-8').strip()
+            return json.loads(content) if content else []
+        
+        with open(self.memory_file, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+    
     def migrate_json_to_chroma(self) -> int:
         """
         Migrate all existing JSON memories to ChromaDB.
@@ -322,16 +530,65 @@ class HybridMemoryRetriever:
             return 0
         
         try:
-            with open(self.memory_file, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                if not content:
-                    return 0
-                memories = json.loads(content)
+            memories = self._load_all_memories()
+            if not memories:
+                return 0
             
+            # Look up every ID at once so stored memories skip the encode entirely
+            existing_ids = self._existing_chroma_ids([str(mem.get('id')) for mem in memories])
+            
+            # Collect everything that still needs embedding, then encode in one batch
             migrated = 0
+            texts = []
+            pending = []
+            pending_ids = set()
+            stored_ids = []
             for mem in memories:
-                if self.add_memory_to_chroma(mem):
+                mem_id = str(mem.get('id'))
+                text = mem.get('llm_summary') or mem.get('summary') or mem.get('content', '')
+                if not text:
+                    logger.warning(f"Memory {mem.get('id')} has no text to embed")
+                    continue
+                if mem_id in existing_ids:
+                    # Already stored in ChromaDB
+                    stored_ids.append(mem_id)
+                    migrated += 1
+                    continue
+                if mem_id in pending_ids:
+                    # Repeated ID - the first entry is the one stored, as with one-by-one adds
+                    logger.debug(f"Memory {mem_id} appears more than once, skipping repeat")
                     migrated += 1
+                    continue
+                pending_ids.add(mem_id)
+                texts.append(text)
+                pending.append(mem)
+            
+            if pending:
+                ids = [str(mem.get('id')) for mem in pending]
+                embeddings = self._encode(texts, convert_to_numpy=True, batch_size=64)
+                try:
+                    self.collection.add(
+                        documents=texts,
+                        metadatas=[{'id': mem.get('id'), 'date': mem.get('date', '')} for mem in pending],
+                        ids=ids,
+                        embeddings=embeddings
+                    )
+                except Exception as e:
+                    # One bad memory fails the whole batch - add them one at a time instead
+                    logger.warning(f"Batched ChromaDB add failed ({e}), adding memories individually")
+                    migrated += sum(1 for mem in pending if self.add_memory_to_chroma(mem))
+                else:
+                    migrated += len(pending)
+                    if self.quantized_index is not None:
+                        self.quantized_index.add(ids, embeddings)
+            
+            # Backfill the int8 index with embeddings ChromaDB already has
+            index = self.quantized_index
+            missing = [mem_id for mem_id in stored_ids if mem_id not in index] if index is not None else []
+            if missing:
+                existing = self.collection.get(ids=missing, include=['embeddings'])
+                if existing.get('ids') and existing.get('embeddings') is not None:
+                    index.add(existing['ids'], existing['embeddings'])
             
             logger.info(f"Migrated {migrated} memories to ChromaDB")
             return migrated
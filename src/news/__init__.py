@@ -7,7 +7,9 @@ from .pulse_client import (
     get_random_cluster,
     get_cluster_headlines,
     get_cluster_articles,
-    get_articles_from_multiple_clusters
+    get_articles_from_multiple_clusters,
+    prefetch_cluster_articles,
+    prefetch_headlines
 )
 
 __all__ = [
@@ -18,6 +20,8 @@ __all__ = [
     'get_random_cluster',
     'get_cluster_headlines',
     'get_cluster_articles',
-    'get_articles_from_multiple_clusters'
+    'get_articles_from_multiple_clusters',
+    'prefetch_cluster_articles',
+    'prefetch_headlines'
 ]
 
@@ -2,34 +2,297 @@
 import requests
 import random
 import logging
-from typing import List, Dict, Optional
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from typing import Any, List, Dict, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..config import PULSE_TIMEOUT_MS
 
 logger = logging.getLogger(__name__)
 
 PULSE_API_BASE = "https://pulse.henzi.org/api"
 
+# Connect slightly above one TCP SYN retransmit window so a dead host fails fast;
+# read leaves room for the JSON body
+_DEFAULT_CONNECT_TIMEOUT = 3.05
+_DEFAULT_READ_TIMEOUT = 7.0
+
+
+def _parse_timeout_ms(value: str) -> Tuple[float, float]:
+    """
+    Parse PULSE_TIMEOUT_MS into a (connect, read) timeout tuple in seconds.
+    
+    Args:
+        value: "connect,read" in milliseconds, or a single read timeout
+        
+    Returns:
+        (connect, read) seconds, falling back to the defaults if invalid
+    """
+    try:
+        parts = [float(part) / 1000 for part in value.split(',')]
+        if len(parts) == 1 and parts[0] > 0:
+            return _DEFAULT_CONNECT_TIMEOUT, parts[0]
+        if len(parts) == 2 and parts[0] > 0 and parts[1] > 0:
+            return parts[0], parts[1]
+    except ValueError:
+        pass
+    logger.warning(f"Invalid PULSE_TIMEOUT_MS '{value}', using defaults")
+    return _DEFAULT_CONNECT_TIMEOUT, _DEFAULT_READ_TIMEOUT
+
+
+_CONNECT_TIMEOUT, _READ_TIMEOUT = _parse_timeout_ms(PULSE_TIMEOUT_MS)
+_TIMEOUT = (_CONNECT_TIMEOUT, _READ_TIMEOUT)
+
+# Callers only use these cluster fields, so ask the API to leave out the rest
+_CLUSTER_LIST_PARAMS = {'fields': 'cluster_id,topic_label'}
+
+# Concurrent cluster fetches (stays below the session's pool_maxsize)
+PREFETCH_MAX_WORKERS = 4
+# Overall wait for a batch of concurrent fetches, covering one retried request
+PREFETCH_TIMEOUT = 4 * (_CONNECT_TIMEOUT + _READ_TIMEOUT)
+
+
+def _build_retry() -> Retry:
+    """
+    Retry policy for transient Pulse failures.
+    
+    Idempotent GETs are retried with exponential backoff (0.5s, 1s, 2s) plus random
+    jitter, so a brief 502/503 or timeout recovers without hammering the API.
+    Callers still fall back to empty results once retries are exhausted.
+    """
+    retry_kwargs = dict(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET'])
+    )
+    try:
+        return Retry(backoff_jitter=0.3, **retry_kwargs)
+    except TypeError:
+        # urllib3 < 2.0 has no backoff_jitter
+        return Retry(**retry_kwargs)
+
+
+def _build_session() -> requests.Session:
+    """
+    Create the shared HTTP session for Pulse API calls.
+    
+    Reusing one session keeps connections alive between requests, so only the
+    first call of a cycle pays for the TCP + TLS handshake.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=_build_retry())
+    session.mount('https://', adapter)
+    session.headers.update({
+        'User-Agent': 'robot-diary',
+        'Accept': 'application/json',
+        'Accept-Encoding': 'gzip'
+    })
+    return session
+
+
+_SESSION = _build_session()
+
+class _Breaker:
+    """
+    Circuit breaker for one Pulse endpoint.
+    
+    CLOSED: requests flow normally. After FAILURE_THRESHOLD consecutive failures it
+    goes OPEN and callers get their empty fallback immediately instead of waiting on
+    timeouts. After RECOVERY_TIMEOUT seconds it goes HALF_OPEN and lets a single
+    probe through: success closes the circuit, failure re-opens it.
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    FAILURE_THRESHOLD = 5
+    RECOVERY_TIMEOUT = 60  # seconds
+    
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        """Return to the closed state."""
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+    
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent now."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.RECOVERY_TIMEOUT:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            # Half-open: let exactly one probe through
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+    
+    def record_success(self):
+        """Record a successful request."""
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info(f"Pulse circuit '{self.name}' closed (API recovered)")
+            self.reset()
+    
+    def record_failure(self):
+        """Record a failed request, opening the circuit if needed."""
+        with self._lock:
+            self.failure_count += 1
+            self._probe_in_flight = False
+            if self.state == self.HALF_OPEN or self.failure_count >= self.FAILURE_THRESHOLD:
+                if self.state != self.OPEN:
+                    logger.warning(f"Pulse circuit '{self.name}' opened after {self.failure_count} failures")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+# One breaker per endpoint, so a broken articles endpoint doesn't block the cluster list
+_BREAKERS: Dict[str, _Breaker] = {
+    'clusters': _Breaker('clusters'),
+    'cluster_articles': _Breaker('cluster_articles'),
+}
+
+# Cluster list and sentiment stats change over minutes/hours, so cache them in-process
+CLUSTERS_CACHE_TTL = 300  # seconds
+SENTIMENT_CACHE_TTL = 60  # seconds
+# A cluster's top articles change slowly; expired entries are revalidated, not refetched
+ARTICLES_CACHE_TTL = 600  # seconds
+
+# key -> (expires_at on the time.monotonic() clock, value)
+_cache: Dict[str, Tuple[float, Any]] = {}
+
+# key -> conditional request headers (If-None-Match / If-Modified-Since) for revalidation
+_validators: Dict[str, Dict[str, str]] = {}
+
+_MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+
+
+def _cache_get(key: str) -> Any:
+    """Return a cached value, or None if missing or expired."""
+    entry = _cache.get(key)
+    if entry is None or time.monotonic() >= entry[0]:
+        return None
+    return entry[1]
+
+
+def _cache_set(key: str, value: Any, ttl: float):
+    """Cache a value with a +/-10% jittered TTL so entries don't all expire together."""
+    _cache[key] = (time.monotonic() + ttl * random.uniform(0.9, 1.1), value)
+
+
+def clear_cache(key: Optional[str] = None):
+    """
+    Invalidate cached Pulse responses.
+    
+    Args:
+        key: Cache key to drop ('clusters', 'sentiment_overview' or
+            'articles:<cluster_id>:<limit>'), or None for all
+    """
+    if key is None:
+        _cache.clear()
+        _validators.clear()
+    else:
+        _cache.pop(key, None)
+        _validators.pop(key, None)
+
+
+def _response_ttl(response, default_ttl: float) -> float:
+    """Use the server's Cache-Control max-age as the TTL when it sends one."""
+    match = _MAX_AGE_RE.search(response.headers.get('Cache-Control') or '')
+    return int(match.group(1)) if match else default_ttl
+
+
+def _remember_validators(key: str, response):
+    """Store the response's ETag / Last-Modified for the next conditional GET."""
+    headers = {}
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    if headers:
+        _validators[key] = headers
+    else:
+        _validators.pop(key, None)
+
+
+def _conditional_headers(key: str) -> Dict[str, str]:
+    """Validator headers for revalidating an expired entry (empty if nothing is cached)."""
+    if key not in _cache:
+        return {}
+    return _validators.get(key, {})
+
 
 def get_clusters_list() -> List[Dict]:
     """
     Fetch list of all available news clusters.
     
+    Cached for CLUSTERS_CACHE_TTL (or the server's max-age); expired entries are
+    revalidated with a conditional GET, so an unchanged list costs no body bytes.
+    
     Returns:
         List of cluster dictionaries with cluster_id, topic_label, etc.
     """
+    cached = _cache_get('clusters')
+    if cached is not None:
+        logger.debug(f"Using cached clusters list ({len(cached)} clusters)")
+        return list(cached)
+    
+    breaker = _BREAKERS['clusters']
+    if not breaker.allow_request():
+        logger.warning("Pulse clusters circuit is open, skipping request")
+        return []
+    
     try:
         url = f"{PULSE_API_BASE}/clusters/"
         logger.info(f"Fetching clusters list from {url}...")
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(
+            url,
+            params=_CLUSTER_LIST_PARAMS,
+            headers=_conditional_headers('clusters'),
+            timeout=_TIMEOUT
+        )
+        
+        if response.status_code == 304 and 'clusters' in _cache:
+            # Not modified: keep the cached list and start a new TTL
+            breaker.record_success()
+            clusters = _cache['clusters'][1]
+            _cache_set('clusters', clusters, _response_ttl(response, CLUSTERS_CACHE_TTL))
+            logger.info(f"✅ Clusters list not modified ({len(clusters)} clusters)")
+            return list(clusters)
+        
         response.raise_for_status()
         
         clusters = response.json()
+        breaker.record_success()
         logger.info(f"✅ Fetched {len(clusters)} clusters")
-        return clusters
+        if clusters:
+            _cache_set('clusters', clusters, _response_ttl(response, CLUSTERS_CACHE_TTL))
+            _remember_validators('clusters', response)
+        return list(clusters)
         
     except requests.exceptions.RequestException as e:
+        breaker.record_failure()
         logger.warning(f"Failed to fetch clusters list: {e}")
         return []
     except Exception as e:
+        breaker.record_failure()
         logger.error(f"Error fetching clusters list: {e}")
         return []
 
@@ -54,6 +317,9 @@ def get_cluster_articles(cluster_id: str, limit: int = 3) -> List[Dict]:
     """
     Fetch articles for a specific cluster with full metadata.
     
+    Cached for ARTICLES_CACHE_TTL (or the server's max-age); expired entries are
+    revalidated with a conditional GET, so unchanged articles cost no body bytes.
+    
     Args:
         cluster_id: Cluster ID (e.g., 'c-1', 'c-22')
         limit: Number of articles to fetch
@@ -61,32 +327,63 @@ def get_cluster_articles(cluster_id: str, limit: int = 3) -> List[Dict]:
     Returns:
         List of article dictionaries with title, published_at, source, sentiment_label, etc.
     """
+    # Callers tag the returned articles in place, so always hand out copies
+    key = f'articles:{cluster_id}:{limit}'
+    cached = _cache_get(key)
+    if cached is not None:
+        logger.debug(f"Using cached articles for {cluster_id} ({len(cached)} articles)")
+        return [dict(article) for article in cached]
+    
+    breaker = _BREAKERS['cluster_articles']
+    if not breaker.allow_request():
+        logger.warning(f"Pulse articles circuit is open, skipping request for {cluster_id}")
+        return []
+    
     try:
         url = f"{PULSE_API_BASE}/clusters/{cluster_id}/articles"
         params = {'limit': limit}
         
         logger.info(f"Fetching articles from cluster {cluster_id}...")
-        response = requests.get(url, params=params, timeout=10)
+        response = _SESSION.get(url, params=params, headers=_conditional_headers(key), timeout=_TIMEOUT)
+        
+        if response.status_code == 304 and key in _cache:
+            # Not modified: keep the cached articles and start a new TTL
+            breaker.record_success()
+            articles = _cache[key][1]
+            _cache_set(key, articles, _response_ttl(response, ARTICLES_CACHE_TTL))
+            logger.info(f"✅ Articles for {cluster_id} not modified ({len(articles)} articles)")
+            return [dict(article) for article in articles]
+        
         response.raise_for_status()
         
         data = response.json()
+        breaker.record_success()
         articles = data.get('articles', [])
         
         if articles:
             logger.info(f"✅ Fetched {len(articles)} articles from {cluster_id}")
+            _cache_set(key, [dict(article) for article in articles], _response_ttl(response, ARTICLES_CACHE_TTL))
+            _remember_validators(key, response)
         else:
             logger.warning(f"No articles found in cluster {cluster_id}")
         
         return articles
         
     except requests.exceptions.RequestException as e:
+        breaker.record_failure()
         logger.warning(f"Failed to fetch articles from {cluster_id}: {e}")
         return []
     except Exception as e:
+        breaker.record_failure()
         logger.error(f"Error fetching articles from {cluster_id}: {e}")
         return []
 
 
+def _titles(articles: List[Dict]) -> List[str]:
+    """Extract non-empty headline titles from article dictionaries."""
+    return [article.get('title', '') for article in articles if article.get('title')]
+
+
 def get_cluster_headlines(cluster_id: str, limit: int = 3) -> List[str]:
     """
     Fetch headlines for a specific cluster (backward compatibility).
@@ -98,8 +395,59 @@ def get_cluster_headlines(cluster_id: str, limit: int = 3) -> List[str]:
     Returns:
         List of headline titles
     """
-    articles = get_cluster_articles(cluster_id, limit)
-    return [article.get('title', '') for article in articles if article.get('title')]
+    return _titles(get_cluster_articles(cluster_id, limit))
+
+
+def prefetch_cluster_articles(cluster_ids: List[str], limit: int = 3) -> Dict[str, List[Dict]]:
+    """
+    Fetch articles for several clusters concurrently.
+    
+    The requests share the pooled session, so N clusters cost roughly one
+    round-trip of wall time instead of N.
+    
+    Args:
+        cluster_ids: Cluster IDs to fetch
+        limit: Number of articles to fetch per cluster
+        
+    Returns:
+        Dictionary mapping each cluster ID to its articles (empty list on failure or timeout)
+    """
+    results: Dict[str, List[Dict]] = {cluster_id: [] for cluster_id in cluster_ids}
+    if not cluster_ids:
+        return results
+    
+    executor = ThreadPoolExecutor(max_workers=min(PREFETCH_MAX_WORKERS, len(cluster_ids)))
+    try:
+        futures = {
+            executor.submit(get_cluster_articles, cluster_id, limit): cluster_id
+            for cluster_id in results
+        }
+        for future in as_completed(futures, timeout=PREFETCH_TIMEOUT):
+            results[futures[future]] = future.result()
+    except FuturesTimeoutError:
+        pending = [cluster_id for cluster_id, articles in results.items() if not articles]
+        logger.warning(f"Timed out prefetching articles for clusters: {', '.join(pending)}")
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    return results
+
+
+def prefetch_headlines(cluster_ids: List[str], limit: int = 3) -> Dict[str, List[str]]:
+    """
+    Fetch headlines for several clusters concurrently.
+    
+    Args:
+        cluster_ids: Cluster IDs to fetch
+        limit: Number of headlines to fetch per cluster
+        
+    Returns:
+        Dictionary mapping each cluster ID to its headline titles
+    """
+    return {
+        cluster_id: _titles(articles)
+        for cluster_id, articles in prefetch_cluster_articles(cluster_ids, limit).items()
+    }
 
 
 def get_random_headlines(count: int = 2) -> List[str]:
@@ -176,12 +524,16 @@ def get_articles_from_multiple_clusters(num_clusters: int = 3, articles_per_clus
     all_articles = []
     cluster_info = []
     
+    # Fetch all selected clusters at once rather than one after another
+    selected_clusters = [cluster for cluster in selected_clusters if cluster.get('cluster_id')]
+    articles_by_cluster = prefetch_cluster_articles(
+        [cluster['cluster_id'] for cluster in selected_clusters],
+        limit=articles_per_cluster
+    )
+    
     for cluster in selected_clusters:
-        cluster_id = cluster.get('cluster_id')
-        if not cluster_id:
-            continue
-        
-        articles = get_cluster_articles(cluster_id, limit=articles_per_cluster)
+        cluster_id = cluster['cluster_id']
+        articles = articles_by_cluster.get(cluster_id, [])
         if articles:
             # Tag each article with its cluster info for reference
             for article in articles:
@@ -206,6 +558,7 @@ class PulseClient:
     
     def __init__(self):
         self.api_base = PULSE_API_BASE
+        self._session = _SESSION
     
     def get_headlines(self, cluster_id: Optional[str] = None, limit: int = 2) -> List[str]:
         """
@@ -221,36 +574,28 @@ class PulseClient:
         if cluster_id is None:
             cluster_id = random.choice(['c-1', 'c-2', 'c-3'])
         
-        try:
-            url = f"{self.api_base}/clusters/{cluster_id}/articles"
-            params = {'limit': limit}
-            
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            articles = data.get('articles', [])
-            headlines = [article.get('title', '') for article in articles if article.get('title')]
-            
-            return headlines
-            
-        except Exception as e:
-            logger.warning(f"Failed to fetch headlines from {cluster_id}: {e}")
-            return []
+        return get_cluster_headlines(cluster_id, limit)
     
     def get_sentiment_overview(self) -> Optional[Dict]:
         """
-        Get overall sentiment statistics from Pulse API.
+        Get overall sentiment statistics from Pulse API (cached for SENTIMENT_CACHE_TTL).
         
         Returns:
             Dictionary with sentiment data, or None if fetch fails
         """
+        cached = _cache_get('sentiment_overview')
+        if cached is not None:
+            return cached
+        
         try:
             url = f"{self.api_base}/stats/overview"
-            response = requests.get(url, timeout=10)
+            response = self._session.get(url, timeout=_TIMEOUT)
             response.raise_for_status()
             
-            return response.json()
+            overview = response.json()
+            if overview:
+                _cache_set('sentiment_overview', overview, SENTIMENT_CACHE_TTL)
+            return overview
             
         except Exception as e:
             logger.warning(f"Failed to fetch sentiment overview: {e}")
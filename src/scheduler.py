@@ -1,12 +1,66 @@
 """Randomized scheduler for time-based observations."""
-from datetime import datetime, time, timedelta
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 import random
-import pytz
 from typing import Optional, Tuple
 
 # Location timezone (from config)
 from .config import LOCATION_TIMEZONE
-LOCATION_TZ = pytz.timezone(LOCATION_TIMEZONE)
+from .tz_cache import get_tz
+LOCATION_TZ = get_tz(LOCATION_TIMEZONE)
+
+# Observation windows in minutes from midnight, precomputed once so the
+# scheduler compares plain ints instead of time objects
+_MORNING_START_MINUTES = 7 * 60 + 30   # 450 (7:30 AM)
+_MORNING_END_MINUTES = 9 * 60 + 30     # 570 (9:30 AM)
+_EVE_START_WEEKDAY_MINUTES = 16 * 60   # 960 (4:00 PM)
+_EVE_START_WEEKEND_MINUTES = 18 * 60   # 1080 (6:00 PM)
+_EVE_END_WEEKDAY_MINUTES = 18 * 60     # 1080 (6:00 PM)
+_EVE_END_WEEKEND_MINUTES = 23 * 60 + 59  # 1439 (11:59 PM)
+
+# (morning_start, morning_end, evening_start, evening_end), indexed by is_weekend
+_DAY_WINDOWS = (
+    (_MORNING_START_MINUTES, _MORNING_END_MINUTES, _EVE_START_WEEKDAY_MINUTES, _EVE_END_WEEKDAY_MINUTES),
+    (_MORNING_START_MINUTES, _MORNING_END_MINUTES, _EVE_START_WEEKEND_MINUTES, _EVE_END_WEEKEND_MINUTES),
+)
+
+
+# English names for the schedule summary (what strftime gives in the C locale)
+_WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_MONTH_NAMES = (
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+)
+
+
+def _time_from_minutes(total_minutes: int) -> time:
+    """Convert minutes from midnight to a time object."""
+    hour, minute = divmod(total_minutes, 60)
+    return time(hour, minute)
+
+
+def _minute_bounds(t: time) -> Tuple[int, int]:
+    """
+    Get the whole minutes from midnight on either side of a time.
+    
+    Returns:
+        Tuple of (floor, ceil) minutes. They are equal when t is on the minute,
+        so t >= m is floor >= m and t <= m is ceil <= m for any whole minute m.
+    """
+    floor = t.hour * 60 + t.minute
+    return floor, floor + (1 if t.second or t.microsecond else 0)
+
+
+@lru_cache(maxsize=32)
+def _local_datetime(target_date: date, target_time: time) -> datetime:
+    """
+    Build an aware LOCATION_TZ datetime for a wall-clock date and time.
+    
+    Memoized on (date, time): only a few hundred wall-clock slots exist per day,
+    and datetimes are immutable, so repeated schedules can share one object.
+    The time is part of the key, so each slot keeps its own DST offset.
+    """
+    return datetime.combine(target_date, target_time, tzinfo=LOCATION_TZ)
 
 
 def get_random_morning_time() -> time:
@@ -17,10 +71,7 @@ def get_random_morning_time() -> time:
         Random time object
     """
     # Random minutes between 7:30 (450 minutes) and 9:30 (570 minutes)
-    total_minutes = random.randint(450, 570)
-    hour = total_minutes // 60
-    minute = total_minutes % 60
-    return time(hour, minute)
+    return _time_from_minutes(random.randint(_MORNING_START_MINUTES, _MORNING_END_MINUTES))
 
 
 def get_random_evening_time(is_weekend: bool) -> Tuple[time, bool]:
@@ -40,16 +91,12 @@ def get_random_evening_time(is_weekend: bool) -> Tuple[time, bool]:
     if is_weekend:
         # Weekend: 6:00 PM (18:00) to 11:59 PM (23:59) - keep evening times on same day
         # For late night (midnight-1:00 AM), we'll handle that separately if needed
-        total_minutes = random.randint(1080, 1439)  # 18:00 to 23:59
-        hour = total_minutes // 60
-        minute = total_minutes % 60
-        return time(hour, minute), False
+        total_minutes = random.randint(_EVE_START_WEEKEND_MINUTES, _EVE_END_WEEKEND_MINUTES)  # 18:00 to 23:59
+        return _time_from_minutes(total_minutes), False
     else:
         # Weekday: 4:00 PM - 6:00 PM (16:00 - 18:00)
-        total_minutes = random.randint(960, 1080)  # 16:00 to 18:00
-        hour = total_minutes // 60
-        minute = total_minutes % 60
-        return time(hour, minute), False
+        total_minutes = random.randint(_EVE_START_WEEKDAY_MINUTES, _EVE_END_WEEKDAY_MINUTES)  # 16:00 to 18:00
+        return _time_from_minutes(total_minutes), False
 
 
 def get_next_observation_time(current_time: datetime, 
@@ -67,7 +114,7 @@ def get_next_observation_time(current_time: datetime,
     """
     current_time_local = current_time.astimezone(LOCATION_TZ)
     current_date = current_time_local.date()
-    current_time_only = current_time_local.time()
+    current_floor, current_ceil = _minute_bounds(current_time_local.time())
     current_weekday = current_time_local.weekday()
     is_weekend = current_weekday >= 5
     
@@ -75,127 +122,88 @@ def get_next_observation_time(current_time: datetime,
     # Morning is 7:30-9:30, so if it's before 9:30, we might need morning
     # If it's after 9:30, we definitely need evening (or next day's morning)
     
-    morning_start = time(7, 30)
-    morning_end = time(9, 30)
-    evening_start_weekday = time(16, 0)
-    evening_start_weekend = time(18, 0)
+    morning_start, morning_end, evening_start, evening_end = _DAY_WINDOWS[is_weekend]
     
     # If we know the last scheduled time, avoid scheduling multiple observations
     # in the same window (e.g., multiple morning runs in one day).
     if last_scheduled_time is not None:
         last_local = last_scheduled_time.astimezone(LOCATION_TZ)
         last_date = last_local.date()
-        last_time_only = last_local.time()
+        last_floor, last_ceil = _minute_bounds(last_local.time())
 
         if last_date == current_date:
             # If we already had a morning observation today and we're still within
             # the morning window, skip scheduling another morning and move on to evening.
-            if morning_start <= last_time_only <= morning_end and morning_start <= current_time_only <= morning_end:
+            if (morning_start <= last_floor and last_ceil <= morning_end
+                    and morning_start <= current_floor and current_ceil <= morning_end):
                 # Force logic to treat this as "after morning window"
-                current_time_only = morning_end
+                current_floor = current_ceil = morning_end
 
             # If we already had an evening observation today, schedule the next
             # observation for tomorrow morning instead of another evening today.
-            evening_end_weekday = time(18, 0)  # 6:00 PM
-            evening_end_weekend = time(23, 59)  # 11:59 PM
-            evening_end = evening_end_weekend if is_weekend else evening_end_weekday
-
-            if is_weekend:
-                evening_start = evening_start_weekend
-            else:
-                evening_start = evening_start_weekday
-
-            if evening_start <= last_time_only <= evening_end:
+            if evening_start <= last_floor and last_ceil <= evening_end:
                 # Force logic to treat this as "after evening window"
-                current_time_only = time(23, 59)
-    
-    # Check if we should schedule morning or evening
-    if current_time_only < morning_end:
-        # It's before 9:30 AM - could be early morning (before 7:30) or between 7:30-9:30
-        # If it's very early (before 7:30), schedule morning for today
-        # If it's between 7:30-9:30, check if we can still schedule morning for today
-        if current_time_only < morning_start:
-            # Very early morning (before 7:30 AM) - schedule morning for today
-            morning_time = get_random_morning_time()
-            next_dt = LOCATION_TZ.localize(datetime.combine(current_date, morning_time))
-            return next_dt, "morning"
-        
-        # It's between 7:30-9:30 AM, try to schedule morning for today if possible
-        # Get a random morning time, but ensure it's after current time
-        morning_time = get_random_morning_time()
-        # If the random time is before or equal to current time, pick a time between
-        # current time and 9:30 AM
-        if morning_time <= current_time_only:
-            # Calculate minutes from midnight for current time and morning end
-            current_minutes = current_time_only.hour * 60 + current_time_only.minute
-            morning_end_minutes = 9 * 60 + 30  # 9:30 AM
-            # Pick a random time between current time and 9:30 AM
-            if current_minutes < morning_end_minutes:
-                random_minutes = random.randint(current_minutes + 1, morning_end_minutes)
-                morning_time = time(random_minutes // 60, random_minutes % 60)
-            else:
-                # Current time is at or after 9:30 (shouldn't happen in this branch, but safety check)
-                next_date = current_date + timedelta(days=1)
-                morning_time = get_random_morning_time()
-                next_dt = LOCATION_TZ.localize(datetime.combine(next_date, morning_time))
-                return next_dt, "morning"
-        
-        next_dt = LOCATION_TZ.localize(datetime.combine(current_date, morning_time))
-        # SAFETY CHECK: Ensure the scheduled time is in the future
-        if next_dt > current_time_local:
-            return next_dt, "morning"
-        
-        # Fallback: schedule tomorrow morning (shouldn't happen, but safety check)
-        next_date = current_date + timedelta(days=1)
-        morning_time = get_random_morning_time()
-        next_dt = LOCATION_TZ.localize(datetime.combine(next_date, morning_time))
-        return next_dt, "morning"
+                current_floor = current_ceil = _EVE_END_WEEKEND_MINUTES
+    
+    # Pick the target date/time for the next window, then build the datetime once
+    tomorrow = current_date + timedelta(days=1)
+    if current_floor < morning_end:
+        # Before 9:30 AM - schedule this morning, at a random minute after now.
+        # current_floor < 570, so the range is never empty.
+        earliest = max(current_floor + 1, morning_start)
+        target_date, obs_type = current_date, "morning"
+        target_time = _time_from_minutes(random.randint(earliest, morning_end))
+    elif current_ceil > evening_end:
+        # After the evening window (weekdays 4:00-6:00 PM, weekends 6:00-11:59 PM),
+        # schedule next morning
+        target_date, target_time, obs_type = tomorrow, get_random_morning_time(), "morning"
     else:
-        # It's past morning time (after 9:30 AM), schedule evening
-        # BUT: if it's after midnight but before 9:30 AM, we should have been in the first branch
-        # This else branch handles times after 9:30 AM
-        
-        # Special case: if it's very late at night (after evening window), schedule next morning
-        # Evening window: weekdays 4:00 PM-6:00 PM, weekends 6:00 PM-11:59 PM
-        evening_end_weekday = time(18, 0)  # 6:00 PM
-        evening_end_weekend = time(23, 59)  # 11:59 PM
-        evening_end = evening_end_weekend if is_weekend else evening_end_weekday
-        
-        # If current time is after the evening window, schedule next morning
-        if current_time_only > evening_end:
-            next_date = current_date + timedelta(days=1)
-            morning_time = get_random_morning_time()
-            next_dt = LOCATION_TZ.localize(datetime.combine(next_date, morning_time))
-            return next_dt, "morning"
-        
-        if is_weekend:
-            evening_time, is_next_day = get_random_evening_time(True)
+        # Pick the evening slot in minutes (same draw as get_random_evening_time)
+        # and only build a time object for the slot that is actually used
+        evening_minutes = random.randint(evening_start, evening_end)
+        if evening_minutes > current_floor:
+            # Evening time is later today
+            target_date, target_time, obs_type = current_date, _time_from_minutes(evening_minutes), "evening"
         else:
-            evening_time, is_next_day = get_random_evening_time(False)
+            # Evening time has passed, schedule next day's morning
+            target_date, target_time, obs_type = tomorrow, get_random_morning_time(), "morning"
+    
+    next_dt = _local_datetime(target_date, target_time)
+    # Safety net: never schedule in the past (tomorrow morning is always in the future)
+    if next_dt <= current_time_local:
+        next_dt = _local_datetime(tomorrow, get_random_morning_time())
+        obs_type = "morning"
+    return next_dt, obs_type
+
+
+def seconds_until_observation(scheduled_time: datetime, current_time: datetime) -> float:
+    """
+    Get the seconds from current_time until a scheduled observation.
+    
+    Aware datetimes are compared as absolute instants, so this is correct across
+    timezones and DST changes. Zero or negative means the observation is due.
+    
+    Args:
+        scheduled_time: Scheduled observation datetime (timezone-aware)
+        current_time: Current datetime (timezone-aware)
         
-        # Check if we can schedule for today or need tomorrow
-        if is_next_day:
-            # Weekend late night - schedule for next day
-            next_date = current_date + timedelta(days=1)
-            next_dt = LOCATION_TZ.localize(datetime.combine(next_date, evening_time))
-            return next_dt, "evening"
-        elif evening_time > current_time_only:
-            # Evening time is later today - can schedule for today
-            next_dt = LOCATION_TZ.localize(datetime.combine(current_date, evening_time))
-            # SAFETY CHECK: Ensure the scheduled time is in the future
-            if next_dt > current_time_local:
-                return next_dt, "evening"
+    Returns:
+        Seconds until the scheduled time (negative once it has passed)
+    """
+    return scheduled_time.timestamp() - current_time.timestamp()
+
+
+def get_observation_type_for_time(current_time: datetime) -> str:
+    """
+    Get the observation type for an unscheduled observation at current_time.
+    
+    Args:
+        current_time: Current datetime (timezone-aware)
         
-        # Evening time has passed or would be in the past, schedule next day's morning
-        next_date = current_date + timedelta(days=1)
-        morning_time = get_random_morning_time()
-        next_dt = LOCATION_TZ.localize(datetime.combine(next_date, morning_time))
-        # FINAL SAFETY CHECK: This should always be in the future, but verify
-        if next_dt <= current_time_local:
-            # This should never happen, but if it does, add another day
-            next_date = next_date + timedelta(days=1)
-            next_dt = LOCATION_TZ.localize(datetime.combine(next_date, morning_time))
-        return next_dt, "morning"
+    Returns:
+        "morning" from 5:00 AM to noon local time, otherwise "evening"
+    """
+    return "morning" if 5 <= current_time.astimezone(LOCATION_TZ).hour < 12 else "evening"
 
 
 def is_time_for_observation(current_time: datetime, 
@@ -215,30 +223,20 @@ def is_time_for_observation(current_time: datetime,
     if scheduled_time is None:
         return False
     
-    current_time_local = current_time.astimezone(LOCATION_TZ)
-    scheduled_time_local = scheduled_time.astimezone(LOCATION_TZ)
-    
-    # CRITICAL: Never trigger if scheduled time is in the past (beyond tolerance)
-    # Only trigger if we're within tolerance_minutes AFTER the scheduled time
-    if scheduled_time_local < current_time_local:
-        # Scheduled time is in the past - check if we're still within tolerance window
-        time_diff = (current_time_local - scheduled_time_local).total_seconds() / 60
-        # Only trigger if we're within tolerance (e.g., scheduled for 2:00, it's 2:03, tolerance is 5)
-        if time_diff <= tolerance_minutes:
-            return True
-        else:
-            # Scheduled time is too far in the past - don't trigger
-            return False
-    
-    # Scheduled time is in the future - check if we're within tolerance before it
-    time_diff = (scheduled_time_local - current_time_local).total_seconds() / 60
-    return time_diff <= tolerance_minutes
+    # Trigger within tolerance before the scheduled time or within tolerance after it
+    # (e.g., scheduled for 2:00, it's 2:03, tolerance is 5) - never once it's further past.
+    return abs(seconds_until_observation(scheduled_time, current_time)) <= tolerance_minutes * 60
 
 
+@lru_cache(maxsize=8)
 def get_observation_schedule_summary(next_time: datetime, obs_type: str) -> str:
     """
     Get a human-readable summary of the next observation.
     
+    Memoized: each scheduled time is summarized for the post, the cycle log and
+    the service loop log. Equal instants always give the same local time, so a
+    hit is correct whatever timezone the datetime was passed in.
+    
     Args:
         next_time: Next observation datetime
         obs_type: Type of observation ("morning" or "evening")
@@ -246,6 +244,12 @@ def get_observation_schedule_summary(next_time: datetime, obs_type: str) -> str:
     Returns:
         Summary string
     """
-    next_time_local = next_time.astimezone(LOCATION_TZ)
-    time_str = next_time_local.strftime('%I:%M %p on %A, %B %d')
+    local = next_time.astimezone(LOCATION_TZ)
+    # Same output as strftime('%I:%M %p on %A, %B %d') without parsing the format
+    hour12 = local.hour % 12 or 12
+    ampm = 'AM' if local.hour < 12 else 'PM'
+    time_str = (
+        f"{hour12:02d}:{local.minute:02d} {ampm} on "
+        f"{_WEEKDAY_NAMES[local.weekday()]}, {_MONTH_NAMES[local.month - 1]} {local.day:02d}"
+    )
     return f"Next {obs_type} observation scheduled for {time_str}"
@@ -5,26 +5,36 @@ Robot Diary Service
 A long-running service that periodically observes New Orleans, Louisiana
 through a live YouTube stream and generates diary entries.
 """
+import atexit
+import json
+import math
+import os
+import queue
 import time
 import signal
 import sys
 import logging
+import logging.handlers
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-import pytz
 import random
+from typing import Dict, List, Optional, Tuple
 
 from .config import (
     OBSERVATION_INTERVAL_HOURS,
     PROJECT_ROOT,
     PIRATE_WEATHER_KEY,
     USE_SCHEDULED_OBSERVATIONS,
+    IMAGES_DIR,
     MEMORY_DIR
 )
 from .scheduler import (
     get_next_observation_time,
-    is_time_for_observation,
-    get_observation_schedule_summary
+    get_observation_schedule_summary,
+    get_observation_type_for_time
 )
 from .camera import fetch_latest_image
 from .llm import GroqClient, generate_dynamic_prompt, create_diary_entry
@@ -33,16 +43,25 @@ from .hugo import HugoGenerator
 from .weather import PirateWeatherClient
 from .news import get_random_headlines, get_random_articles, get_random_cluster, get_cluster_articles, get_articles_from_multiple_clusters
 from .context import get_context_metadata
+from .tz_cache import get_tz
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(PROJECT_ROOT / 'robot_diary.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Configure logging. Records go through a queue and a listener thread writes them to
+# the log file and stdout, so log calls on the observation path never wait on I/O.
+_log_queue = queue.SimpleQueue()
+# The queue handler only merges the arguments into the message; the listener's handlers format it
+logging.basicConfig(level=logging.INFO, format='%(message)s', handlers=[logging.handlers.QueueHandler(_log_queue)])
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    # Not rotated: docker-compose bind-mounts this single file
+    logging.FileHandler(PROJECT_ROOT / 'robot_diary.log'),
+    logging.StreamHandler(sys.stdout)
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+# Flush queued records before the interpreter exits
+atexit.register(_log_listener.stop)
 
 logger = logging.getLogger(__name__)
 
@@ -50,9 +69,86 @@ logger = logging.getLogger(__name__)
 shutdown_requested = False
 trigger_observation = False
 
+# strftime format for article publish dates in news prompts ("December 12, 2025 at 05:33 PM")
+_PUBLISHED_FMT = '%B %d, %Y at %I:%M %p'
+
+# Identity context for news-based prompts (informs perspective, mention when relevant)
+NEWS_IDENTITY_CONTEXT = """You are B3N-T5-MNT, a maintenance robot working in a building in New Orleans, Louisiana. You are an observer of human nature with a unique robotic perspective. Your identity informs your perspective and it should be mentioned when it makes sense or is relevant. Mention it casually when contextually appropriate (e.g., 'as a robot tasked with...'), but don't explain your entire backstory in every entry."""
+
+# News-based prompt scaffold, filled in with str.format: the writing instructions, the
+# generated dynamic prompt, then a reminder of the news items
+NEWS_PROMPT_TEMPLATE = """{identity}
+
+You have picked up transmissions about multiple topics: {topics_summary}. The news items you've intercepted are:
+{articles_block}
+
+Write a diary entry reflecting on these news items. You can focus on:
+- What you find interesting about these topics from your robotic perspective
+- How they relate to your observations of people and human nature
+- Patterns or behaviors you notice in the news that connect to your window observations
+- Reflections on human activities and motivations
+- Connections between the different topics you've intercepted
+- Memory callbacks to specific past observations when relevant
+- Consider the timing of the news - when these events happened relative to your current observation
+
+Be thoughtful, reflective, and write from your unique robotic perspective. Reference your recent memories if relevant.
+
+{optimized_prompt}
+
+Remember: You have picked up transmissions about {topics_summary}. The news items are:
+{articles_block}
+
+Write as if you've intercepted these transmissions and are reflecting on them as an observer of human nature. Consider when these events happened relative to your current observation time. You can write about one topic in depth, or connect multiple topics together. Focus on observation and reflection, not on explaining your identity or backstory. Use memory query tools to check your past observations when relevant."""
+
+# Set by the signal handlers to wake the main loop before its timeout. Handlers run on
+# the main thread and interrupt its Event.wait, so a signal ends the sleep immediately
+# without a wakeup fd or polling.
+wake_event = threading.Event()
+
+# Longest single wait in the main loop. Event.wait uses a monotonic clock, so
+# waking at least hourly keeps the schedule honest across suspends and clock changes.
+MAX_WAIT_SECONDS = 3600
+
+# Hugo build + deploy runs on one worker thread so the service loop doesn't wait on
+# it; a single worker keeps builds serialized
+_publish_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='hugo-publish')
+_pending_publish: Optional[Future] = None
+_publish_lock = threading.Lock()
+
+# Weather and news requests don't depend on the webcam image or on each other, so
+# cycles start them here and let them run while the image downloads
+_fetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='fetch')
+
+# Articles for the optional news in image-based observations. The service refreshes
+# this buffer in the background, so cycles sample from it instead of calling the
+# news API. Refreshing as often as the Pulse article cache expires keeps it current.
+NEWS_BUFFER_SIZE = 20
+NEWS_BUFFER_REFRESH_SECONDS = 600
+_news_buffer: List[Dict] = []
+_news_buffer_lock = threading.Lock()
+
+# When the last news-based observation ran, so the loop spaces them out.
+# Read from disk once, then kept in memory and updated on every save.
+LAST_NEWS_OBSERVATION_FILE = MEMORY_DIR / '.last_news_observation.json'
+_last_news_observation: Optional[datetime] = None
+_last_news_observation_loaded = False
+
+# Scheduled cycles become news-based with this chance, once the last news-based
+# observation is at least NEWS_OBSERVATION_MIN_DAYS old. Instead of rolling the
+# chance every cycle, the loop counts down eligible cycles to the next one.
+NEWS_OBSERVATION_CHANCE = 0.10
+NEWS_OBSERVATION_MIN_DAYS = 3
+_news_countdown: Optional[int] = None
+
+# News-based entries have no webcam image, so their memories and posts use this placeholder
+NEWS_PLACEHOLDER_IMAGE = IMAGES_DIR / 'news_transmission.png'
+
+# Simulation cycles write their markdown here instead of saving to memory or Hugo
+SIMULATIONS_DIR = PROJECT_ROOT / 'simulations'
+
 # Location timezone (from config)
 from . import config as app_config
-LOCATION_TZ = pytz.timezone(app_config.LOCATION_TIMEZONE)
+LOCATION_TZ = get_tz(app_config.LOCATION_TIMEZONE)
 
 
 def signal_handler(signum, frame):
@@ -60,6 +156,7 @@ def signal_handler(signum, frame):
     global shutdown_requested
     logger.info(f"Received signal {signum}, shutting down gracefully...")
     shutdown_requested = True
+    wake_event.set()
 
 
 def trigger_observation_handler(signum, frame):
@@ -67,9 +164,473 @@ def trigger_observation_handler(signum, frame):
     global trigger_observation
     logger.info(f"Received observation trigger signal {signum}")
     trigger_observation = True
+    wake_event.set()
 
 
-def run_news_based_observation(dry_run: bool = False, observation_type: str = None):
+def _group_articles_by_cluster(articles: List[Dict]) -> Dict[str, Dict]:
+    """
+    Group news articles by the cluster they were fetched from.
+    
+    Args:
+        articles: Articles tagged with '_cluster_id' and '_cluster_topic'
+        
+    Returns:
+        Dictionary of cluster_id -> {'cluster_id', 'topic_label', 'articles'}
+    """
+    headlines = [article.get('title', '') for article in articles if article.get('title')]
+    
+    clusters_info = {}
+    for article in articles:
+        cluster_id = article.get('_cluster_id', 'unknown')
+        cluster_topic = article.get('_cluster_topic', 'Unknown Topic')
+        if cluster_id not in clusters_info:
+            clusters_info[cluster_id] = {
+                'cluster_id': cluster_id,
+                'topic_label': cluster_topic,
+                'articles': []
+            }
+        clusters_info[cluster_id]['articles'].append(article)
+    
+    logger.info(f"Fetched {len(articles)} articles from {len(clusters_info)} clusters")
+    for cluster_id, info in clusters_info.items():
+        logger.info(f"   - {cluster_id}: {info['topic_label']} ({len(info['articles'])} articles)")
+    logger.info(f"Headlines: {headlines}")
+    return clusters_info
+
+
+@lru_cache(maxsize=256)
+def _published_suffix(published_at: str) -> str:
+    """
+    Format an article's publish date for a prompt line.
+    
+    Memoized: the same articles come back from the Pulse cache across cycles,
+    so each timestamp is only parsed and formatted once.
+    
+    Args:
+        published_at: ISO timestamp such as "2025-12-12T17:33:20+00:00" (or empty)
+        
+    Returns:
+        " (published <date>)", the raw value if it can't be parsed, or "" if empty
+    """
+    if not published_at:
+        return ""
+    try:
+        dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
+        return f" (published {dt.strftime(_PUBLISHED_FMT)})"
+    except ValueError:
+        return f" (published {published_at})"
+
+
+def _format_articles_by_topic(articles: List[Dict]) -> Tuple[List[str], List[str]]:
+    """
+    Format news articles for a prompt, grouped by topic.
+    
+    Args:
+        articles: Articles tagged with '_cluster_topic'
+        
+    Returns:
+        Tuple of (prompt lines, topic labels in first-seen order)
+    """
+    articles_by_topic = {}
+    for article in articles:
+        articles_by_topic.setdefault(article.get('_cluster_topic', 'Unknown Topic'), []).append(article)
+    
+    articles_text = []
+    topic_labels = []
+    for topic_label, topic_articles in articles_by_topic.items():
+        topic_labels.append(topic_label)
+        articles_text.append(f"\n**{topic_label}:**")
+        for article in topic_articles:
+            source = article.get('source', '')
+            sentiment = article.get('sentiment_label', '')
+            
+            source_str = f" from {source}" if source else ""
+            date_str = _published_suffix(str(article.get('published_at') or ''))
+            sentiment_str = f" [{sentiment}]" if sentiment else ""
+            
+            articles_text.append(f"- {article.get('title', '')}{source_str}{date_str}{sentiment_str}")
+    return articles_text, topic_labels
+
+
+def _build_news_prompt(articles: List[Dict], optimized_prompt: str) -> str:
+    """
+    Build the full prompt for a news-based diary entry.
+    
+    Args:
+        articles: Articles tagged with '_cluster_topic'
+        optimized_prompt: Prompt from generate_dynamic_prompt
+        
+    Returns:
+        NEWS_PROMPT_TEMPLATE filled in with the articles grouped by topic
+    """
+    articles_text, topic_labels = _format_articles_by_topic(articles)
+    topics_summary = ", ".join(topic_labels) if len(topic_labels) > 1 else topic_labels[0] if topic_labels else "various topics"
+    return NEWS_PROMPT_TEMPLATE.format(
+        identity=NEWS_IDENTITY_CONTEXT,
+        topics_summary=topics_summary,
+        articles_block="\n".join(articles_text),
+        optimized_prompt=optimized_prompt
+    )
+
+
+def _days_since_first_observation(first_obs_date: Optional[datetime]) -> int:
+    """Get the number of days since the first stored observation (0 if none)."""
+    if not first_obs_date:
+        logger.info("No previous observations found - this is the first observation")
+        return 0
+    
+    now = datetime.now(LOCATION_TZ)
+    # Ensure first_obs_date is timezone-aware
+    if first_obs_date.tzinfo is None:
+        first_obs_date = first_obs_date.replace(tzinfo=LOCATION_TZ)
+    else:
+        first_obs_date = first_obs_date.astimezone(LOCATION_TZ)
+    days_since_first = (now - first_obs_date).days
+    logger.info(f"Days since first observation: {days_since_first}")
+    return days_since_first
+
+
+_weather_client = None
+
+
+def _fetch_pirate_weather() -> Dict:
+    """Fetch current weather, or an empty dict if the request fails."""
+    global _weather_client
+    try:
+        # One client (and pooled HTTP session) for the life of the process
+        if _weather_client is None:
+            _weather_client = PirateWeatherClient(PIRATE_WEATHER_KEY)
+        return _weather_client.get_current_weather(use_cache=True)
+    except Exception as e:
+        logger.warning(f"Failed to fetch weather: {e}")
+        return {}  # Continue without weather
+
+
+def _no_weather() -> Dict:
+    """Weather fetcher used when no Pirate Weather key is configured."""
+    return {}
+
+
+# The API key is fixed at startup, so pick the weather fetcher once
+_fetch_weather = _fetch_pirate_weather if PIRATE_WEATHER_KEY else _no_weather
+
+
+def _refresh_news_buffer() -> int:
+    """
+    Replace the news buffer with freshly fetched articles.
+    
+    The old buffer is kept if the fetch fails or returns nothing.
+    
+    Returns:
+        Number of articles now in the buffer
+    """
+    global _news_buffer
+    try:
+        fresh = get_random_articles(count=NEWS_BUFFER_SIZE)
+    except Exception as e:
+        logger.warning(f"Failed to refresh news buffer: {e}")
+        fresh = []
+    with _news_buffer_lock:
+        if fresh:
+            _news_buffer = fresh
+        return len(_news_buffer)
+
+
+def _news_buffer_refresh_loop():
+    """Keep the news buffer fresh until shutdown (runs on a daemon thread)."""
+    while not shutdown_requested:
+        count = _refresh_news_buffer()
+        logger.debug(f"News buffer holds {count} articles")
+        time.sleep(NEWS_BUFFER_REFRESH_SECONDS)
+
+
+def start_news_buffer_refresh() -> threading.Thread:
+    """Start refreshing the news buffer in the background."""
+    thread = threading.Thread(target=_news_buffer_refresh_loop, name='news-buffer', daemon=True)
+    thread.start()
+    return thread
+
+
+def _maybe_fetch_news_articles() -> List[Dict]:
+    """
+    Pick two random news articles 40% of the time (empty list otherwise or on error).
+    
+    Articles come from the background news buffer; one-off runs that never filled
+    it fetch two articles directly.
+    """
+    if random.random() >= 0.40:
+        return []
+    with _news_buffer_lock:
+        buffer = _news_buffer
+    try:
+        if buffer:
+            # Copies, so cycles can't modify the shared buffer entries
+            news_articles = [dict(article) for article in random.sample(buffer, min(2, len(buffer)))]
+        else:
+            news_articles = get_random_articles(count=2)
+        if news_articles:
+            # Extract headlines for backward compatibility
+            news_headlines = [article.get('title', '') for article in news_articles if article.get('title')]
+            logger.info(f"Fetched news articles: {news_headlines}")
+        return news_articles
+    except Exception as e:
+        logger.warning(f"Failed to fetch news: {e}")
+        return []
+
+
+def _prepare_cycle_context(memory_manager: MemoryManager, llm_client: GroqClient, weather_future: Future,
+                           observation_type: str = None, is_unscheduled: bool = False,
+                           articles: Optional[List[Dict]] = None, news_future: Optional[Future] = None) -> Dict:
+    """
+    Run the steps shared by every observation cycle (Steps 2-3).
+    
+    Gets memory statistics, waits for the weather, builds the context metadata
+    and generates the dynamic prompt.
+    
+    Args:
+        memory_manager: MemoryManager for the memory statistics
+        llm_client: GroqClient used to generate the prompt
+        weather_future: Pending _fetch_weather() result
+        observation_type: Type of observation ('morning' or 'evening')
+        is_unscheduled: If True, mark the context as an unscheduled observation
+        articles: Cluster-tagged articles for a news-based observation
+        news_future: Pending _maybe_fetch_news_articles() result for an image-based observation
+    
+    Returns:
+        Dictionary with 'memory_count', 'days_since_first', 'weather_data',
+        'context_metadata' and 'optimized_prompt'
+    """
+    # Step 2: Get memory statistics (before loading full memories)
+    logger.info("Step 2: Getting memory statistics...")
+    memory_state = memory_manager.get_memory_state()
+    memory_count = memory_state['total_count']
+    days_since_first = _days_since_first_observation(memory_state['first_observation_date'])
+    
+    # Step 2.5: Fetch weather, news, and context metadata
+    logger.info("Step 2.5: Fetching weather, news, and context metadata...")
+    weather_data = weather_future.result()
+    
+    context_metadata = get_context_metadata(weather_data, observation_type=observation_type)
+    # Mark as unscheduled if this is a manual observation
+    context_metadata['is_unscheduled'] = is_unscheduled
+    if articles is not None:
+        # Add news clusters info to context with full metadata (multiple clusters)
+        context_metadata['news_clusters'] = list(_group_articles_by_cluster(articles).values())
+        context_metadata['news_articles'] = articles  # All articles with cluster tags
+    else:
+        # News articles (fetched 40% of the time to include in prompt)
+        news_articles = news_future.result() if news_future is not None else []
+        # Add news articles to context metadata (full objects with dates, sources, etc.)
+        context_metadata['news_articles'] = news_articles
+        # Also include headlines for backward compatibility
+        context_metadata['news_headlines'] = [article.get('title', '') for article in news_articles if article.get('title')]
+    logger.info(
+        "Context: %s, %s at %s (%s %s, %s observation)",
+        context_metadata['day_of_week'], context_metadata['date'], context_metadata['time'],
+        context_metadata['season'], context_metadata['time_of_day'], context_metadata['observation_type']
+    )
+    if weather_data:
+        logger.info("Weather: %s, %s°F", weather_data.get('summary', 'Unknown'), weather_data.get('temperature', '?'))
+    
+    # Step 2.6: Memory query tools will be available on-demand (no pre-loading)
+    logger.info("Step 2.6: Memory query tools will be available on-demand during diary writing...")
+    
+    # Step 3: Generate dynamic prompt (no memory pre-loading)
+    logger.info("Step 3: Generating dynamic prompt...")
+    # Pass empty list for recent_memory - LLM will query on-demand
+    optimized_prompt = generate_dynamic_prompt([], llm_client,
+                                               context_metadata, weather_data, memory_count, days_since_first)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Optimized prompt: %s...", optimized_prompt[:200])
+    
+    return {
+        'memory_count': memory_count,
+        'days_since_first': days_since_first,
+        'weather_data': weather_data,
+        'context_metadata': context_metadata,
+        'optimized_prompt': optimized_prompt
+    }
+
+
+def _build_and_deploy(hugo_generator: HugoGenerator) -> bool:
+    """
+    Build the Hugo site and deploy it if the build succeeded.
+    
+    Returns:
+        True if the site was built and deployed
+    """
+    logger.info("Step 7: Building Hugo site...")
+    if not hugo_generator.build_site():
+        logger.warning("Skipping deployment due to build failure")
+        return False
+    
+    # Step 8: Deploy site (if enabled and build succeeded)
+    logger.info("Step 8: Deploying site...")
+    return bool(hugo_generator.deploy_site())
+
+
+def _log_publish_failure(future: Future):
+    """Log errors from a background build/deploy (they would otherwise be lost)."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"❌ Background site publish failed: {future.exception()}")
+
+
+def publish_site_in_background(hugo_generator: HugoGenerator) -> Future:
+    """
+    Queue a Hugo build + deploy on the publish worker and return immediately.
+    
+    A build that is still waiting in the queue is cancelled: the new build
+    includes every post written so far, so the older one would be redundant.
+    
+    Args:
+        hugo_generator: HugoGenerator used for the build and deploy
+        
+    Returns:
+        Future for the queued build/deploy
+    """
+    global _pending_publish
+    with _publish_lock:
+        if _pending_publish is not None and _pending_publish.cancel():
+            logger.info("Superseded a queued site build with a newer one")
+        _pending_publish = _publish_executor.submit(_build_and_deploy, hugo_generator)
+        _pending_publish.add_done_callback(_log_publish_failure)
+        logger.info("Steps 7-8: Site build and deploy queued in the background")
+        return _pending_publish
+
+
+def wait_for_publish():
+    """Block until any queued or running site build/deploy has finished."""
+    with _publish_lock:
+        pending = _pending_publish
+    if pending is not None and not pending.done():
+        logger.info("Waiting for the site build/deploy to finish...")
+        try:
+            pending.result()
+        except Exception:
+            pass  # Already logged by _log_publish_failure
+
+
+def get_last_news_observation_date() -> Optional[datetime]:
+    """
+    Get the (naive, local) time of the last news-based observation.
+    
+    Returns:
+        The saved datetime, or None if there hasn't been one
+    """
+    global _last_news_observation, _last_news_observation_loaded
+    if not _last_news_observation_loaded:
+        _last_news_observation_loaded = True
+        try:
+            _last_news_observation = datetime.fromisoformat(
+                json.loads(LAST_NEWS_OBSERVATION_FILE.read_bytes()).get('date', ''))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Failed to read last news observation date: {e}")
+    return _last_news_observation
+
+
+def save_last_news_observation_date():
+    """Save the current time as the last news-based observation (atomic write)."""
+    global _last_news_observation, _last_news_observation_loaded
+    now = datetime.now()
+    temp_file = LAST_NEWS_OBSERVATION_FILE.with_suffix('.json.tmp')
+    try:
+        temp_file.write_text(json.dumps({'date': now.isoformat()}))
+        os.replace(temp_file, LAST_NEWS_OBSERVATION_FILE)
+        logger.debug("Saved last news observation date")
+    except Exception as e:
+        logger.warning(f"Failed to save last news observation date: {e}")
+        if temp_file.exists():
+            try:
+                temp_file.unlink()
+            except Exception:
+                pass
+    # Keep the in-memory copy current even if the write failed
+    _last_news_observation = now
+    _last_news_observation_loaded = True
+
+
+def _draw_news_countdown() -> int:
+    """
+    Draw how many eligible cycles to wait for the next news-based observation.
+    
+    The gap is geometric with p = NEWS_OBSERVATION_CHANCE, which is what rolling
+    the chance on every eligible cycle gives, for one random draw per news event.
+    """
+    return int(math.log(1.0 - random.random()) / math.log(1.0 - NEWS_OBSERVATION_CHANCE)) + 1
+
+
+def _should_run_news_observation(days_since_news: Optional[int]) -> bool:
+    """
+    Decide whether a scheduled cycle should be news-based.
+    
+    Args:
+        days_since_news: Days since the last news-based observation, or None if there hasn't been one
+    
+    Returns:
+        True when the countdown of eligible cycles runs out
+    """
+    global _news_countdown
+    if days_since_news is not None and days_since_news < NEWS_OBSERVATION_MIN_DAYS:
+        return False
+    if _news_countdown is None:
+        _news_countdown = _draw_news_countdown()
+    _news_countdown -= 1
+    if _news_countdown > 0:
+        return False
+    _news_countdown = None
+    return True
+
+
+def _schedule_next_observation(memory_manager: MemoryManager, is_unscheduled: bool = False) -> Tuple[datetime, str, str]:
+    """
+    Work out and save the next scheduled observation once a cycle has finished.
+    
+    Unscheduled observations keep the existing schedule, so nothing is recomputed
+    or written unless no schedule exists yet.
+    
+    Args:
+        memory_manager: MemoryManager holding the saved schedule
+        is_unscheduled: True for manual observations
+    
+    Returns:
+        Tuple of (next_time, observation_type, human-readable summary)
+    """
+    scheduled_info = memory_manager.get_next_scheduled_time()
+    last_scheduled_time = None
+    if scheduled_info and scheduled_info.get('datetime'):
+        try:
+            last_scheduled_time = datetime.fromisoformat(scheduled_info['datetime'])
+        except Exception:
+            last_scheduled_time = None
+    
+    if is_unscheduled and last_scheduled_time is not None:
+        next_obs_type = scheduled_info.get('type', 'evening')
+        next_schedule = get_observation_schedule_summary(last_scheduled_time, next_obs_type)
+        logger.info(f"Unscheduled observation - preserving existing schedule: {next_schedule}")
+        return last_scheduled_time, next_obs_type, next_schedule
+    
+    if is_unscheduled:
+        logger.info("Step 5.5: No existing schedule found, calculating next scheduled observation...")
+        # There is no earlier slot to avoid repeating
+        last_scheduled_time = None
+    else:
+        logger.info("Step 5.5: Calculating next scheduled observation...")
+    
+    # Use the previously scheduled time (if any) so we don't schedule
+    # multiple observations in the same window (e.g., several mornings).
+    next_time, next_obs_type = get_next_observation_time(datetime.now(LOCATION_TZ),
+                                                         last_scheduled_time=last_scheduled_time)
+    memory_manager.save_next_scheduled_time(next_time, next_obs_type)
+    next_schedule = get_observation_schedule_summary(next_time, next_obs_type)
+    logger.info(f"Next scheduled observation: {next_schedule}")
+    return next_time, next_obs_type, next_schedule
+
+
+def run_news_based_observation(dry_run: bool = False, observation_type: str = None,
+                               memory_manager: MemoryManager = None, llm_client: GroqClient = None,
+                               hugo_generator: HugoGenerator = None, background_publish: bool = False):
     """
     Run a news-based observation cycle (text-only, no image).
     
@@ -78,6 +639,13 @@ def run_news_based_observation(dry_run: bool = False, observation_type: str = No
     Args:
         dry_run: If True, skip API calls and only test structure
         observation_type: Type of observation ('morning' or 'evening')
+        memory_manager: Shared MemoryManager (created if not provided)
+        llm_client: Shared GroqClient (created if not provided)
+        hugo_generator: Shared HugoGenerator (created if not provided)
+        background_publish: If True, queue the Hugo build/deploy instead of waiting for it
+    
+    Returns:
+        Tuple of (next_scheduled_time, observation_type), or None for a dry run
     """
     logger.info("=" * 60)
     logger.info("Starting NEWS-BASED observation cycle" + (" (DRY RUN)" if dry_run else ""))
@@ -88,10 +656,16 @@ def run_news_based_observation(dry_run: bool = False, observation_type: str = No
         return
     
     try:
-        # Initialize components
-        memory_manager = MemoryManager()
-        llm_client = GroqClient()
-        hugo_generator = HugoGenerator()
+        # Initialize components (the service loop passes in long-lived ones)
+        if memory_manager is None:
+            memory_manager = MemoryManager()
+        if llm_client is None:
+            llm_client = GroqClient()
+        if hugo_generator is None:
+            hugo_generator = HugoGenerator()
+        
+        # Weather is independent of the news, so fetch it concurrently
+        weather_future = _fetch_executor.submit(_fetch_weather)
         
         # Step 1: Fetch articles from multiple clusters for variety
         logger.info("Step 1: Fetching articles from multiple news clusters...")
@@ -100,143 +674,15 @@ def run_news_based_observation(dry_run: bool = False, observation_type: str = No
         if not articles:
             raise Exception("Failed to fetch articles from news clusters")
         
-        # Extract headlines for logging/display
-        headlines = [article.get('title', '') for article in articles if article.get('title')]
-        
-        # Group articles by cluster for context metadata
-        clusters_info = {}
-        for article in articles:
-            cluster_id = article.get('_cluster_id', 'unknown')
-            cluster_topic = article.get('_cluster_topic', 'Unknown Topic')
-            if cluster_id not in clusters_info:
-                clusters_info[cluster_id] = {
-                    'cluster_id': cluster_id,
-                    'topic_label': cluster_topic,
-                    'articles': []
-                }
-            clusters_info[cluster_id]['articles'].append(article)
-        
-        logger.info(f"Fetched {len(articles)} articles from {len(clusters_info)} clusters")
-        for cluster_id, info in clusters_info.items():
-            logger.info(f"   - {cluster_id}: {info['topic_label']} ({len(info['articles'])} articles)")
-        logger.info(f"Headlines: {headlines}")
-        
-        # Step 2: Get memory statistics (before loading full memories)
-        logger.info("Step 2: Getting memory statistics...")
-        memory_count = memory_manager.get_total_count()
-        
-        # Calculate days since first observation
-        days_since_first = 0
-        first_obs_date = memory_manager.get_first_observation_date()
-        if first_obs_date:
-            now = datetime.now(LOCATION_TZ)
-            # Ensure first_obs_date is timezone-aware
-            if first_obs_date.tzinfo is None:
-                first_obs_date = LOCATION_TZ.localize(first_obs_date)
-            else:
-                first_obs_date = first_obs_date.astimezone(LOCATION_TZ)
-            days_since_first = (now - first_obs_date).days
-            logger.info(f"Days since first observation: {days_since_first}")
-        else:
-            logger.info("No previous observations found - this is the first observation")
-        
-        # Step 2.5: Fetch weather and context metadata
-        logger.info("Step 2.5: Fetching weather and context metadata...")
-        weather_data = {}
-        if PIRATE_WEATHER_KEY:
-            try:
-                weather_client = PirateWeatherClient(PIRATE_WEATHER_KEY)
-                weather_data = weather_client.get_current_weather(use_cache=True)
-            except Exception as e:
-                logger.warning(f"Failed to fetch weather: {e}")
-                weather_data = {}  # Continue without weather
-        
-        context_metadata = get_context_metadata(weather_data, observation_type=observation_type)
-        # Add news clusters info to context with full metadata (multiple clusters)
-        context_metadata['news_clusters'] = list(clusters_info.values())  # List of cluster info dicts
-        context_metadata['news_articles'] = articles  # All articles with cluster tags
-        logger.info(f"Context: {context_metadata['day_of_week']}, {context_metadata['date']} at {context_metadata['time']} ({context_metadata['season']} {context_metadata['time_of_day']}, {context_metadata['observation_type']} observation)")
-        if weather_data:
-            logger.info(f"Weather: {weather_data.get('summary', 'Unknown')}, {weather_data.get('temperature', '?')}°F")
-        
-        # Step 2.6: Memory query tools will be available on-demand (no pre-loading)
-        logger.info("Step 2.6: Memory query tools will be available on-demand during diary writing...")
-        
-        # Step 3: Generate dynamic prompt with news context (no memory pre-loading)
-        logger.info("Step 3: Generating dynamic prompt for news-based observation...")
-        
-        # Create a special prompt for news-based observations
-        # Identity context (informs perspective, mention when relevant)
-        news_identity_context = """You are B3N-T5-MNT, a maintenance robot working in a building in New Orleans, Louisiana. You are an observer of human nature with a unique robotic perspective. Your identity informs your perspective and it should be mentioned when it makes sense or is relevant. Mention it casually when contextually appropriate (e.g., 'as a robot tasked with...'), but don't explain your entire backstory in every entry."""
-
-        # Format articles with dates and sources, grouped by cluster/topic
-        articles_by_topic = {}
-        for article in articles:
-            cluster_topic = article.get('_cluster_topic', 'Unknown Topic')
-            if cluster_topic not in articles_by_topic:
-                articles_by_topic[cluster_topic] = []
-            articles_by_topic[cluster_topic].append(article)
-        
-        # Format articles text grouped by topic
-        articles_text = []
-        topic_labels = []
-        for topic_label, topic_articles in articles_by_topic.items():
-            topic_labels.append(topic_label)
-            articles_text.append(f"\n**{topic_label}:**")
-            for article in topic_articles:
-                title = article.get('title', '')
-                published_at = article.get('published_at', '')
-                source = article.get('source', '')
-                sentiment = article.get('sentiment_label', '')
-                
-                # Format date if available
-                date_str = ""
-                if published_at:
-                    try:
-                        # Parse ISO format: "2025-12-12T17:33:20+00:00"
-                        dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                        date_str = f" (published {dt.strftime('%B %d, %Y at %I:%M %p')})"
-                    except Exception:
-                        date_str = f" (published {published_at})"
-                
-                source_str = f" from {source}" if source else ""
-                sentiment_str = f" [{sentiment}]" if sentiment else ""
-                
-                articles_text.append(f"- {title}{source_str}{date_str}{sentiment_str}")
-        
-        topics_summary = ", ".join(topic_labels) if len(topic_labels) > 1 else topic_labels[0] if topic_labels else "various topics"
-        
-        # Writing instructions for news-based observations
-        news_prompt_base = f"""{news_identity_context}
-
-You have picked up transmissions about multiple topics: {topics_summary}. The news items you've intercepted are:
-{chr(10).join(articles_text)}
-
-Write a diary entry reflecting on these news items. You can focus on:
-- What you find interesting about these topics from your robotic perspective
-- How they relate to your observations of people and human nature
-- Patterns or behaviors you notice in the news that connect to your window observations
-- Reflections on human activities and motivations
-- Connections between the different topics you've intercepted
-- Memory callbacks to specific past observations when relevant
-- Consider the timing of the news - when these events happened relative to your current observation
-
-Be thoughtful, reflective, and write from your unique robotic perspective. Reference your recent memories if relevant."""
+        ctx = _prepare_cycle_context(memory_manager, llm_client, weather_future,
+                                     observation_type=observation_type, articles=articles)
+        context_metadata = ctx['context_metadata']
         
-        # Pass empty list for recent_memory - LLM will query on-demand
-        optimized_prompt = generate_dynamic_prompt([], llm_client, 
-                                                   context_metadata, weather_data, memory_count, days_since_first)
-        # Combine with news-specific context
-        full_prompt = f"""{news_prompt_base}
-
-{optimized_prompt}
-
-Remember: You have picked up transmissions about {topics_summary}. The news items are:
-{chr(10).join(articles_text)}
-
-Write as if you've intercepted these transmissions and are reflecting on them as an observer of human nature. Consider when these events happened relative to your current observation time. You can write about one topic in depth, or connect multiple topics together. Focus on observation and reflection, not on explaining your identity or backstory. Use memory query tools to check your past observations when relevant."""
+        # Combine with the news-specific writing instructions and articles
+        full_prompt = _build_news_prompt(articles, ctx['optimized_prompt'])
         
-        logger.debug(f"News-based prompt: {full_prompt[:200]}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("News-based prompt: %s...", full_prompt[:200])
         
         # Step 4: Create text-only diary entry with memory query tools
         logger.info("Step 4: Creating text-only diary entry from news with on-demand memory queries...")
@@ -245,50 +691,24 @@ Write as if you've intercepted these transmissions and are reflecting on them as
         
         # Step 5: Save to memory (no image path)
         logger.info("Step 5: Saving to memory...")
-        memory_count = memory_manager.get_total_count()
-        observation_id = memory_count + 1
-        # Create a placeholder image path for memory (news-based entries don't have images)
-        placeholder_image = PROJECT_ROOT / 'images' / 'news_transmission.png'
-        memory_manager.add_observation(placeholder_image, diary_entry, image_url=f"news://{cluster_id}", llm_client=llm_client)
+        # News-based entries don't have images, so memory gets the placeholder path
+        observation_id = memory_manager.add_observation(NEWS_PLACEHOLDER_IMAGE, diary_entry, image_url=f"news://{articles[0].get('_cluster_id', 'unknown')}", llm_client=llm_client)
         
         # Step 5.5: Calculate NEXT scheduled observation (after this one completes)
-        logger.info("Step 5.5: Calculating next scheduled observation...")
-        from .scheduler import get_observation_schedule_summary, get_next_observation_time
-        from datetime import datetime as dt
-        now = datetime.now(LOCATION_TZ)
-
-        # Use the previously scheduled time (if any) so we don't schedule
-        # multiple observations in the same window (e.g., several mornings).
-        scheduled_info = memory_manager.get_next_scheduled_time()
-        last_scheduled_time = None
-        if scheduled_info and scheduled_info.get('datetime'):
-            try:
-                last_scheduled_time = dt.fromisoformat(scheduled_info['datetime'])
-            except Exception:
-                last_scheduled_time = None
-
-        next_time, next_obs_type = get_next_observation_time(now, last_scheduled_time=last_scheduled_time)
-        memory_manager.save_next_scheduled_time(next_time, next_obs_type)
-        next_schedule = get_observation_schedule_summary(next_time, next_obs_type)
-        logger.info(f"Next scheduled observation: {next_schedule}")
+        next_time, next_obs_type, next_schedule = _schedule_next_observation(memory_manager)
         
         # Step 6: Generate Hugo post (no image)
         logger.info("Step 6: Generating Hugo post...")
         timezone = context_metadata.get('timezone', 'CST') if context_metadata else 'CST'
         diary_entry_with_schedule = diary_entry + f"\n\n---\n\n*Next scheduled observation: {next_schedule} ({timezone})*"
         
-        post_path = hugo_generator.create_post(diary_entry_with_schedule, placeholder_image, observation_id, context_metadata, is_news_based=True)
-        
-        # Step 7: Build Hugo site
-        logger.info("Step 7: Building Hugo site...")
-        build_success = hugo_generator.build_site()
+        post_path = hugo_generator.create_post(diary_entry_with_schedule, NEWS_PLACEHOLDER_IMAGE, observation_id, context_metadata, is_news_based=True)
         
-        # Step 8: Deploy site (if enabled and build succeeded)
-        if build_success:
-            logger.info("Step 8: Deploying site...")
-            hugo_generator.deploy_site()
+        # Steps 7-8: Build and deploy Hugo site
+        if background_publish:
+            publish_site_in_background(hugo_generator)
         else:
-            logger.warning("Skipping deployment due to build failure")
+            _build_and_deploy(hugo_generator)
         
         logger.info("=" * 60)
         logger.info("✅ News-based observation cycle completed successfully")
@@ -296,21 +716,18 @@ Write as if you've intercepted these transmissions and are reflecting on them as
         
         # Save the date of this news observation (so we don't trigger again immediately)
         # This needs to be done here so it works even when called from fallback or manual triggers
-        try:
-            import json
-            last_news_file = MEMORY_DIR / '.last_news_observation.json'
-            with open(last_news_file, 'w') as f:
-                json.dump({'date': datetime.now().isoformat()}, f)
-            logger.debug("Saved last news observation date")
-        except Exception as e:
-            logger.warning(f"Failed to save last news observation date: {e}")
+        save_last_news_observation_date()
+        
+        return next_time, next_obs_type
         
     except Exception as e:
         logger.error(f"❌ Error in news-based observation cycle: {e}", exc_info=True)
         raise
 
 
-def run_observation_cycle(dry_run: bool = False, force_image_refresh: bool = False, observation_type: str = None, news_only: bool = False, is_unscheduled: bool = False):
+def run_observation_cycle(dry_run: bool = False, force_image_refresh: bool = False, observation_type: str = None, news_only: bool = False, is_unscheduled: bool = False,
+                          memory_manager: MemoryManager = None, llm_client: GroqClient = None,
+                          hugo_generator: HugoGenerator = None, background_publish: bool = False):
     """
     Run a single observation cycle.
     
@@ -319,10 +736,19 @@ def run_observation_cycle(dry_run: bool = False, force_image_refresh: bool = Fal
         force_image_refresh: If True, force download of fresh image even if cached
         observation_type: Type of observation ('morning' or 'evening')
         news_only: If True, skip image fetch and create news-based observation
+        memory_manager: Shared MemoryManager (created if not provided)
+        llm_client: Shared GroqClient (created if not provided)
+        hugo_generator: Shared HugoGenerator (created if not provided)
+        background_publish: If True, queue the Hugo build/deploy instead of waiting for it
+    
+    Returns:
+        Tuple of (next_scheduled_time, observation_type), or None for a dry run
     """
     # If news_only flag is set, run news-based observation
     if news_only:
-        return run_news_based_observation(dry_run=dry_run, observation_type=observation_type)
+        return run_news_based_observation(dry_run=dry_run, observation_type=observation_type,
+                                          memory_manager=memory_manager, llm_client=llm_client,
+                                          hugo_generator=hugo_generator, background_publish=background_publish)
     
     logger.info("=" * 60)
     logger.info("Starting observation cycle" + (" (DRY RUN)" if dry_run else ""))
@@ -333,10 +759,17 @@ def run_observation_cycle(dry_run: bool = False, force_image_refresh: bool = Fal
         return
     
     try:
-        # Initialize components
-        memory_manager = MemoryManager()
-        llm_client = GroqClient()
-        hugo_generator = HugoGenerator()
+        # Initialize components (the service loop passes in long-lived ones)
+        if memory_manager is None:
+            memory_manager = MemoryManager()
+        if llm_client is None:
+            llm_client = GroqClient()
+        if hugo_generator is None:
+            hugo_generator = HugoGenerator()
+        
+        # Weather and news are independent of the image, so fetch them concurrently
+        weather_future = _fetch_executor.submit(_fetch_weather)
+        news_future = _fetch_executor.submit(_maybe_fetch_news_articles)
         
         # Step 1: Fetch latest image (with caching)
         logger.info("Step 1: Fetching latest webcam image...")
@@ -352,123 +785,23 @@ def run_observation_cycle(dry_run: bool = False, force_image_refresh: bool = Fal
             logger.error("Cannot proceed without a live image - observation failed")
             raise Exception(f"Image fetch failed and we require live images: {e}")
         
-        # Step 2: Get memory statistics (before loading full memories)
-        logger.info("Step 2: Getting memory statistics...")
-        memory_count = memory_manager.get_total_count()
-        
-        # Calculate days since first observation
-        days_since_first = 0
-        first_obs_date = memory_manager.get_first_observation_date()
-        if first_obs_date:
-            now = datetime.now(LOCATION_TZ)
-            # Ensure first_obs_date is timezone-aware
-            if first_obs_date.tzinfo is None:
-                first_obs_date = LOCATION_TZ.localize(first_obs_date)
-            else:
-                first_obs_date = first_obs_date.astimezone(LOCATION_TZ)
-            days_since_first = (now - first_obs_date).days
-            logger.info(f"Days since first observation: {days_since_first}")
-        else:
-            logger.info("No previous observations found - this is the first observation")
-        
-        # Step 2.5: Fetch weather, news, and context metadata
-        logger.info("Step 2.5: Fetching weather, news, and context metadata...")
-        weather_data = {}
-        if PIRATE_WEATHER_KEY:
-            try:
-                weather_client = PirateWeatherClient(PIRATE_WEATHER_KEY)
-                weather_data = weather_client.get_current_weather(use_cache=True)
-            except Exception as e:
-                logger.warning(f"Failed to fetch weather: {e}")
-                weather_data = {}  # Continue without weather
-        
-        # Fetch news articles (40% chance to include in prompt)
-        news_articles = []
-        if random.random() < 0.40:  # 40% chance
-            try:
-                news_articles = get_random_articles(count=2)
-                if news_articles:
-                    # Extract headlines for backward compatibility
-                    news_headlines = [article.get('title', '') for article in news_articles if article.get('title')]
-                    logger.info(f"Fetched news articles: {news_headlines}")
-            except Exception as e:
-                logger.warning(f"Failed to fetch news: {e}")
-                news_articles = []
-        
-        context_metadata = get_context_metadata(weather_data, observation_type=observation_type)
-        # Add news articles to context metadata (full objects with dates, sources, etc.)
-        context_metadata['news_articles'] = news_articles
-        # Also include headlines for backward compatibility
-        context_metadata['news_headlines'] = [article.get('title', '') for article in news_articles if article.get('title')]
-        # Mark as unscheduled if this is a manual observation
-        context_metadata['is_unscheduled'] = is_unscheduled
-        logger.info(f"Context: {context_metadata['day_of_week']}, {context_metadata['date']} at {context_metadata['time']} ({context_metadata['season']} {context_metadata['time_of_day']}, {context_metadata['observation_type']} observation)")
-        if weather_data:
-            logger.info(f"Weather: {weather_data.get('summary', 'Unknown')}, {weather_data.get('temperature', '?')}°F")
-        
-        # Step 2.6: Memory query tools will be available on-demand (no pre-loading)
-        logger.info("Step 2.6: Memory query tools will be available on-demand during diary writing...")
-        
-        # Step 3: Generate dynamic prompt (no memory pre-loading)
-        logger.info("Step 3: Generating dynamic prompt...")
-        # Pass empty list for recent_memory - LLM will query on-demand
-        optimized_prompt = generate_dynamic_prompt([], llm_client, 
-                                                   context_metadata, weather_data, memory_count, days_since_first)
-        logger.debug(f"Optimized prompt: {optimized_prompt[:200]}...")
+        ctx = _prepare_cycle_context(memory_manager, llm_client, weather_future, observation_type=observation_type,
+                                     is_unscheduled=is_unscheduled, news_future=news_future)
+        context_metadata = ctx['context_metadata']
         
         # Step 4: Create diary entry with memory query tools
         logger.info("Step 4: Creating diary entry with on-demand memory queries...")
-        diary_entry = create_diary_entry(image_path, optimized_prompt, llm_client, context_metadata, memory_manager=memory_manager)
+        diary_entry = create_diary_entry(image_path, ctx['optimized_prompt'], llm_client, context_metadata, memory_manager=memory_manager)
         logger.info(f"Diary entry created ({len(diary_entry)} characters)")
         
         # Step 5: Save to memory
         logger.info("Step 5: Saving to memory...")
-        # Get observation ID from memory count (will be unique per observation)
-        memory_count = memory_manager.get_total_count()
-        observation_id = memory_count + 1
-        memory_manager.add_observation(image_path, diary_entry, llm_client=llm_client)
+        # add_observation returns the new entry's ID (unique per observation)
+        observation_id = memory_manager.add_observation(image_path, diary_entry, llm_client=llm_client)
         
         # Step 5.5: Calculate NEXT scheduled observation (after this one completes)
         # Only recalculate if this was a scheduled observation - unscheduled observations preserve the existing schedule
-        if not is_unscheduled:
-            logger.info("Step 5.5: Calculating next scheduled observation...")
-            from .scheduler import get_observation_schedule_summary, get_next_observation_time
-            from datetime import datetime as dt
-            now = datetime.now(LOCATION_TZ)
-
-            # Use the previously scheduled time (if any) so we don't schedule
-            # multiple observations in the same window (e.g., several mornings).
-            scheduled_info = memory_manager.get_next_scheduled_time()
-            last_scheduled_time = None
-            if scheduled_info and scheduled_info.get('datetime'):
-                try:
-                    last_scheduled_time = dt.fromisoformat(scheduled_info['datetime'])
-                except Exception:
-                    last_scheduled_time = None
-
-            next_time, next_obs_type = get_next_observation_time(now, last_scheduled_time=last_scheduled_time)
-            memory_manager.save_next_scheduled_time(next_time, next_obs_type)
-            next_schedule = get_observation_schedule_summary(next_time, next_obs_type)
-            logger.info(f"Next scheduled observation: {next_schedule}")
-        else:
-            # For unscheduled observations, preserve the existing schedule
-            scheduled_info = memory_manager.get_next_scheduled_time()
-            if scheduled_info and scheduled_info.get('datetime'):
-                from .scheduler import get_observation_schedule_summary
-                from datetime import datetime as dt
-                next_time = dt.fromisoformat(scheduled_info['datetime'])
-                next_obs_type = scheduled_info.get('type', 'evening')
-                next_schedule = get_observation_schedule_summary(next_time, next_obs_type)
-                logger.info(f"Unscheduled observation - preserving existing schedule: {next_schedule}")
-            else:
-                # No existing schedule, calculate one
-                logger.info("Step 5.5: No existing schedule found, calculating next scheduled observation...")
-                from .scheduler import get_observation_schedule_summary, get_next_observation_time
-                now = datetime.now(LOCATION_TZ)
-                next_time, next_obs_type = get_next_observation_time(now)
-                memory_manager.save_next_scheduled_time(next_time, next_obs_type)
-                next_schedule = get_observation_schedule_summary(next_time, next_obs_type)
-                logger.info(f"Next scheduled observation: {next_schedule}")
+        next_time, next_obs_type, next_schedule = _schedule_next_observation(memory_manager, is_unscheduled=is_unscheduled)
         
         # Step 6: Generate Hugo post
         logger.info("Step 6: Generating Hugo post...")
@@ -477,27 +810,25 @@ def run_observation_cycle(dry_run: bool = False, force_image_refresh: bool = Fal
         
         post_path = hugo_generator.create_post(diary_entry_with_schedule, image_path, observation_id, context_metadata)
         
-        # Step 7: Build Hugo site
-        logger.info("Step 7: Building Hugo site...")
-        build_success = hugo_generator.build_site()
-        
-        # Step 8: Deploy site (if enabled and build succeeded)
-        if build_success:
-            logger.info("Step 8: Deploying site...")
-            hugo_generator.deploy_site()
+        # Steps 7-8: Build and deploy Hugo site
+        if background_publish:
+            publish_site_in_background(hugo_generator)
         else:
-            logger.warning("Skipping deployment due to build failure")
+            _build_and_deploy(hugo_generator)
         
         logger.info("=" * 60)
         logger.info("✅ Observation cycle completed successfully")
         logger.info("=" * 60)
         
+        return next_time, next_obs_type
+        
     except Exception as e:
         logger.error(f"❌ Error in observation cycle: {e}", exc_info=True)
         raise
 
 
-def run_simulation_cycle(force_image_refresh: bool = False, observation_type: str = None, is_unscheduled: bool = False, news_only: bool = False):
+def run_simulation_cycle(force_image_refresh: bool = False, observation_type: str = None, is_unscheduled: bool = False, news_only: bool = False,
+                         memory_manager: MemoryManager = None, llm_client: GroqClient = None):
     """
     Run a simulation observation cycle - generates diary entry and prompt but doesn't save to memory or Hugo.
     
@@ -511,6 +842,8 @@ def run_simulation_cycle(force_image_refresh: bool = False, observation_type: st
         observation_type: Type of observation ('morning' or 'evening')
         is_unscheduled: If True, mark as unscheduled observation
         news_only: If True, create a news-based observation (text-only, no image)
+        memory_manager: Shared MemoryManager (created if not provided)
+        llm_client: Shared GroqClient (created if not provided)
     """
     logger.info("=" * 60)
     if news_only:
@@ -521,13 +854,18 @@ def run_simulation_cycle(force_image_refresh: bool = False, observation_type: st
     
     try:
         # Initialize components (no Hugo generator needed)
-        memory_manager = MemoryManager()
-        llm_client = GroqClient()
+        if memory_manager is None:
+            memory_manager = MemoryManager()
+        if llm_client is None:
+            llm_client = GroqClient()
         
         image_path = None
-        cluster = None
         articles = []
         
+        # Weather (and news for image-based runs) don't depend on Step 1, so fetch them concurrently
+        weather_future = _fetch_executor.submit(_fetch_weather)
+        news_future = None if news_only else _fetch_executor.submit(_maybe_fetch_news_articles)
+        
         if news_only:
             # Step 1: Fetch articles from multiple clusters for variety
             logger.info("Step 1: Fetching articles from multiple news clusters...")
@@ -535,27 +873,6 @@ def run_simulation_cycle(force_image_refresh: bool = False, observation_type: st
             
             if not articles:
                 raise Exception("Failed to fetch articles from news clusters")
-            
-            # Extract headlines for logging/display
-            headlines = [article.get('title', '') for article in articles if article.get('title')]
-            
-            # Group articles by cluster for context metadata
-            clusters_info = {}
-            for article in articles:
-                cluster_id = article.get('_cluster_id', 'unknown')
-                cluster_topic = article.get('_cluster_topic', 'Unknown Topic')
-                if cluster_id not in clusters_info:
-                    clusters_info[cluster_id] = {
-                        'cluster_id': cluster_id,
-                        'topic_label': cluster_topic,
-                        'articles': []
-                    }
-                clusters_info[cluster_id]['articles'].append(article)
-            
-            logger.info(f"Fetched {len(articles)} articles from {len(clusters_info)} clusters")
-            for cluster_id, info in clusters_info.items():
-                logger.info(f"   - {cluster_id}: {info['topic_label']} ({len(info['articles'])} articles)")
-            logger.info(f"Headlines: {headlines}")
         else:
             # Step 1: Fetch latest image (with caching)
             logger.info("Step 1: Fetching latest webcam image...")
@@ -569,144 +886,19 @@ def run_simulation_cycle(force_image_refresh: bool = False, observation_type: st
                 logger.error(f"Failed to fetch new image: {e}")
                 raise Exception("Simulation requires an image - cannot proceed without one")
         
-        # Step 2: Get memory statistics (before loading full memories)
-        logger.info("Step 2: Getting memory statistics...")
-        memory_count = memory_manager.get_total_count()
-        
-        # Calculate days since first observation
-        days_since_first = 0
-        first_obs_date = memory_manager.get_first_observation_date()
-        if first_obs_date:
-            now = datetime.now(LOCATION_TZ)
-            # Ensure first_obs_date is timezone-aware
-            if first_obs_date.tzinfo is None:
-                first_obs_date = LOCATION_TZ.localize(first_obs_date)
-            else:
-                first_obs_date = first_obs_date.astimezone(LOCATION_TZ)
-            days_since_first = (now - first_obs_date).days
-            logger.info(f"Days since first observation: {days_since_first}")
-        else:
-            logger.info("No previous observations found - this is the first observation")
-        
-        # Step 2.5: Fetch weather, news, and context metadata
-        logger.info("Step 2.5: Fetching weather, news, and context metadata...")
-        weather_data = {}
-        if PIRATE_WEATHER_KEY:
-            try:
-                weather_client = PirateWeatherClient(PIRATE_WEATHER_KEY)
-                weather_data = weather_client.get_current_weather(use_cache=True)
-            except Exception as e:
-                logger.warning(f"Failed to fetch weather: {e}")
-                weather_data = {}  # Continue without weather
-        
-        context_metadata = get_context_metadata(weather_data, observation_type=observation_type)
-        # Mark as unscheduled if this is a manual observation
-        context_metadata['is_unscheduled'] = is_unscheduled
-        
-        # Step 2.6: Memory query tools will be available on-demand (no pre-loading)
-        logger.info("Step 2.6: Memory query tools will be available on-demand during diary writing...")
-        
-        if news_only:
-            # For news-only, add clusters info to context (multiple clusters)
-            context_metadata['news_clusters'] = list(clusters_info.values())  # List of cluster info dicts
-            context_metadata['news_articles'] = articles  # All articles with cluster tags
-        else:
-            # Fetch news articles (40% chance to include in prompt) - only for image-based observations
-            news_articles = []
-            if random.random() < 0.40:  # 40% chance
-                try:
-                    news_articles = get_random_articles(count=2)
-                    if news_articles:
-                        # Extract headlines for backward compatibility
-                        news_headlines = [article.get('title', '') for article in news_articles if article.get('title')]
-                        logger.info(f"Fetched news articles: {news_headlines}")
-                except Exception as e:
-                    logger.warning(f"Failed to fetch news: {e}")
-                    news_articles = []
-            
-            # Add news articles to context metadata (full objects with dates, sources, etc.)
-            context_metadata['news_articles'] = news_articles
-            # Also include headlines for backward compatibility
-            context_metadata['news_headlines'] = [article.get('title', '') for article in news_articles if article.get('title')]
-        
-        logger.info(f"Context: {context_metadata['day_of_week']}, {context_metadata['date']} at {context_metadata['time']} ({context_metadata['season']} {context_metadata['time_of_day']}, {context_metadata['observation_type']} observation)")
-        if weather_data:
-            logger.info(f"Weather: {weather_data.get('summary', 'Unknown')}, {weather_data.get('temperature', '?')}°F")
-        
-        # Step 3: Generate dynamic prompt (no memory pre-loading)
-        logger.info("Step 3: Generating dynamic prompt...")
-        # Pass empty list for recent_memory - LLM will query on-demand
-        optimized_prompt = generate_dynamic_prompt([], llm_client, 
-                                                   context_metadata, weather_data, memory_count, days_since_first)
-        logger.debug(f"Optimized prompt: {optimized_prompt[:200]}...")
+        ctx = _prepare_cycle_context(memory_manager, llm_client, weather_future, observation_type=observation_type,
+                                     is_unscheduled=is_unscheduled,
+                                     articles=articles if news_only else None, news_future=news_future)
+        context_metadata = ctx['context_metadata']
+        weather_data = ctx['weather_data']
+        optimized_prompt = ctx['optimized_prompt']
         
         # Step 4: Create diary entry with memory query tools
         logger.info("Step 4: Creating diary entry with on-demand memory queries...")
         if news_only:
-            # Use news-based prompt logic (similar to run_news_based_observation)
-            # Format articles with dates and sources, grouped by cluster/topic
-            articles_by_topic = {}
-            for article in articles:
-                cluster_topic = article.get('_cluster_topic', 'Unknown Topic')
-                if cluster_topic not in articles_by_topic:
-                    articles_by_topic[cluster_topic] = []
-                articles_by_topic[cluster_topic].append(article)
-            
-            # Format articles text grouped by topic
-            articles_text = []
-            topic_labels = []
-            for topic_label, topic_articles in articles_by_topic.items():
-                topic_labels.append(topic_label)
-                articles_text.append(f"\n**{topic_label}:**")
-                for article in topic_articles:
-                    title = article.get('title', '')
-                    published_at = article.get('published_at', '')
-                    source = article.get('source', '')
-                    sentiment = article.get('sentiment_label', '')
-                    
-                    # Format date if available
-                    date_str = ""
-                    if published_at:
-                        try:
-                            dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                            date_str = f" (published {dt.strftime('%B %d, %Y at %I:%M %p')})"
-                        except Exception:
-                            date_str = f" (published {published_at})"
-                    
-                    source_str = f" from {source}" if source else ""
-                    sentiment_str = f" [{sentiment}]" if sentiment else ""
-                    
-                    articles_text.append(f"- {title}{source_str}{date_str}{sentiment_str}")
+            # Same news prompt the service sends for news-based observations
+            full_prompt = _build_news_prompt(articles, optimized_prompt)
             
-            topics_summary = ", ".join(topic_labels) if len(topic_labels) > 1 else topic_labels[0] if topic_labels else "various topics"
-            
-            # Create news-based prompt
-            news_identity_context = """You are B3N-T5-MNT, a maintenance robot working in a building in New Orleans, Louisiana. You are an observer of human nature with a unique robotic perspective. Your identity informs your perspective and it should be mentioned when it makes sense or is relevant. Mention it casually when contextually appropriate (e.g., 'as a robot tasked with...'), but don't explain your entire backstory in every entry."""
-
-            news_prompt_base = f"""{news_identity_context}
-
-You have picked up transmissions about multiple topics: {topics_summary}. The news items you've intercepted are:
-{chr(10).join(articles_text)}
-
-Write a diary entry reflecting on these news items. You can focus on:
-- What you find interesting about these topics from your robotic perspective
-- How they relate to your observations of people and human nature
-- Patterns or behaviors you notice in the news that connect to your window observations
-- Reflections on human activities and motivations
-- Connections between the different topics you've intercepted
-- Consider the timing of the news - when these events happened relative to your current observation
-
-Be thoughtful, reflective, and write from your unique robotic perspective. Use memory query tools to check your past observations when relevant."""
-
-            full_prompt = f"""{news_prompt_base}
-
-{optimized_prompt}
-
-Remember: You have picked up transmissions about {topics_summary}. The news items are:
-{chr(10).join(articles_text)}
-
-Write as if you've intercepted these transmissions and are reflecting on them as an observer of human nature. Consider when these events happened relative to your current observation time. You can write about one topic in depth, or connect multiple topics together. Focus on observation and reflection, not on explaining your identity or backstory."""
-
             diary_entry = llm_client.create_diary_entry_from_text(full_prompt, context_metadata, memory_manager=memory_manager)
             # full_prompt is already set above for news-only
         else:
@@ -720,14 +912,13 @@ Write as if you've intercepted these transmissions and are reflecting on them as
         logger.info("Step 5: Generating simulation markdown file...")
         
         # Create simulations directory
-        simulations_dir = PROJECT_ROOT / 'simulations'
-        simulations_dir.mkdir(exist_ok=True)
+        SIMULATIONS_DIR.mkdir(exist_ok=True)
         
         # Generate filename with timestamp
         now = datetime.now(LOCATION_TZ)
         timestamp = now.strftime('%Y-%m-%d_%H%M%S')
         sim_filename = f"simulation_{timestamp}.md"
-        sim_path = simulations_dir / sim_filename
+        sim_path = SIMULATIONS_DIR / sim_filename
         
         # Format context metadata for display
         context_display = []
@@ -743,53 +934,41 @@ Write as if you've intercepted these transmissions and are reflecting on them as
             context_display.append(f"**Weather:** {summary}, {temp}°F")
         
         if news_only:
-            if clusters_info:
-                cluster_summary = ", ".join([f"{info['cluster_id']}: {info['topic_label']}" for info in clusters_info.values()])
-                context_display.append(f"**News Clusters:** {len(clusters_info)} clusters ({cluster_summary})")
+            clusters = context_metadata['news_clusters']
+            if clusters:
+                cluster_summary = ", ".join([f"{info['cluster_id']}: {info['topic_label']}" for info in clusters])
+                context_display.append(f"**News Clusters:** {len(clusters)} clusters ({cluster_summary})")
                 context_display.append(f"**News Articles:** {len(articles)} articles from multiple topics")
         else:
             if context_metadata.get('news_articles'):
                 context_display.append(f"**News Articles:** {len(context_metadata.get('news_articles', []))} articles included")
         
-        context_display.append(f"**Memory Count:** {memory_count} total observations")
-        context_display.append(f"**Days Since First:** {days_since_first}")
+        context_display.append(f"**Memory Count:** {ctx['memory_count']} total observations")
+        context_display.append(f"**Days Since First:** {ctx['days_since_first']}")
         
         # Get relative image path for markdown (from simulations/ directory) - only if not news-only
         image_rel_path = None
         if not news_only and image_path:
-            # Simulations are in PROJECT_ROOT/simulations/, images are in PROJECT_ROOT/images/
-            # So we need ../images/ relative path
-            try:
-                # Get relative path from PROJECT_ROOT
-                image_rel_to_root = image_path.relative_to(PROJECT_ROOT)
-                # Convert to relative path from simulations/ directory
-                image_rel_path = f"../{image_rel_to_root}"
-            except ValueError:
-                # Path is not relative to PROJECT_ROOT, use relative path assuming images/ directory
-                image_rel_path = f"../images/{image_path.name}"
-        
-        # Write markdown file
-        with open(sim_path, 'w', encoding='utf-8') as f:
-            f.write("# Simulation Observation\n\n")
-            f.write(f"**Generated:** {now.strftime('%Y-%m-%d %H:%M:%S %Z')}\n\n")
-            f.write("## Context\n\n")
-            f.write("\n".join(f"- {item}" for item in context_display))
-            f.write("\n\n")
-            f.write("---\n\n")
-            f.write("## Prompt Sent to LLM\n\n")
-            f.write("```\n")
-            f.write(full_prompt)  # Use full prompt that includes image description
-            f.write("\n```\n\n")
-            f.write("---\n\n")
-            f.write("## Diary Entry\n\n")
-            f.write(diary_entry)
-            f.write("\n\n")
-            
-            # Only include image section if not news-only
-            if not news_only and image_rel_path:
-                f.write("---\n\n")
-                f.write("## Image\n\n")
-                f.write(f"![Observation Image]({image_rel_path})\n\n")
+            # Link relative to the simulations directory (e.g. ../images/foo.jpg), with
+            # forward slashes so the markdown link works on every platform
+            image_rel_path = os.path.relpath(image_path, SIMULATIONS_DIR).replace(os.sep, '/')
+        
+        # Build the markdown in memory and write it in one call
+        context_lines = "\n".join(f"- {item}" for item in context_display)
+        markdown = (
+            "# Simulation Observation\n\n"
+            f"**Generated:** {now.strftime('%Y-%m-%d %H:%M:%S %Z')}\n\n"
+            f"## Context\n\n{context_lines}\n\n"
+            "---\n\n"
+            # Use full prompt that includes image description
+            f"## Prompt Sent to LLM\n\n```\n{full_prompt}\n```\n\n"
+            "---\n\n"
+            f"## Diary Entry\n\n{diary_entry}\n\n"
+        )
+        # Only include image section if not news-only
+        if not news_only and image_rel_path:
+            markdown += f"---\n\n## Image\n\n![Observation Image]({image_rel_path})\n\n"
+        sim_path.write_text(markdown, encoding='utf-8')
         
         logger.info(f"✅ Simulation markdown saved to: {sim_path}")
         logger.info("=" * 60)
@@ -822,29 +1001,15 @@ def main():
     # Initialize memory manager to track schedule
     memory_manager = MemoryManager()
     
-    # Track last news-based observation (for random triggering)
-    last_news_observation_file = MEMORY_DIR / '.last_news_observation.json'
-    
-    def get_last_news_observation_date():
-        """Get the date of the last news-based observation."""
-        if not last_news_observation_file.exists():
-            return None
-        try:
-            import json
-            with open(last_news_observation_file, 'r') as f:
-                data = json.load(f)
-                return datetime.fromisoformat(data.get('date', ''))
-        except:
-            return None
-    
-    def save_last_news_observation_date():
-        """Save the current date as last news observation date."""
-        try:
-            import json
-            with open(last_news_observation_file, 'w') as f:
-                json.dump({'date': datetime.now().isoformat()}, f)
-        except Exception as e:
-            logger.warning(f"Failed to save last news observation date: {e}")
+    # Observation components live as long as the service, so each cycle reuses
+    # the same memory indexes and API client connection pool. The site is published
+    # in the background so the loop can go back to waiting straight away.
+    cycle_kwargs = {
+        'memory_manager': memory_manager,
+        'llm_client': GroqClient(),
+        'hugo_generator': HugoGenerator(),
+        'background_publish': True,
+    }
     
     # Get or calculate next observation time
     now = datetime.now(LOCATION_TZ)
@@ -853,11 +1018,10 @@ def main():
     if scheduled_info and scheduled_info.get('datetime'):
         # Load existing schedule
         try:
-            from datetime import datetime as dt
-            next_time = dt.fromisoformat(scheduled_info['datetime'])
+            next_time = datetime.fromisoformat(scheduled_info['datetime'])
             # Ensure timezone-aware and convert to LOCATION_TZ for proper comparison
             if next_time.tzinfo is None:
-                next_time = LOCATION_TZ.localize(next_time)
+                next_time = next_time.replace(tzinfo=LOCATION_TZ)
             else:
                 # Convert to LOCATION_TZ if it's in a different timezone
                 next_time = next_time.astimezone(LOCATION_TZ)
@@ -882,29 +1046,42 @@ def main():
         memory_manager.save_next_scheduled_time(next_time, obs_type)
         logger.info(f"Next scheduled observation: {get_observation_schedule_summary(next_time, obs_type)}")
     
+    # Keep a buffer of recent articles so cycles don't wait on the news API
+    start_news_buffer_refresh()
+    
     logger.info("Service running. Waiting for scheduled observation time or manual triggers...")
     logger.info("(Send SIGUSR1 signal to trigger immediate observation)")
     
     # Main service loop
+    interval_seconds = OBSERVATION_INTERVAL_HOURS * 3600
+    next_interval_run = time.monotonic() + interval_seconds
     while not shutdown_requested:
         try:
-            # Check every minute for scheduled times or manual triggers
-            time.sleep(60)
+            # Sleep until the next observation is due or a signal wakes us up
+            if USE_SCHEDULED_OBSERVATIONS:
+                # Epoch seconds compare the same instants without building an aware datetime
+                delay = next_time.timestamp() - time.time()
+            else:
+                delay = next_interval_run - time.monotonic()
+            wake_event.wait(timeout=min(max(1, delay), MAX_WAIT_SECONDS))
+            wake_event.clear()
             
             if shutdown_requested:
                 break
             
+            # Read the clock once per wake-up and reuse it for every check below
+            now_epoch = time.time()
+            now = datetime.fromtimestamp(now_epoch, LOCATION_TZ)
+            
             # Check for manual trigger
             if trigger_observation:
                 logger.info("Manual observation triggered!")
                 trigger_observation = False
                 try:
                     # Determine observation type from current time
-                    current_time = datetime.now(LOCATION_TZ)
-                    current_hour = current_time.hour
-                    manual_obs_type = "morning" if 5 <= current_hour < 12 else "evening"
+                    manual_obs_type = get_observation_type_for_time(now)
                     # Pass is_unscheduled=True so the schedule is preserved
-                    run_observation_cycle(observation_type=manual_obs_type, is_unscheduled=True)
+                    run_observation_cycle(observation_type=manual_obs_type, is_unscheduled=True, **cycle_kwargs)
                     
                     # Preserve existing schedule - don't recalculate for manual observations
                     scheduled_info = memory_manager.get_next_scheduled_time()
@@ -920,11 +1097,10 @@ def main():
             
             # Check for scheduled observation
             if USE_SCHEDULED_OBSERVATIONS:
-                now = datetime.now(LOCATION_TZ)
-                
-                # Check if it's time for the scheduled observation
-                if is_time_for_observation(now, next_time, tolerance_minutes=5):
+                # Check if the scheduled observation is due
+                if now_epoch >= next_time.timestamp():
                     logger.info(f"⏰ Scheduled {obs_type} observation time reached!")
+                    next_scheduled = None
                     try:
                         # Check if we should do a news-based observation (10% chance, but only every few days)
                         last_news_date = get_last_news_observation_date()
@@ -932,48 +1108,34 @@ def main():
                         if last_news_date:
                             days_since_news = (now - last_news_date.replace(tzinfo=LOCATION_TZ)).days
                         
-                        use_news_observation = False
-                        # Only consider news-based observations if it's been at least 3 days since last one
-                        if days_since_news is None or days_since_news >= 3:
-                            # Roll 10% chance only if enough time has passed
-                            if random.random() < 0.10:  # 10% chance
-                                use_news_observation = True
-                                logger.info(f"Triggering news-based observation (last one was {days_since_news} days ago, rolled 10% chance)")
-                        
+                        use_news_observation = _should_run_news_observation(days_since_news)
                         if use_news_observation:
-                            run_news_based_observation(observation_type=obs_type)
-                            save_last_news_observation_date()
-                        else:
-                            run_observation_cycle(observation_type=obs_type)
+                            logger.info(f"Triggering news-based observation (last one was {days_since_news} days ago)")
                         
-                        # Read the next scheduled time that was saved by the observation cycle
-                        next_schedule = memory_manager.get_next_scheduled_time()
-                        if next_schedule:
-                            next_time = datetime.fromisoformat(next_schedule['datetime']).astimezone(LOCATION_TZ)
-                            obs_type = next_schedule['type']
-                            logger.info(f"✅ Observation completed. Next scheduled: {get_observation_schedule_summary(next_time, obs_type)}")
-                        else:
-                            # Fallback: calculate if somehow not saved
-                            next_time, obs_type = get_next_observation_time(now)
-                            memory_manager.save_next_scheduled_time(next_time, obs_type)
-                            logger.info(f"✅ Observation completed. Next scheduled: {get_observation_schedule_summary(next_time, obs_type)}")
+                        # The news cycle records the news observation date itself. Either
+                        # cycle returns the next scheduled time it just saved
+                        runner = run_news_based_observation if use_news_observation else run_observation_cycle
+                        next_scheduled = runner(observation_type=obs_type, **cycle_kwargs)
                     except Exception as e:
                         logger.error(f"Scheduled observation failed: {e}", exc_info=True)
-                        # Still schedule next time even if this one failed (since observation cycle didn't complete)
+                    
+                    if next_scheduled:
+                        next_time, obs_type = next_scheduled
+                        next_time = next_time.astimezone(LOCATION_TZ)
+                        logger.info(f"✅ Observation completed. Next scheduled: {get_observation_schedule_summary(next_time, obs_type)}")
+                    else:
+                        # The cycle failed before saving a schedule - still schedule the next one
                         next_time, obs_type = get_next_observation_time(now)
                         memory_manager.save_next_scheduled_time(next_time, obs_type)
                         logger.info(f"✅ Next scheduled (after error): {get_observation_schedule_summary(next_time, obs_type)}")
             else:
                 # Fallback to interval-based (legacy mode)
-                interval_seconds = OBSERVATION_INTERVAL_HOURS * 3600
-                logger.warning("Interval-based mode is deprecated. Use scheduled observations instead.")
-                time.sleep(interval_seconds - 60)  # Already slept 60 seconds
-                if not shutdown_requested:
+                if time.monotonic() >= next_interval_run:
+                    logger.warning("Interval-based mode is deprecated. Use scheduled observations instead.")
+                    next_interval_run = time.monotonic() + interval_seconds
                     try:
-                        current_time = datetime.now(LOCATION_TZ)
-                        current_hour = current_time.hour
-                        interval_obs_type = "morning" if 5 <= current_hour < 12 else "evening"
-                        run_observation_cycle(observation_type=interval_obs_type)
+                        interval_obs_type = get_observation_type_for_time(now)
+                        run_observation_cycle(observation_type=interval_obs_type, **cycle_kwargs)
                     except Exception as e:
                         logger.error(f"Interval observation failed: {e}", exc_info=True)
             
@@ -983,8 +1145,11 @@ def main():
         except Exception as e:
             logger.error(f"Error in service loop: {e}", exc_info=True)
             logger.info("Continuing service...")
-            time.sleep(60)  # Wait a minute before retrying
+            wake_event.wait(timeout=60)  # Wait a minute before retrying
+            wake_event.clear()
     
+    # Let the last build/deploy finish so a published post isn't left half-deployed
+    wait_for_publish()
     logger.info("🤖 Robot Diary Service Stopped")
 
 
@@ -0,0 +1,19 @@
+"""Process-wide cache of timezone objects."""
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+
+@lru_cache(maxsize=8)
+def get_tz(name: str) -> ZoneInfo:
+    """
+    Get the timezone object for an IANA zone name.
+    
+    The zone file is read once per name; later calls return the same object.
+    
+    Args:
+        name: IANA timezone name (e.g., 'America/Chicago')
+        
+    Returns:
+        ZoneInfo for the zone
+    """
+    return ZoneInfo(name)
@@ -1,13 +1,23 @@
 """Pirate Weather API client for fetching weather data."""
 import requests
 import json
+from bisect import bisect_right
+import os
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..config import PROJECT_ROOT
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Location coordinates (will be imported from config)
@@ -16,6 +26,79 @@ logger = logging.getLogger(__name__)
 WEATHER_CACHE_FILE = PROJECT_ROOT / 'weather' / '.weather_cache.json'
 WEATHER_CACHE_TTL_MINUTES = 30
 
+# Weather extracted from the cache file, keyed by the file's (inode, mtime, size), so
+# the JSON is only parsed again when the file changes on disk
+_parsed_cache: Optional[Tuple[tuple, Dict]] = None
+
+
+def _build_session() -> requests.Session:
+    """
+    Create the shared HTTP session for Pirate Weather calls.
+    
+    One host and at most one request at a time, so a tiny pool is enough; keeping
+    the connection alive saves the TCP + TLS handshake on later fetches. Transient
+    errors are retried twice with a short backoff (0.3s, 0.6s) - the fetch runs
+    while the webcam image downloads, so a retry rarely delays a cycle.
+    """
+    retry = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET'])
+    )
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=retry))
+    session.headers.update({'User-Agent': 'robot-diary', 'Accept': 'application/json'})
+    return session
+
+
+_SESSION = _build_session()
+
+# Cloud-cover descriptions, split at these fractions (each bound belongs to the cloudier label)
+_CLOUD_COVER_BOUNDS = (0.25, 0.5, 0.75)
+_CLOUD_COVER_LABELS = ("Mostly clear", "Partly cloudy", "Mostly cloudy", "Overcast")
+
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when it's installed."""
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def _extract_weather(data: Dict, fetched_at: datetime) -> Dict:
+    """
+    Pick the current conditions the prompt uses out of a Pirate Weather response.
+    
+    Args:
+        data: Parsed forecast response
+        fetched_at: When the response was fetched
+        
+    Returns:
+        Dictionary with current weather data
+    """
+    currently = data.get('currently', {})
+    return {
+        'temperature': currently.get('temperature'),
+        'apparent_temperature': currently.get('apparentTemperature'),
+        'summary': currently.get('summary', 'Unknown'),
+        'icon': currently.get('icon', 'unknown'),
+        'wind_speed': currently.get('windSpeed', 0),
+        'wind_gust': currently.get('windGust'),
+        'wind_bearing': currently.get('windBearing'),
+        'humidity': currently.get('humidity', 0),
+        'pressure': currently.get('pressure'),
+        'cloud_cover': currently.get('cloudCover', 0),
+        'visibility': currently.get('visibility', 10),
+        'uv_index': currently.get('uvIndex', 0),
+        'dew_point': currently.get('dewPoint'),
+        'precip_intensity': currently.get('precipIntensity', 0),
+        'precip_probability': currently.get('precipProbability', 0),
+        'precip_type': currently.get('precipType'),
+        'timezone': data.get('timezone', 'America/New_York'),
+        'fetched_at': fetched_at.isoformat()
+    }
+
 
 class PirateWeatherClient:
     """Client for Pirate Weather API."""
@@ -23,43 +106,68 @@ class PirateWeatherClient:
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.base_url = "https://api.pirateweather.net"
+        self._session = _SESSION
         WEATHER_CACHE_FILE.parent.mkdir(exist_ok=True)
     
     def _load_cache(self) -> Optional[Dict]:
-        """Load cached weather data."""
-        if not WEATHER_CACHE_FILE.exists():
+        """
+        Load cached weather data.
+        
+        The cache file is the raw API response; its modification time is when it
+        was fetched.
+        """
+        global _parsed_cache
+        try:
+            st = WEATHER_CACHE_FILE.stat()
+        except OSError:
+            return None
+        
+        # Check if cache is still valid before reading it - an expired file is never parsed
+        age = time.time() - st.st_mtime
+        if age >= WEATHER_CACHE_TTL_MINUTES * 60:
+            logger.info(f"Cache expired (age: {timedelta(seconds=int(age))})")
             return None
         
+        signature = (str(WEATHER_CACHE_FILE), st.st_ino, st.st_mtime_ns, st.st_size)
         try:
-            with open(WEATHER_CACHE_FILE, 'r') as f:
-                cache = json.load(f)
-            
-            # Check if cache is still valid
-            cached_time = datetime.fromisoformat(cache.get('cached_at', ''))
-            age = datetime.now() - cached_time
-            
-            if age < timedelta(minutes=WEATHER_CACHE_TTL_MINUTES):
-                logger.info(f"Using cached weather data (age: {age})")
-                return cache.get('data')
+            if _parsed_cache is not None and _parsed_cache[0] == signature:
+                weather_data = _parsed_cache[1]
             else:
-                logger.info(f"Cache expired (age: {age})")
-                return None
-                
-        except Exception as e:
+                data = _json_loads(WEATHER_CACHE_FILE.read_bytes())
+                if 'currently' not in data:
+                    raise ValueError("not a Pirate Weather response")
+                weather_data = _extract_weather(data, datetime.fromtimestamp(st.st_mtime))
+                _parsed_cache = (signature, weather_data)
+        except (OSError, ValueError, TypeError) as e:
             logger.warning(f"Error loading weather cache: {e}")
             return None
+        
+        logger.info(f"Using cached weather data (age: {timedelta(seconds=int(age))})")
+        return weather_data
     
-    def _save_cache(self, data: dict):
-        """Save weather data to cache."""
+    def _save_cache(self, raw: bytes, weather_data: Dict):
+        """
+        Save the raw API response to cache using atomic write.
+        
+        Args:
+            raw: Response body as received from the API
+            weather_data: Weather already extracted from it, kept so the next load
+                doesn't parse the file again
+        """
+        global _parsed_cache
+        temp_file = WEATHER_CACHE_FILE.with_suffix('.json.tmp')
         try:
-            cache = {
-                'cached_at': datetime.now().isoformat(),
-                'data': data
-            }
-            with open(WEATHER_CACHE_FILE, 'w') as f:
-                json.dump(cache, f, indent=2)
+            temp_file.write_bytes(raw)
+            os.replace(temp_file, WEATHER_CACHE_FILE)
+            st = WEATHER_CACHE_FILE.stat()
+            _parsed_cache = ((str(WEATHER_CACHE_FILE), st.st_ino, st.st_mtime_ns, st.st_size), weather_data)
         except Exception as e:
             logger.error(f"Error saving weather cache: {e}")
+            if temp_file.exists():
+                try:
+                    temp_file.unlink()
+                except Exception:
+                    pass
     
     def get_current_weather(self, use_cache: bool = True) -> dict:
         """
@@ -88,37 +196,13 @@ class PirateWeatherClient:
         }
         
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self._session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
-            
-            # Extract current conditions
-            currently = data.get('currently', {})
+            data = _json_loads(response.content)
+            weather_data = _extract_weather(data, datetime.now())
             
-            # Format weather data for prompt
-            weather_data = {
-                'temperature': currently.get('temperature'),
-                'apparent_temperature': currently.get('apparentTemperature'),
-                'summary': currently.get('summary', 'Unknown'),
-                'icon': currently.get('icon', 'unknown'),
-                'wind_speed': currently.get('windSpeed', 0),
-                'wind_gust': currently.get('windGust'),
-                'wind_bearing': currently.get('windBearing'),
-                'humidity': currently.get('humidity', 0),
-                'pressure': currently.get('pressure'),
-                'cloud_cover': currently.get('cloudCover', 0),
-                'visibility': currently.get('visibility', 10),
-                'uv_index': currently.get('uvIndex', 0),
-                'dew_point': currently.get('dewPoint'),
-                'precip_intensity': currently.get('precipIntensity', 0),
-                'precip_probability': currently.get('precipProbability', 0),
-                'precip_type': currently.get('precipType'),
-                'timezone': data.get('timezone', 'America/New_York'),
-                'fetched_at': datetime.now().isoformat()
-            }
-            
-            # Cache the data
-            self._save_cache(weather_data)
+            # Cache the response body as received - no need to serialize it again
+            self._save_cache(response.content, weather_data)
             
             logger.info(f"✅ Weather fetched: {weather_data['summary']}, {weather_data['temperature']}°F")
             return weather_data
@@ -145,11 +229,12 @@ class PirateWeatherClient:
         if not weather_data:
             return "Weather data unavailable."
         
+        get = weather_data.get
         parts = []
         
         # Temperature
-        temp = weather_data.get('temperature')
-        feels_like = weather_data.get('apparent_temperature')
+        temp = get('temperature')
+        feels_like = get('apparent_temperature')
         if temp:
             if feels_like and abs(temp - feels_like) > 2:
                 parts.append(f"{temp}°F (feels like {feels_like}°F)")
@@ -157,44 +242,33 @@ class PirateWeatherClient:
                 parts.append(f"{temp}°F")
         
         # Summary/conditions
-        summary = weather_data.get('summary', '')
+        summary = get('summary', '')
         if summary:
             parts.append(summary)
         
         # Wind
-        wind_speed = weather_data.get('wind_speed', 0)
-        wind_gust = weather_data.get('wind_gust')
+        wind_speed = get('wind_speed', 0)
         if wind_speed:
-            wind_desc = f"{wind_speed} mph"
+            wind_gust = get('wind_gust')
             if wind_gust and wind_gust > wind_speed * 1.5:
-                wind_desc += f" (gusts up to {wind_gust} mph)"
-            parts.append(f"Wind: {wind_desc}")
+                parts.append(f"Wind: {wind_speed} mph (gusts up to {wind_gust} mph)")
+            else:
+                parts.append(f"Wind: {wind_speed} mph")
         
         # Precipitation
-        precip_prob = weather_data.get('precip_probability', 0)
-        precip_type = weather_data.get('precip_type')
+        precip_prob = get('precip_probability', 0)
         if precip_prob > 0:
-            if precip_type:
-                parts.append(f"{precip_prob * 100:.0f}% chance of {precip_type}")
-            else:
-                parts.append(f"{precip_prob * 100:.0f}% chance of precipitation")
+            parts.append(f"{precip_prob * 100:.0f}% chance of {get('precip_type') or 'precipitation'}")
         
         # Humidity
-        humidity = weather_data.get('humidity', 0)
+        humidity = get('humidity', 0)
         if humidity:
             parts.append(f"Humidity: {humidity * 100:.0f}%")
         
         # Cloud cover
-        cloud_cover = weather_data.get('cloud_cover', 0)
+        cloud_cover = get('cloud_cover', 0)
         if cloud_cover is not None:
-            if cloud_cover < 0.25:
-                parts.append("Mostly clear")
-            elif cloud_cover < 0.5:
-                parts.append("Partly cloudy")
-            elif cloud_cover < 0.75:
-                parts.append("Mostly cloudy")
-            else:
-                parts.append("Overcast")
+            parts.append(_CLOUD_COVER_LABELS[bisect_right(_CLOUD_COVER_BOUNDS, cloud_cover)])
         
         return ", ".join(parts) if parts else "Weather conditions unknown."
 
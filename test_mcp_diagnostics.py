@@ -10,7 +10,11 @@ This script will:
 5. Test adding a memory
 6. Show detailed diagnostics
 """
+import io
 import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src to path
@@ -29,6 +33,37 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class _ThreadOutput:
+    """sys.stdout stand-in that sends a worker thread's prints to that thread's own buffer."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def write(self, text):
+        return getattr(self._local, 'buffer', self._stream).write(text)
+    
+    def flush(self):
+        getattr(self._local, 'buffer', self._stream).flush()
+
+
+def _run_captured(output, test, retriever):
+    """
+    Run one diagnostic test in a worker thread and return what it printed.
+    
+    An exception escaping the test is appended to its output as a traceback, so
+    one failing test doesn't discard the buffered output of the others.
+    """
+    buffer = output._local.buffer = io.StringIO()
+    try:
+        test(retriever)
+    except Exception:
+        buffer.write(traceback.format_exc())
+    finally:
+        del output._local.buffer
+    return buffer.getvalue()
+
+
 def print_section(title):
     """Print a section header."""
     print("\n" + "=" * 60)
@@ -283,17 +318,25 @@ def main():
     # Test 2: Initialize
     retriever = test_retriever_initialization()
     
-    # Test 3: Temporal memories
-    test_temporal_memories(retriever)
-    
-    # Test 4: ChromaDB contents
-    test_chromadb_contents(retriever)
-    
-    # Test 5: Semantic search
-    test_semantic_search(retriever)
-    
-    # Test 6: Hybrid with context
-    test_hybrid_retrieval_with_context(retriever)
+    # Tests 3-6 only read from the shared retriever, so their ChromaDB and embedding
+    # calls run concurrently. Each test's output is buffered and printed in order.
+    # (contextlib.redirect_stdout swaps sys.stdout for every thread, so it can't be used here.)
+    independent_tests = [
+        test_temporal_memories,              # Test 3: Temporal memories
+        test_chromadb_contents,              # Test 4: ChromaDB contents
+        test_semantic_search,                # Test 5: Semantic search
+        test_hybrid_retrieval_with_context,  # Test 6: Hybrid with context
+    ]
+    stdout = sys.stdout
+    sys.stdout = output = _ThreadOutput(stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=len(independent_tests)) as executor:
+            futures = [executor.submit(_run_captured, output, test, retriever) for test in independent_tests]
+            results = [future.result() for future in futures]
+    finally:
+        sys.stdout = stdout
+    for result in results:
+        print(result, end='')
     
     # Test 7: MemoryManager integration
     test_memory_manager_integration()
@@ -1,16 +1,17 @@
 #!/usr/bin/env python
 """Test script to output randomized prompt elements."""
 
+import re
 import sys
 from pathlib import Path
 from datetime import datetime
-import pytz
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from src.llm.client import GroqClient
 from src.config import LOCATION_TIMEZONE
+from src.tz_cache import get_tz
 
 def test_randomizations(num_runs=5):
     """Test and display randomized prompt elements."""
@@ -18,14 +19,14 @@ def test_randomizations(num_runs=5):
     client = GroqClient()
     
     # Create mock context metadata
-    location_tz = pytz.timezone(LOCATION_TIMEZONE)
+    location_tz = get_tz(LOCATION_TIMEZONE)
     now = datetime.now(location_tz)
     
     context_metadata = {
         'date': now.strftime('%B %d, %Y'),
         'day_of_week': ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'][now.weekday()],
         'time': now.strftime('%I:%M %p'),
-        'timezone': 'CST' if now.astimezone(location_tz).dst() == pytz.timezone('UTC').localize(datetime(2024, 1, 1)).dst() else 'CDT',
+        'timezone': 'CDT' if now.dst() else 'CST',
         'season': 'Winter',  # Mock season
         'time_of_day': 'evening',
         'observation_type': 'evening',
@@ -119,8 +120,8 @@ def test_randomizations(num_runs=5):
     human_count = 0
     none_count = 0
     
-    for _ in range(100):
-        reflection = client._get_reflection_instructions()
+    get_reflection = client._get_reflection_instructions
+    for reflection in [get_reflection() for _ in range(100)]:
         if not reflection:
             none_count += 1
         elif 'writing pseudo-code' in reflection or 'debugging' in reflection or 'optimizing' in reflection or 'running diagnostics' in reflection:
@@ -166,20 +167,20 @@ def test_randomizations(num_runs=5):
     style_counts = {category: 0 for category in style_categories.keys()}
     style_counts['Unknown'] = 0
     
-    for _ in range(200):  # Test 200 style selections (100 pairs)
-        style = client._get_style_variation()
+    # One case-insensitive alternation per category: a single scan of the line
+    # per category instead of a substring test per keyword
+    category_patterns = [(category, re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE))
+                         for category, keywords in style_categories.items()]
+    
+    get_style = client._get_style_variation
+    for style in [get_style() for _ in range(200)]:  # Test 200 style selections (100 pairs)
         # Extract the style lines (skip the header)
         style_lines = [line.strip('- ').strip() for line in style.split('\n')[1:] if line.strip()]
         
         for style_line in style_lines:
-            categorized = False
-            for category, keywords in style_categories.items():
-                if any(keyword.lower() in style_line.lower() for keyword in keywords):
-                    style_counts[category] += 1
-                    categorized = True
-                    break
-            if not categorized:
-                style_counts['Unknown'] += 1
+            category = next((category for category, pattern in category_patterns
+                             if pattern.search(style_line)), 'Unknown')
+            style_counts[category] += 1
     
     total_styles = sum(style_counts.values())
     print(f"   Total style selections tested: {total_styles}")
@@ -0,0 +1,92 @@
+"""Tests for the YouTube frame fetcher (mocked, no yt-dlp/FFmpeg calls)."""
+import pytest
+import time
+from unittest.mock import patch
+
+from src.camera import youtube_fetcher
+from src.camera.youtube_fetcher import _stream_url_expiry, fetch_latest_image
+
+
+class TestStreamUrlReuse:
+    """Test that resolved stream URLs are reused across captures."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_fetcher(self, tmp_path):
+        """Use a temp image directory and an empty stream URL cache."""
+        youtube_fetcher._stream_url_cache.clear()
+        with patch.object(youtube_fetcher, 'IMAGES_DIR', tmp_path), \
+             patch.object(youtube_fetcher, 'CACHE_METADATA_FILE', tmp_path / '.cache_metadata.json'):
+            yield
+        youtube_fetcher._stream_url_cache.clear()
+
+    def test_expiry_from_query_param(self):
+        """Test that the expire=<epoch> query parameter sets the expiry."""
+        url = 'https://rr1.googlevideo.com/videoplayback?expire=1700000000&ei=abc'
+        assert _stream_url_expiry(url) == 1700000000 - youtube_fetcher.STREAM_URL_EXPIRY_MARGIN_SECONDS
+
+    def test_expiry_from_manifest_path(self):
+        """Test that HLS manifest URLs with /expire/<epoch>/ are understood."""
+        url = 'https://manifest.googlevideo.com/api/manifest/hls_playlist/expire/1700000000/ei/abc/index.m3u8'
+        assert _stream_url_expiry(url) == 1700000000 - youtube_fetcher.STREAM_URL_EXPIRY_MARGIN_SECONDS
+
+    def test_expiry_fallback(self):
+        """Test that URLs without an expiry fall back to a fixed TTL."""
+        expiry = _stream_url_expiry('https://example.com/stream.m3u8')
+        assert expiry == pytest.approx(time.time() + youtube_fetcher.STREAM_URL_FALLBACK_TTL_SECONDS, abs=5)
+
+    def test_second_capture_reuses_stream_url(self):
+        """Test that yt-dlp only runs once while the resolved URL is valid."""
+        url = f'https://rr1.googlevideo.com/videoplayback?expire={int(time.time()) + 7200}'
+        with patch.object(youtube_fetcher, '_get_youtube_stream_url', return_value=url) as mock_resolve, \
+             patch.object(youtube_fetcher, '_capture_frame_with_ffmpeg', return_value=True) as mock_capture:
+            fetch_latest_image(force_refresh=True)
+            fetch_latest_image(force_refresh=True)
+
+        mock_resolve.assert_called_once()
+        assert mock_capture.call_count == 2
+        assert all(call.args[0] == url for call in mock_capture.call_args_list)
+
+    def test_expired_stream_url_is_resolved_again(self):
+        """Test that an expired URL is not reused."""
+        expired = f'https://rr1.googlevideo.com/videoplayback?expire={int(time.time()) - 60}'
+        with patch.object(youtube_fetcher, '_get_youtube_stream_url', return_value=expired) as mock_resolve, \
+             patch.object(youtube_fetcher, '_capture_frame_with_ffmpeg', return_value=True):
+            fetch_latest_image(force_refresh=True)
+            fetch_latest_image(force_refresh=True)
+
+        assert mock_resolve.call_count == 2
+
+    def test_failed_capture_with_reused_url_retries_fresh(self):
+        """Test that a capture failure on a reused URL re-resolves and retries once."""
+        stale = f'https://rr1.googlevideo.com/videoplayback?expire={int(time.time()) + 7200}&v=1'
+        fresh = f'https://rr1.googlevideo.com/videoplayback?expire={int(time.time()) + 7200}&v=2'
+        youtube_fetcher._stream_url_cache[youtube_fetcher.YOUTUBE_STREAM_URL] = (stale, time.time() + 3600)
+
+        with patch.object(youtube_fetcher, '_get_youtube_stream_url', return_value=fresh) as mock_resolve, \
+             patch.object(youtube_fetcher, '_capture_frame_with_ffmpeg',
+                          side_effect=lambda stream_url, path: stream_url == fresh) as mock_capture:
+            fetch_latest_image(force_refresh=True)
+
+        mock_resolve.assert_called_once()
+        assert [call.args[0] for call in mock_capture.call_args_list] == [stale, fresh]
+
+    def test_failed_capture_drops_cached_url(self):
+        """Test that a failed capture with a fresh URL raises and forgets the URL."""
+        url = f'https://rr1.googlevideo.com/videoplayback?expire={int(time.time()) + 7200}'
+        with patch.object(youtube_fetcher, '_get_youtube_stream_url', return_value=url), \
+             patch.object(youtube_fetcher, '_capture_frame_with_ffmpeg', return_value=False) as mock_capture:
+            with pytest.raises(Exception, match="Failed to capture frame"):
+                fetch_latest_image(force_refresh=True)
+
+        mock_capture.assert_called_once()
+        assert youtube_fetcher.YOUTUBE_STREAM_URL not in youtube_fetcher._stream_url_cache
+
+    def test_cache_metadata_written_atomically(self, tmp_path):
+        """Test that a capture replaces the metadata file without leaving a temp file behind."""
+        url = f'https://rr1.googlevideo.com/videoplayback?expire={int(time.time()) + 7200}'
+        with patch.object(youtube_fetcher, '_get_youtube_stream_url', return_value=url), \
+             patch.object(youtube_fetcher, '_capture_frame_with_ffmpeg', return_value=True):
+            image_path = fetch_latest_image(force_refresh=True)
+
+        assert youtube_fetcher._load_cache_metadata()['latest_path'] == image_path.name
+        assert not (tmp_path / '.cache_metadata.json.tmp').exists()
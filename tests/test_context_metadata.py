@@ -172,3 +172,17 @@ class TestContextMetadata:
         assert get_ordinal_suffix(21) == "st"
         assert get_ordinal_suffix(22) == "nd"
 
+    
+    def test_get_context_metadata_reuses_minute_cache(self):
+        """Test that calls within a minute share work but not dictionaries."""
+        from src.context.metadata import _minute_metadata
+        
+        _minute_metadata.cache_clear()
+        first = get_context_metadata(weather_data={'temperature': 70}, observation_type='evening')
+        first['news_articles'] = ['added by caller']
+        second = get_context_metadata(observation_type='evening')
+        
+        assert _minute_metadata.cache_info().misses <= 2  # a minute boundary may fall between calls
+        assert second['weather'] == {}
+        assert 'news_articles' not in second
+        assert first['weather'] == {'temperature': 70}
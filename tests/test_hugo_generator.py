@@ -27,7 +27,8 @@ class TestHugoGenerator:
         """Create a HugoGenerator instance with temp directory."""
         # Mock the config values that HugoGenerator uses
         with patch('src.hugo.generator.HUGO_CONTENT_DIR', temp_hugo_dir / 'content' / 'posts'), \
-             patch('src.hugo.generator.HUGO_STATIC_IMAGES_DIR', temp_hugo_dir / 'static' / 'images'):
+             patch('src.hugo.generator.HUGO_STATIC_IMAGES_DIR', temp_hugo_dir / 'static' / 'images'), \
+             patch('src.hugo.generator.HUGO_SITE_PATH', temp_hugo_dir):
             generator = HugoGenerator()
             yield generator
     
@@ -61,6 +62,7 @@ class TestHugoGenerator:
         
         assert post_path.exists()
         assert post_path.suffix == '.md'
+        assert (temp_hugo_dir / 'assets' / 'images' / 'observation_1_test_image.jpg').exists()
         
         # Check file content
         content = post_path.read_text()
@@ -25,7 +25,8 @@ class TestHugoGeneratorEdgeCases:
     def hugo_generator(self, temp_hugo_dir):
         """Create HugoGenerator with temp directory."""
         with patch('src.hugo.generator.HUGO_CONTENT_DIR', temp_hugo_dir / 'content' / 'posts'), \
-             patch('src.hugo.generator.HUGO_STATIC_IMAGES_DIR', temp_hugo_dir / 'static' / 'images'):
+             patch('src.hugo.generator.HUGO_STATIC_IMAGES_DIR', temp_hugo_dir / 'static' / 'images'), \
+             patch('src.hugo.generator.HUGO_SITE_PATH', temp_hugo_dir):
             generator = HugoGenerator()
             yield generator
     
@@ -4,6 +4,7 @@ import json
 import tempfile
 from pathlib import Path
 from datetime import datetime
+from collections import OrderedDict
 from unittest.mock import patch, MagicMock, Mock
 import sys
 
@@ -81,6 +82,27 @@ class TestHybridMemoryRetriever:
             assert memories[0]['id'] == 5  # Most recent first
             assert memories[0]['source'] == 'temporal'
     
+    def test_embedding_model_warmed_up_in_background(self, memory_file):
+        """Test that a warm-up encode runs on a background thread after init."""
+        mock_embedding_model = MagicMock()
+        
+        def fake_initialize(self):
+            self.embedding_model = mock_embedding_model
+        
+        with patch('src.memory.retriever.CHROMA_AVAILABLE', True), \
+             patch('src.memory.retriever.HybridMemoryRetriever._initialize_chroma', fake_initialize), \
+             patch('src.memory.retriever.threading.Thread') as mock_thread:
+            from src.memory.retriever import HybridMemoryRetriever
+            
+            retriever = HybridMemoryRetriever(memory_file)
+            
+            assert retriever.chroma_available is True
+            mock_thread.assert_called_once_with(target=retriever._warm_up_embedding_model, daemon=True)
+            mock_thread.return_value.start.assert_called_once()
+            
+            retriever._warm_up_embedding_model()
+            mock_embedding_model.encode.assert_called_once_with("warmup", convert_to_numpy=True)
+    
     def test_get_recent_temporal_memories(self, memory_file):
         """Test getting recent temporal memories."""
         with patch('src.memory.retriever.CHROMA_AVAILABLE', False):
@@ -113,6 +135,15 @@ class TestHybridMemoryRetriever:
             assert 'time' in query.lower()
             assert 'morning' in query.lower()
             
+            # Test with an ISO date
+            context = {'date': '2024-03-05T10:00:00Z', 'time_of_day': 'evening'}
+            query = retriever.build_context_query(context)
+            assert query == "time: evening month: March"
+            
+            # Non-ISO dates are ignored
+            query = retriever.build_context_query({'date': 'December 11, 2025'})
+            assert query == "recent observations"
+            
             # Test with empty context
             query = retriever.build_context_query({})
             assert query == "recent observations"
@@ -264,9 +295,258 @@ class TestHybridMemoryRetriever:
             # Migrate
             count = retriever.migrate_json_to_chroma()
             
-            # Should have migrated all 5 memories
+            # Should have migrated all 5 memories in a single batched add
             assert count == 5
-            assert mock_collection.add.call_count == 5
+            mock_collection.add.assert_called_once()
+            assert mock_collection.add.call_args[1]['ids'] == ['1', '2', '3', '4', '5']
+            mock_embedding_model.encode.assert_called_once()
+
+
+    def test_migrate_skips_encode_for_existing_ids(self, memory_file):
+        """Test that migration looks up IDs once and only encodes missing memories."""
+        np = pytest.importorskip('numpy')
+        with patch('src.memory.retriever.CHROMA_AVAILABLE', True):
+            from src.memory.retriever import HybridMemoryRetriever
+            
+            retriever = HybridMemoryRetriever.__new__(HybridMemoryRetriever)
+            retriever.memory_file = memory_file
+            retriever.chroma_available = True
+            
+            mock_collection = MagicMock()
+            mock_collection.get.return_value = {
+                'ids': ['1', '2', '3', '4'],
+                'documents': ['Sunny', 'Rain', 'People', 'Entry 4']
+            }
+            mock_embedding_model = MagicMock()
+            mock_embedding_model.encode.return_value = np.zeros((2, 384), dtype=np.float32)
+            retriever.collection = mock_collection
+            retriever.embedding_model = mock_embedding_model
+            
+            count = retriever.migrate_json_to_chroma()
+            
+            assert count == 5
+            mock_collection.get.assert_called_once_with(ids=['1', '2', '3', '4', '5'], include=['documents'])
+            # Placeholder "Entry 4" is replaced; 1-3 are never re-encoded
+            mock_collection.delete.assert_called_once_with(ids=['4'])
+            assert mock_embedding_model.encode.call_args[0][0] == [
+                'Cloudy skies and mild temperatures',
+                'Early morning quiet in the building'
+            ]
+            assert mock_collection.add.call_args[1]['ids'] == ['4', '5']
+    
+    def test_migrate_dedupes_repeated_ids(self, memory_file, sample_memories):
+        """Test that a repeated ID in the memory file is only encoded and added once."""
+        np = pytest.importorskip('numpy')
+        memory_file.write_text(json.dumps(sample_memories[:2] + [dict(sample_memories[0], llm_summary='Repeat')]))
+        with patch('src.memory.retriever.CHROMA_AVAILABLE', True):
+            from src.memory.retriever import HybridMemoryRetriever
+            
+            retriever = HybridMemoryRetriever.__new__(HybridMemoryRetriever)
+            retriever.memory_file = memory_file
+            retriever.chroma_available = True
+            retriever.collection = MagicMock()
+            retriever.collection.get.return_value = {'ids': []}
+            retriever.embedding_model = MagicMock()
+            retriever.embedding_model.encode.return_value = np.zeros((2, 384), dtype=np.float32)
+            retriever.quantized_index = MagicMock()
+            
+            assert retriever.migrate_json_to_chroma() == 3
+            assert retriever.collection.add.call_args[1]['ids'] == ['1', '2']
+            assert retriever.embedding_model.encode.call_args[0][0] == [
+                'A bright sunny morning in New Orleans',
+                'Heavy rain in the French Quarter'
+            ]
+            assert retriever.quantized_index.add.call_args[0][0] == ['1', '2']
+    
+    def test_migrate_falls_back_to_single_adds(self, memory_file):
+        """Test that a rejected batch is retried one memory at a time."""
+        np = pytest.importorskip('numpy')
+        with patch('src.memory.retriever.CHROMA_AVAILABLE', True):
+            from src.memory.retriever import HybridMemoryRetriever
+            
+            retriever = HybridMemoryRetriever.__new__(HybridMemoryRetriever)
+            retriever.memory_file = memory_file
+            retriever.chroma_available = True
+            retriever.collection = MagicMock()
+            retriever.collection.get.return_value = {'ids': []}
+            retriever.embedding_model = MagicMock()
+            retriever.embedding_model.encode.return_value = np.zeros((5, 384), dtype=np.float32)
+            retriever.quantized_index = MagicMock()
+            
+            def add_memory(memory):
+                return memory['id'] != 3  # One bad memory
+            
+            with patch.object(retriever.collection, 'add', side_effect=ValueError("bad batch")), \
+                 patch.object(retriever, 'add_memory_to_chroma', side_effect=add_memory) as mock_single:
+                assert retriever.migrate_json_to_chroma() == 4
+            
+            assert [c.args[0]['id'] for c in mock_single.call_args_list] == [1, 2, 3, 4, 5]
+            retriever.quantized_index.add.assert_not_called()
+    
+    def test_context_embedding_cached(self, memory_file):
+        """Test that repeated context metadata reuses the cached query embedding."""
+        from src.memory.retriever import HybridMemoryRetriever
+        
+        retriever = HybridMemoryRetriever.__new__(HybridMemoryRetriever)
+        retriever._context_embeddings = OrderedDict()
+        retriever.embedding_model = MagicMock()
+        retriever.embedding_model.encode.side_effect = lambda text, **kwargs: f"emb:{text}"
+        
+        context = {'weather': {'currently': {'summary': 'Rain'}}, 'time_of_day': 'evening'}
+        first = retriever._embed_context(context)
+        second = retriever._embed_context(dict(context))
+        other = retriever._embed_context({'time_of_day': 'morning'})
+        
+        assert first == second == "emb:weather: Rain time: evening"
+        assert other == "emb:time: morning"
+        assert retriever.embedding_model.encode.call_count == 2
+    
+    def test_context_embedding_cache_is_bounded(self, memory_file):
+        """Test that the least recently used context embedding is evicted."""
+        from src.memory.retriever import HybridMemoryRetriever
+        
+        retriever = HybridMemoryRetriever.__new__(HybridMemoryRetriever)
+        retriever._context_embeddings = OrderedDict()
+        retriever.CONTEXT_EMBEDDING_CACHE_SIZE = 2
+        retriever.embedding_model = MagicMock()
+        
+        for time_of_day in ('morning', 'evening', 'night'):
+            retriever._embed_context({'time_of_day': time_of_day})
+        
+        assert list(retriever._context_embeddings) == [
+            (('time', 'evening'),),
+            (('time', 'night'),)
+        ]
+    
+    def test_load_all_memories(self, memory_file, sample_memories):
+        """Test that migration reads the full memory file with and without orjson."""
+        from src.memory.retriever import HybridMemoryRetriever
+        
+        retriever = HybridMemoryRetriever.__new__(HybridMemoryRetriever)
+        retriever.memory_file = memory_file
+        
+        assert retriever._load_all_memories() == sample_memories
+        with patch('src.memory.retriever.orjson', None):
+            assert retriever._load_all_memories() == sample_memories
+        
+        memory_file.write_text('')
+        assert retriever._load_all_memories() == []
+    
+    def test_semantic_search_uses_int8_index(self, memory_file, tmp_path):
+        """Test that semantic search scans the int8 index when it covers the collection."""
+        np = pytest.importorskip('numpy')
+        with patch('src.memory.retriever.CHROMA_AVAILABLE', True):
+            from src.memory.retriever import HybridMemoryRetriever
+            from src.memory.quantized_index import QuantizedEmbeddingIndex
+            
+            retriever = HybridMemoryRetriever.__new__(HybridMemoryRetriever)
+            retriever.memory_file = memory_file
+            retriever.chroma_available = True
+            
+            index = QuantizedEmbeddingIndex(tmp_path / 'embeddings_int8.npz')
+            index.add(['1', '2'], np.array([[1.0, 0.0], [0.0, 1.0]], dtype=np.float32))
+            retriever.quantized_index = index
+            
+            mock_collection = MagicMock()
+            mock_collection.count.return_value = 2
+            mock_collection.get.return_value = {
+                'ids': ['2'],
+                'documents': ['Heavy rain in the French Quarter'],
+                'metadatas': [{'id': 2, 'date': '2024-01-02T10:00:00'}]
+            }
+            mock_embedding_model = MagicMock()
+            mock_embedding_model.encode.return_value = np.array([0.0, 1.0], dtype=np.float32)
+            retriever.collection = mock_collection
+            retriever.embedding_model = mock_embedding_model
+            
+            memories = retriever.get_hybrid_memories(recent_count=1, semantic_top_k=1, query_text="rain")
+            
+            mock_collection.query.assert_not_called()
+            mock_collection.get.assert_called_once_with(ids=['2'])
+            assert [m['id'] for m in memories] == [5, 2]
+            assert memories[1]['source'] == 'semantic'
+
+    
+    def test_configure_torch_threads(self, memory_file):
+        """Test that torch uses EMBEDDING_THREADS intra-op and one inter-op thread."""
+        mock_torch = MagicMock()
+        mock_torch.set_num_interop_threads.side_effect = RuntimeError("already set")
+        with patch.dict('sys.modules', {'torch': mock_torch}), \
+             patch('src.memory.retriever.EMBEDDING_THREADS', 8):
+            from src.memory.retriever import HybridMemoryRetriever
+            
+            retriever = HybridMemoryRetriever.__new__(HybridMemoryRetriever)
+            retriever._configure_torch_threads()
+            
+            mock_torch.set_num_threads.assert_called_once_with(8)
+            mock_torch.set_num_interop_threads.assert_called_once_with(1)
+    
+    def test_apply_precision_autocasts_on_cpu(self, memory_file):
+        """Test that half precision on CPU wraps encode() in torch.autocast."""
+        mock_torch = MagicMock()
+        model = MagicMock()
+        model.device.type = 'cpu'
+        with patch.dict('sys.modules', {'torch': mock_torch}), \
+             patch('src.memory.retriever.EMBEDDING_PRECISION', 'bf16'):
+            from src.memory.retriever import HybridMemoryRetriever
+            
+            retriever = HybridMemoryRetriever.__new__(HybridMemoryRetriever)
+            retriever.embedding_model = retriever._apply_precision(model)
+            retriever._encode("rain", convert_to_numpy=True)
+            
+            assert retriever._autocast_dtype is mock_torch.bfloat16
+            model.to.assert_not_called()
+            mock_torch.autocast.assert_called_once_with('cpu', dtype=mock_torch.bfloat16)
+            model.encode.assert_called_once_with("rain", convert_to_numpy=True)
+    
+    def test_apply_precision_fp32_is_noop(self, memory_file):
+        """Test that the default precision leaves the model and encode() alone."""
+        model = MagicMock()
+        with patch('src.memory.retriever.EMBEDDING_PRECISION', 'fp32'):
+            from src.memory.retriever import HybridMemoryRetriever
+            
+            retriever = HybridMemoryRetriever.__new__(HybridMemoryRetriever)
+            assert retriever._apply_precision(model) is model
+            assert retriever._autocast_dtype is None
+    
+    def test_load_embedding_model_prefers_onnx(self, memory_file):
+        """Test that the ONNX backend is used when requested."""
+        with patch('src.memory.retriever.EMBEDDING_BACKEND', 'onnx'), \
+             patch('src.memory.retriever.SentenceTransformer', create=True) as mock_st:
+            from src.memory.retriever import HybridMemoryRetriever, EMBEDDING_MODEL_NAME
+            
+            retriever = HybridMemoryRetriever.__new__(HybridMemoryRetriever)
+            model = retriever._load_embedding_model()
+            
+            assert model is mock_st.return_value
+            mock_st.assert_called_once()
+            assert mock_st.call_args[0] == (EMBEDDING_MODEL_NAME,)
+            assert mock_st.call_args[1]['backend'] == 'onnx'
+    
+    def test_load_embedding_model_falls_back_to_torch(self, memory_file):
+        """Test that a failing ONNX backend falls back to PyTorch."""
+        torch_model = MagicMock()
+        with patch('src.memory.retriever.EMBEDDING_BACKEND', 'onnx'), \
+             patch('src.memory.retriever.SentenceTransformer', create=True,
+                   side_effect=[RuntimeError("onnx export failed"), torch_model]) as mock_st:
+            from src.memory.retriever import HybridMemoryRetriever, EMBEDDING_MODEL_NAME
+            
+            retriever = HybridMemoryRetriever.__new__(HybridMemoryRetriever)
+            model = retriever._load_embedding_model()
+            
+            assert model is torch_model
+            assert mock_st.call_args_list[-1] == ((EMBEDDING_MODEL_NAME,), {})
+    
+    def test_load_embedding_model_torch_backend(self, memory_file):
+        """Test that EMBEDDING_BACKEND=torch skips ONNX entirely."""
+        with patch('src.memory.retriever.EMBEDDING_BACKEND', 'torch'), \
+             patch('src.memory.retriever.SentenceTransformer', create=True) as mock_st:
+            from src.memory.retriever import HybridMemoryRetriever, EMBEDDING_MODEL_NAME
+            
+            retriever = HybridMemoryRetriever.__new__(HybridMemoryRetriever)
+            retriever._load_embedding_model()
+            
+            mock_st.assert_called_once_with(EMBEDDING_MODEL_NAME)
 
 
 class TestMemoryManagerHybridRetrieval:
@@ -88,6 +88,28 @@ class TestMemoryManager:
         
         assert memory_manager.get_total_count() == 3
     
+    def test_add_observation_returns_id(self, memory_manager, temp_memory_dir):
+        """Test that add_observation returns the new entry's ID."""
+        image_path = temp_memory_dir / 'test_image.jpg'
+        image_path.touch()
+        
+        assert memory_manager.add_observation(image_path, "First entry") == 1
+        assert memory_manager.add_observation(image_path, "Second entry") == 2
+    
+    def test_get_memory_state(self, memory_manager, temp_memory_dir):
+        """Test that the memory state matches the individual accessors."""
+        assert memory_manager.get_memory_state() == {'total_count': 0, 'first_observation_date': None}
+        
+        for i in range(2):
+            image_path = temp_memory_dir / f'test_image_{i}.jpg'
+            image_path.touch()
+            memory_manager.add_observation(image_path, f"Entry {i}")
+        
+        state = memory_manager.get_memory_state()
+        assert state['total_count'] == memory_manager.get_total_count() == 2
+        assert state['first_observation_date'] == memory_manager.get_first_observation_date()
+        assert isinstance(state['first_observation_date'], datetime)
+    
     def test_get_first_observation_date(self, memory_manager, temp_memory_dir):
         """Test getting first observation date."""
         # Test with no observations
@@ -131,6 +153,70 @@ class TestMemoryManager:
             assert schedule_info['type'] == 'morning'
             assert 'datetime' in schedule_info
     
+    def test_memory_read_from_cache_until_file_changes(self, memory_manager, temp_memory_dir):
+        """Test that counts reuse the parsed memory until the file changes on disk."""
+        image_path = temp_memory_dir / 'test_image.jpg'
+        image_path.touch()
+        memory_manager.add_observation(image_path, "First entry.")
+        
+        with patch('builtins.open', side_effect=AssertionError("memory re-read")):
+            assert memory_manager.get_total_count() == 1
+            assert memory_manager.get_recent_memory(count=5)[0]['content'] == "First entry."
+        
+        # Another process appends an entry
+        observations_file = temp_memory_dir / 'observations.json'
+        entries = json.loads(observations_file.read_text())
+        entries.append(dict(entries[0], id=2, content="Second entry."))
+        observations_file.write_text(json.dumps(entries))
+        assert memory_manager.get_total_count() == 2
+    
+    def test_schedule_read_from_memory_until_file_changes(self, memory_manager, temp_memory_dir):
+        """Test that the schedule is only re-read when the file changes on disk."""
+        from datetime import datetime
+        
+        schedule_file = temp_memory_dir / 'schedule.json'
+        with patch('src.memory.manager.SCHEDULE_FILE', schedule_file):
+            memory_manager.save_next_scheduled_time(datetime(2025, 3, 4, 8, 30), 'morning')
+            
+            with patch('builtins.open', side_effect=AssertionError("schedule re-read")):
+                assert memory_manager.get_next_scheduled_time()['type'] == 'morning'
+            
+            # Another process replaces the file
+            tmp = schedule_file.with_suffix('.other')
+            tmp.write_text(json.dumps({'next_observation': {'datetime': '2025-03-04T17:00:00', 'type': 'evening'}}))
+            tmp.replace(schedule_file)
+            assert memory_manager.get_next_scheduled_time()['type'] == 'evening'
+    
+    def test_unchanged_schedule_is_not_rewritten(self, memory_manager, temp_memory_dir):
+        """Test that saving the schedule already on disk skips the write."""
+        schedule_file = temp_memory_dir / 'schedule.json'
+        with patch('src.memory.manager.SCHEDULE_FILE', schedule_file):
+            memory_manager.save_next_scheduled_time(datetime(2025, 3, 4, 8, 30), 'morning')
+
+            with patch('builtins.open', side_effect=AssertionError("schedule rewritten")):
+                memory_manager.save_next_scheduled_time(datetime(2025, 3, 4, 8, 30), 'morning')
+
+            memory_manager.save_next_scheduled_time(datetime(2025, 3, 4, 17, 0), 'evening')
+            assert json.loads(schedule_file.read_text())['next_observation']['type'] == 'evening'
+
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_memory_file_round_trip(self, memory_manager, temp_memory_dir, use_orjson):
+        """Test that the memory file is written and read the same with and without orjson."""
+        from src.memory import manager
+        if use_orjson and manager.orjson is None:
+            pytest.skip("orjson not installed")
+
+        image_path = temp_memory_dir / 'test_image.jpg'
+        image_path.touch()
+        with patch('src.memory.manager.orjson', manager.orjson if use_orjson else None):
+            memory_manager.add_observation(image_path, "Café au lait on Decatur Street.")
+            memory_manager._memory_cache = None
+            assert memory_manager.get_recent_memory(count=1)[0]['content'] == "Café au lait on Decatur Street."
+
+        observations_file = temp_memory_dir / 'observations.json'
+        assert observations_file.read_text(encoding='utf-8').startswith('[\n  {')
+        assert json.loads(observations_file.read_text(encoding='utf-8'))[0]['id'] == 1
+
     def test_get_hybrid_memories_fallback(self, memory_manager, temp_memory_dir):
         """Test that get_hybrid_memories falls back to temporal when ChromaDB unavailable."""
         # Add multiple observations
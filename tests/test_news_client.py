@@ -8,10 +8,26 @@ from src.news.pulse_client import (
     get_cluster_headlines,
     get_random_headlines,
     get_random_articles,
+    get_articles_from_multiple_clusters,
+    prefetch_headlines,
+    clear_cache,
     PulseClient
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_pulse_cache():
+    """Start every test with an empty Pulse response cache and closed circuits."""
+    from src.news.pulse_client import _BREAKERS
+    clear_cache()
+    for breaker in _BREAKERS.values():
+        breaker.reset()
+    yield
+    clear_cache()
+    for breaker in _BREAKERS.values():
+        breaker.reset()
+
+
 class TestPulseClientFunctions:
     """Test Pulse API client functions with mocked requests."""
     
@@ -22,8 +38,8 @@ class TestPulseClientFunctions:
             {'cluster_id': 'c-2', 'topic_label': 'Politics'}
         ]
         
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
+        with patch('src.news.pulse_client._SESSION.get') as mock_get:
+            mock_response = Mock(status_code=200, headers={})
             mock_response.json.return_value = mock_clusters
             mock_response.raise_for_status = Mock()
             mock_get.return_value = mock_response
@@ -32,16 +48,74 @@ class TestPulseClientFunctions:
             assert len(result) == 2
             assert result[0]['cluster_id'] == 'c-1'
     
+    def test_get_clusters_list_cached(self):
+        """Test that the cluster list is served from cache until invalidated."""
+        mock_clusters = [{'cluster_id': 'c-1', 'topic_label': 'Technology'}]
+        
+        with patch('src.news.pulse_client._SESSION.get') as mock_get:
+            mock_response = Mock(status_code=200, headers={})
+            mock_response.json.return_value = mock_clusters
+            mock_response.raise_for_status = Mock()
+            mock_get.return_value = mock_response
+            
+            assert get_clusters_list() == mock_clusters
+            assert get_clusters_list() == mock_clusters
+            assert mock_get.call_count == 1
+            assert mock_get.call_args[1]['params'] == {'fields': 'cluster_id,topic_label'}
+            
+            clear_cache('clusters')
+            get_clusters_list()
+            assert mock_get.call_count == 2
+    
+    def test_get_clusters_list_cache_expires(self):
+        """Test that an expired cache entry triggers a new fetch."""
+        from src.news import pulse_client
+        
+        with patch('src.news.pulse_client._SESSION.get') as mock_get:
+            mock_response = Mock(status_code=200, headers={})
+            mock_response.json.return_value = [{'cluster_id': 'c-1'}]
+            mock_response.raise_for_status = Mock()
+            mock_get.return_value = mock_response
+            
+            get_clusters_list()
+            expires_at, clusters = pulse_client._cache['clusters']
+            pulse_client._cache['clusters'] = (expires_at - 2 * pulse_client.CLUSTERS_CACHE_TTL, clusters)
+            get_clusters_list()
+            assert mock_get.call_count == 2
+    
+    def test_get_clusters_list_conditional_get(self):
+        """Test that an expired list is revalidated with its ETag and reused on 304."""
+        from src.news import pulse_client
+        mock_clusters = [{'cluster_id': 'c-1', 'topic_label': 'Technology'}]
+        
+        first = Mock(status_code=200, headers={'ETag': '"v1"', 'Cache-Control': 'max-age=120'})
+        first.json.return_value = mock_clusters
+        not_modified = Mock(status_code=304, headers={})
+        
+        with patch('src.news.pulse_client._SESSION.get', side_effect=[first, not_modified]) as mock_get:
+            assert get_clusters_list() == mock_clusters
+            assert mock_get.call_args[1]['headers'] == {}
+            
+            # Server max-age overrides the default TTL (120s +/- 10% jitter)
+            expires_at, clusters = pulse_client._cache['clusters']
+            assert expires_at - pulse_client.time.monotonic() <= 132
+            pulse_client._cache['clusters'] = (0.0, clusters)
+            
+            assert get_clusters_list() == mock_clusters
+            assert mock_get.call_args[1]['headers'] == {'If-None-Match': '"v1"'}
+            not_modified.raise_for_status.assert_not_called()
+            assert pulse_client._cache_get('clusters') == mock_clusters
+    
     def test_get_clusters_list_request_error(self):
         """Test cluster list fetch with request error."""
-        with patch('requests.get', side_effect=Exception("Network error")):
+        with patch('src.news.pulse_client._SESSION.get', side_effect=Exception("Network error")):
             result = get_clusters_list()
             assert result == []
     
     def test_get_clusters_list_http_error(self):
         """Test cluster list fetch with HTTP error."""
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
+        with patch('src.news.pulse_client._SESSION.get') as mock_get:
+            mock_response = Mock(status_code=200, headers={})
             mock_response.raise_for_status.side_effect = Exception("404 Not Found")
             mock_get.return_value = mock_response
             
@@ -85,8 +159,8 @@ class TestPulseClientFunctions:
             ]
         }
         
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
+        with patch('src.news.pulse_client._SESSION.get') as mock_get:
+            mock_response = Mock(status_code=200, headers={})
             mock_response.json.return_value = mock_articles
             mock_response.raise_for_status = Mock()
             mock_get.return_value = mock_response
@@ -96,10 +170,43 @@ class TestPulseClientFunctions:
             assert result[0]['title'] == 'Article 1'
             assert result[0]['published_at'] == '2025-12-12T10:00:00Z'
     
+    def test_get_cluster_articles_cached_copies(self):
+        """Test that articles are cached per cluster and callers get their own copies."""
+        with patch('src.news.pulse_client._SESSION.get') as mock_get:
+            mock_response = Mock(status_code=200, headers={})
+            mock_response.json.return_value = {'articles': [{'title': 'Article 1'}]}
+            mock_get.return_value = mock_response
+            
+            first = get_cluster_articles('c-1', limit=1)
+            first[0]['_cluster_id'] = 'c-1'
+            second = get_cluster_articles('c-1', limit=1)
+            get_cluster_articles('c-2', limit=1)
+        
+        assert second == [{'title': 'Article 1'}]
+        assert mock_get.call_count == 2
+    
+    def test_get_cluster_articles_conditional_get(self):
+        """Test that expired articles are revalidated with Last-Modified and reused on 304."""
+        from src.news import pulse_client
+        key = 'articles:c-1:2'
+        first = Mock(status_code=200, headers={'Last-Modified': 'Fri, 12 Dec 2025 10:00:00 GMT'})
+        first.json.return_value = {'articles': [{'title': 'Article 1'}]}
+        not_modified = Mock(status_code=304, headers={})
+        
+        with patch('src.news.pulse_client._SESSION.get', side_effect=[first, not_modified]) as mock_get:
+            assert get_cluster_articles('c-1', limit=2) == [{'title': 'Article 1'}]
+            assert mock_get.call_args[1]['headers'] == {}
+            
+            pulse_client._cache[key] = (0.0, pulse_client._cache[key][1])
+            assert get_cluster_articles('c-1', limit=2) == [{'title': 'Article 1'}]
+            assert mock_get.call_args[1]['headers'] == {'If-Modified-Since': 'Fri, 12 Dec 2025 10:00:00 GMT'}
+            not_modified.raise_for_status.assert_not_called()
+            assert pulse_client._cache_get(key) == [{'title': 'Article 1'}]
+    
     def test_get_cluster_articles_empty(self):
         """Test fetching articles from empty cluster."""
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
+        with patch('src.news.pulse_client._SESSION.get') as mock_get:
+            mock_response = Mock(status_code=200, headers={})
             mock_response.json.return_value = {'articles': []}
             mock_response.raise_for_status = Mock()
             mock_get.return_value = mock_response
@@ -109,7 +216,7 @@ class TestPulseClientFunctions:
     
     def test_get_cluster_articles_error(self):
         """Test fetching articles with error."""
-        with patch('requests.get', side_effect=Exception("Error")):
+        with patch('src.news.pulse_client._SESSION.get', side_effect=Exception("Error")):
             result = get_cluster_articles('c-1')
             assert result == []
     
@@ -157,6 +264,120 @@ class TestPulseClientFunctions:
             result = get_random_articles(count=2)
             assert len(result) == 2
             assert result[0]['title'] == 'Article 1'
+    
+    def test_prefetch_headlines(self):
+        """Test fetching headlines for several clusters concurrently."""
+        articles = {
+            'c-1': [{'title': 'One'}],
+            'c-2': [{'title': 'Two'}, {'title': ''}],
+            'c-3': []
+        }
+        with patch('src.news.pulse_client.get_cluster_articles',
+                   side_effect=lambda cluster_id, limit: articles[cluster_id]):
+            result = prefetch_headlines(['c-1', 'c-2', 'c-3'], limit=2)
+        
+        assert result == {'c-1': ['One'], 'c-2': ['Two'], 'c-3': []}
+    
+    def test_get_articles_from_multiple_clusters(self):
+        """Test that articles from several clusters are fetched and tagged."""
+        clusters = [
+            {'cluster_id': 'c-1', 'topic_label': 'Tech'},
+            {'cluster_id': 'c-2', 'topic_label': 'Sports'}
+        ]
+        with patch('src.news.pulse_client.get_clusters_list', return_value=clusters), \
+             patch('src.news.pulse_client.get_cluster_articles',
+                   side_effect=lambda cluster_id, limit: [{'title': f'Story {cluster_id}'}]) as mock_articles:
+            result = get_articles_from_multiple_clusters(num_clusters=2, articles_per_cluster=1)
+        
+        assert mock_articles.call_count == 2
+        assert sorted(a['_cluster_id'] for a in result) == ['c-1', 'c-2']
+        assert {a['_cluster_topic'] for a in result} == {'Tech', 'Sports'}
+
+
+class TestTimeouts:
+    """Test Pulse timeout configuration."""
+    
+    def test_parse_connect_and_read(self):
+        """Test parsing a connect,read pair."""
+        from src.news.pulse_client import _parse_timeout_ms
+        assert _parse_timeout_ms('2000,5000') == (2.0, 5.0)
+    
+    def test_parse_read_only(self):
+        """Test that a single value sets the read timeout."""
+        from src.news.pulse_client import _parse_timeout_ms, _DEFAULT_CONNECT_TIMEOUT
+        assert _parse_timeout_ms('4500') == (_DEFAULT_CONNECT_TIMEOUT, 4.5)
+    
+    def test_parse_invalid_uses_defaults(self):
+        """Test that invalid values fall back to the defaults."""
+        from src.news.pulse_client import _parse_timeout_ms
+        assert _parse_timeout_ms('fast') == (3.05, 7.0)
+        assert _parse_timeout_ms('0,5000') == (3.05, 7.0)
+    
+    def test_requests_use_split_timeout(self):
+        """Test that requests pass a (connect, read) tuple."""
+        with patch('src.news.pulse_client._SESSION.get', side_effect=Exception("Error")) as mock_get:
+            get_cluster_articles('c-1')
+            assert mock_get.call_args[1]['timeout'] == (3.05, 7.0)
+
+
+class TestCircuitBreaker:
+    """Test the per-endpoint circuit breaker."""
+    
+    def test_opens_after_consecutive_failures(self):
+        """Test that the circuit opens and short-circuits further requests."""
+        with patch('src.news.pulse_client._SESSION.get', side_effect=Exception("Network error")) as mock_get:
+            for _ in range(5):
+                assert get_clusters_list() == []
+            assert mock_get.call_count == 5
+            
+            assert get_clusters_list() == []
+            assert mock_get.call_count == 5  # Short-circuited
+    
+    def test_half_open_probe_closes_on_success(self):
+        """Test that a successful probe after the recovery window closes the circuit."""
+        from src.news.pulse_client import _BREAKERS
+        breaker = _BREAKERS['clusters']
+        for _ in range(breaker.FAILURE_THRESHOLD):
+            breaker.record_failure()
+        assert breaker.state == breaker.OPEN
+        
+        breaker.opened_at -= breaker.RECOVERY_TIMEOUT
+        assert breaker.allow_request() is True
+        assert breaker.state == breaker.HALF_OPEN
+        assert breaker.allow_request() is False  # Only one probe at a time
+        
+        breaker.record_success()
+        assert breaker.state == breaker.CLOSED
+        assert breaker.failure_count == 0
+    
+    def test_half_open_probe_failure_reopens(self):
+        """Test that a failed probe re-opens the circuit."""
+        from src.news.pulse_client import _BREAKERS
+        breaker = _BREAKERS['cluster_articles']
+        for _ in range(breaker.FAILURE_THRESHOLD):
+            breaker.record_failure()
+        breaker.opened_at -= breaker.RECOVERY_TIMEOUT
+        
+        assert breaker.allow_request() is True
+        breaker.record_failure()
+        assert breaker.state == breaker.OPEN
+        assert breaker.allow_request() is False
+    
+    def test_endpoints_have_separate_breakers(self):
+        """Test that an open articles circuit doesn't block the cluster list."""
+        from src.news.pulse_client import _BREAKERS
+        for _ in range(5):
+            _BREAKERS['cluster_articles'].record_failure()
+        
+        with patch('src.news.pulse_client._SESSION.get') as mock_get:
+            mock_response = Mock(status_code=200, headers={})
+            mock_response.json.return_value = [{'cluster_id': 'c-1'}]
+            mock_response.raise_for_status = Mock()
+            mock_get.return_value = mock_response
+            
+            assert get_cluster_articles('c-1') == []
+            assert get_clusters_list() == [{'cluster_id': 'c-1'}]
+            assert mock_get.call_count == 1
 
 
 class TestPulseClientClass:
@@ -171,6 +392,16 @@ class TestPulseClientClass:
         """Test client initialization."""
         assert pulse_client.api_base == "https://pulse.henzi.org/api"
     
+    def test_client_shares_session(self, pulse_client):
+        """Test that the client reuses the pooled module session."""
+        from src.news.pulse_client import _SESSION
+        assert pulse_client._session is _SESSION
+        adapter = _SESSION.get_adapter("https://pulse.henzi.org/api/clusters/")
+        assert adapter.max_retries.total == 3
+        assert adapter.max_retries.backoff_factor == 0.5
+        assert 503 in adapter.max_retries.status_forcelist
+        assert adapter.max_retries.allowed_methods == frozenset(['GET'])
+    
     def test_get_headlines_with_cluster_id(self, pulse_client):
         """Test getting headlines with specific cluster ID."""
         mock_articles = {
@@ -180,8 +411,8 @@ class TestPulseClientClass:
             ]
         }
         
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
+        with patch('src.news.pulse_client._SESSION.get') as mock_get:
+            mock_response = Mock(status_code=200, headers={})
             mock_response.json.return_value = mock_articles
             mock_response.raise_for_status = Mock()
             mock_get.return_value = mock_response
@@ -198,8 +429,8 @@ class TestPulseClientClass:
             ]
         }
         
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
+        with patch('src.news.pulse_client._SESSION.get') as mock_get:
+            mock_response = Mock(status_code=200, headers={})
             mock_response.json.return_value = mock_articles
             mock_response.raise_for_status = Mock()
             mock_get.return_value = mock_response
@@ -209,7 +440,7 @@ class TestPulseClientClass:
     
     def test_get_headlines_error(self, pulse_client):
         """Test getting headlines with error."""
-        with patch('requests.get', side_effect=Exception("Error")):
+        with patch('src.news.pulse_client._SESSION.get', side_effect=Exception("Error")):
             result = pulse_client.get_headlines(cluster_id='c-1')
             assert result == []
     
@@ -221,8 +452,8 @@ class TestPulseClientClass:
             'neutral': 0.2
         }
         
-        with patch('requests.get') as mock_get:
-            mock_response = Mock()
+        with patch('src.news.pulse_client._SESSION.get') as mock_get:
+            mock_response = Mock(status_code=200, headers={})
             mock_response.json.return_value = mock_sentiment
             mock_response.raise_for_status = Mock()
             mock_get.return_value = mock_response
@@ -232,7 +463,7 @@ class TestPulseClientClass:
     
     def test_get_sentiment_overview_error(self, pulse_client):
         """Test getting sentiment overview with error."""
-        with patch('requests.get', side_effect=Exception("Error")):
+        with patch('src.news.pulse_client._SESSION.get', side_effect=Exception("Error")):
             result = pulse_client.get_sentiment_overview()
             assert result is None
 
@@ -0,0 +1,143 @@
+"""Tests for the int8 quantized embedding index."""
+import pytest
+import tempfile
+from pathlib import Path
+
+np = pytest.importorskip('numpy')
+
+from src.memory import quantized_index
+from src.memory.quantized_index import (
+    QuantizedEmbeddingIndex,
+    quantize_int8,
+    dequantize_int8,
+    quantize_binary,
+    hamming_distances
+)
+
+
+def _normalized(rows):
+    """Build L2-normalized float32 embeddings."""
+    arr = np.asarray(rows, dtype=np.float32)
+    return arr / np.linalg.norm(arr, axis=1, keepdims=True)
+
+
+class TestQuantization:
+    """Test int8 scalar quantization helpers."""
+
+    def test_quantize_int8_dtype_and_range(self):
+        """Test that quantized values are int8 and use the full range."""
+        emb = np.array([[1.0, -1.0, 0.0, 0.5]], dtype=np.float32)
+        q = quantize_int8(emb)
+        assert q.dtype == np.int8
+        assert q.tolist() == [[127, -127, 0, 64]]
+
+    def test_quantize_roundtrip_error_is_small(self):
+        """Test that dequantized embeddings stay close to the originals."""
+        rng = np.random.default_rng(0)
+        emb = _normalized(rng.normal(size=(10, 384)))
+        restored = dequantize_int8(quantize_int8(emb))
+        assert np.abs(restored - emb).max() <= 0.5 / 127 + 1e-6
+
+    def test_quantize_binary_packs_sign_bits(self):
+        """Test that binary quantization keeps one sign bit per dimension."""
+        emb = np.array([[0.5, -0.1, 0.2, -0.3, 0.0, 0.4, -0.2, 0.1, 0.9]], dtype=np.float32)
+        packed = quantize_binary(emb)
+        assert packed.dtype == np.uint8
+        assert packed.shape == (1, 2)
+        assert packed.tolist() == [[0b10100101, 0b10000000]]
+
+    def test_hamming_distances(self):
+        """Test popcount-based Hamming distances."""
+        matrix = np.array([[0b00000000], [0b11110000], [0b11111111]], dtype=np.uint8)
+        query = np.array([0b11110000], dtype=np.uint8)
+        assert hamming_distances(matrix, query).tolist() == [4, 0, 4]
+
+
+class TestQuantizedEmbeddingIndex:
+    """Test QuantizedEmbeddingIndex storage and search."""
+
+    @pytest.fixture
+    def index_path(self):
+        """Create a temporary index path."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir) / 'embeddings_int8.npz'
+
+    def test_empty_index(self, index_path):
+        """Test that a missing file gives an empty index."""
+        index = QuantizedEmbeddingIndex(index_path)
+        assert len(index) == 0
+        assert index.search([1.0, 0.0], top_k=3) == []
+
+    def test_search_returns_most_similar_first(self, index_path):
+        """Test that search ranks by similarity."""
+        index = QuantizedEmbeddingIndex(index_path)
+        index.add(['1', '2', '3'], _normalized([[1, 0, 0], [0, 1, 0], [0.9, 0.1, 0]]))
+
+        assert index.search(_normalized([[1, 0, 0]])[0], top_k=2) == ['1', '3']
+
+    def test_binary_prefilter_on_large_index(self, index_path, monkeypatch):
+        """Test that large indexes are prefiltered by Hamming distance before rescoring."""
+        monkeypatch.setattr(quantized_index, 'BINARY_RESCORE_CANDIDATES', 10)
+        rng = np.random.default_rng(1)
+        emb = _normalized(rng.normal(size=(100, 64)))
+        index = QuantizedEmbeddingIndex(index_path)
+        index.add([str(i) for i in range(100)], emb)
+
+        assert index.binary.shape == (100, 8)
+        # A stored vector is its own nearest neighbour in both binary and int8 space
+        assert index.search(emb[42], top_k=3)[0] == '42'
+        assert len(index.search(emb[42], top_k=50)) == 10
+
+    def test_add_replaces_existing_id(self, index_path):
+        """Test that re-adding an ID overwrites its row."""
+        index = QuantizedEmbeddingIndex(index_path)
+        index.add(['1', '2'], _normalized([[1, 0], [0, 1]]))
+        index.add(['1'], _normalized([[0, 1]]))
+
+        assert len(index) == 2
+        assert index.embeddings[0].tolist() == [0, 127]
+
+    def test_add_only_encodes_changed_rows(self, index_path, monkeypatch):
+        """Test that adds compute binary codes for new and replaced rows only."""
+        rng = np.random.default_rng(2)
+        index = QuantizedEmbeddingIndex(index_path)
+        index.add([str(i) for i in range(50)], _normalized(rng.normal(size=(50, 16))))
+
+        encoded_rows = []
+        real_quantize_binary = quantized_index.quantize_binary
+        def recording_quantize_binary(embeddings):
+            encoded_rows.append(len(embeddings))
+            return real_quantize_binary(embeddings)
+        monkeypatch.setattr(quantized_index, 'quantize_binary', recording_quantize_binary)
+
+        index.add(['50'], _normalized(rng.normal(size=(1, 16))))
+        index.add(['7', '51', '51'], _normalized(rng.normal(size=(3, 16))))
+
+        assert encoded_rows == [1, 1, 1]
+        assert len(index) == 52
+        assert index.binary.tolist() == real_quantize_binary(index.embeddings).tolist()
+
+    def test_persists_between_instances(self, index_path):
+        """Test that the index is saved and reloaded."""
+        index = QuantizedEmbeddingIndex(index_path)
+        index.add(['7', '8'], _normalized([[1, 0], [0, 1]]))
+
+        reloaded = QuantizedEmbeddingIndex(index_path)
+        assert reloaded.ids == ['7', '8']
+        assert '8' in reloaded
+        assert reloaded.embeddings.dtype == np.int8
+
+    def test_clear_removes_file(self, index_path):
+        """Test that clear empties the index and deletes the file."""
+        index = QuantizedEmbeddingIndex(index_path)
+        index.add(['1'], _normalized([[1, 0]]))
+        index.clear()
+
+        assert len(index) == 0
+        assert not index_path.exists()
+
+    def test_corrupted_file_starts_empty(self, index_path):
+        """Test that an unreadable file is ignored."""
+        index_path.write_bytes(b'not an npz file')
+        index = QuantizedEmbeddingIndex(index_path)
+        assert len(index) == 0
@@ -7,7 +7,9 @@ from src.scheduler import (
     get_random_evening_time,
     get_next_observation_time,
     is_time_for_observation,
-    get_observation_schedule_summary
+    get_observation_schedule_summary,
+    get_observation_type_for_time,
+    seconds_until_observation
 )
 
 
@@ -87,4 +89,46 @@ class TestScheduler:
         assert isinstance(summary, str)
         assert 'morning' in summary.lower()
         assert '8:30' in summary or '08:30' in summary
+    
+    def test_get_observation_schedule_summary_matches_strftime(self):
+        """Test that the summary matches the strftime format for every hour."""
+        from src.config import LOCATION_TIMEZONE
+        tz = pytz.timezone(LOCATION_TIMEZONE)
+        for hour in range(24):
+            next_time = tz.localize(datetime(2025, 3, 2, hour, 5))
+            expected = next_time.strftime('%I:%M %p on %A, %B %d')
+            assert get_observation_schedule_summary(next_time, 'evening') == \
+                f"Next evening observation scheduled for {expected}"
 
+    def test_get_observation_schedule_summary_is_memoized(self):
+        """Test that summarizing the same instant again is a cache hit, in any timezone."""
+        from src.config import LOCATION_TIMEZONE
+        get_observation_schedule_summary.cache_clear()
+        local = pytz.timezone(LOCATION_TIMEZONE).localize(datetime(2025, 3, 4, 17, 15))
+        
+        first = get_observation_schedule_summary(local, 'evening')
+        assert get_observation_schedule_summary(local.astimezone(pytz.utc), 'evening') == first
+        assert get_observation_schedule_summary.cache_info().hits == 1
+    
+    def test_seconds_until_observation(self):
+        """Test seconds until a scheduled time, including across a DST change."""
+        from src.config import LOCATION_TIMEZONE
+        tz = pytz.timezone(LOCATION_TIMEZONE)
+        
+        now = tz.localize(datetime(2025, 3, 4, 8, 0))
+        assert seconds_until_observation(tz.localize(datetime(2025, 3, 4, 8, 5)), now) == 300
+        assert seconds_until_observation(now, tz.localize(datetime(2025, 3, 4, 8, 5))) == -300
+        # Clocks spring forward on 2025-03-09, so that wall-clock day is 23 hours long
+        before = tz.localize(datetime(2025, 3, 9, 0, 0))
+        after = tz.localize(datetime(2025, 3, 10, 0, 0))
+        assert seconds_until_observation(after, before) == 23 * 3600
+    
+    def test_get_observation_type_for_time(self):
+        """Test the morning/evening split for unscheduled observations."""
+        from src.config import LOCATION_TIMEZONE
+        tz = pytz.timezone(LOCATION_TIMEZONE)
+        
+        assert get_observation_type_for_time(tz.localize(datetime(2025, 3, 4, 4, 59))) == 'evening'
+        assert get_observation_type_for_time(tz.localize(datetime(2025, 3, 4, 5, 0))) == 'morning'
+        assert get_observation_type_for_time(tz.localize(datetime(2025, 3, 4, 11, 59))) == 'morning'
+        assert get_observation_type_for_time(tz.localize(datetime(2025, 3, 4, 12, 0))) == 'evening'
@@ -94,6 +94,18 @@ class TestSchedulerEdgeCases:
         
         assert is_time_for_observation(now, scheduled, tolerance_minutes=5) is False
     
+    def test_is_time_for_observation_across_midnight(self):
+        """Test that times on either side of midnight are minutes apart, not a day."""
+        from src.config import LOCATION_TIMEZONE
+        tz = pytz.timezone(LOCATION_TIMEZONE)
+        
+        now = tz.localize(datetime(2025, 3, 4, 23, 55))
+        scheduled = tz.localize(datetime(2025, 3, 5, 0, 5))  # 10 minutes later
+        
+        assert is_time_for_observation(now, scheduled, tolerance_minutes=10) is True
+        assert is_time_for_observation(scheduled, now, tolerance_minutes=10) is True
+        assert is_time_for_observation(now, scheduled, tolerance_minutes=9) is False
+    
     def test_get_next_observation_time_future(self):
         """Test that next observation time is always in the future."""
         from src.config import LOCATION_TIMEZONE
@@ -117,3 +129,27 @@ class TestSchedulerEdgeCases:
         # Compare timezone names instead of objects (pytz timezone objects can differ)
         assert str(next_time.tzinfo) == str(tz) or next_time.tzinfo.zone == tz.zone
 
+    
+    def test_get_next_observation_time_late_in_morning_window(self):
+        """Test that a run late in the morning window still schedules this morning."""
+        from src.config import LOCATION_TIMEZONE
+        tz = pytz.timezone(LOCATION_TIMEZONE)
+        
+        now = tz.localize(datetime(2025, 3, 4, 9, 28, 30))
+        for _ in range(20):
+            next_time, obs_type = get_next_observation_time(now)
+            assert obs_type == 'morning'
+            assert next_time.date() == now.date()
+            assert (next_time.hour, next_time.minute) in [(9, 29), (9, 30)]
+    
+    def test_get_next_observation_time_seconds_past_evening_end(self):
+        """Test that seconds past the end of the evening window count as after it."""
+        from src.config import LOCATION_TIMEZONE
+        tz = pytz.timezone(LOCATION_TIMEZONE)
+        
+        # Tuesday, 30 seconds after the 6:00 PM weekday window closes
+        now = tz.localize(datetime(2025, 3, 4, 18, 0, 30))
+        for _ in range(20):
+            next_time, obs_type = get_next_observation_time(now)
+            assert obs_type == 'morning'
+            assert next_time.day == 5
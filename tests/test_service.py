@@ -1,6 +1,11 @@
 """Tests for service module, focusing on next scheduled time logic."""
+import json
+import os
 import pytest
+import signal
 import tempfile
+import threading
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, MagicMock
@@ -307,3 +312,532 @@ class TestServiceNextScheduledTime:
             diary_entry_with_schedule = call_args[0][0]
             assert "Next scheduled observation" in diary_entry_with_schedule
 
+
+class TestServiceWakeEvent:
+    """Test that signals wake the main loop instead of waiting for a poll."""
+    
+    @pytest.fixture(autouse=True)
+    def reset_flags(self):
+        """Restore the service's global flags after each test."""
+        from src import service
+        yield
+        service.shutdown_requested = False
+        service.trigger_observation = False
+        service.wake_event.clear()
+    
+    def test_trigger_handler_sets_wake_event(self):
+        """Test that SIGUSR1 wakes the loop and requests an observation."""
+        from src import service
+        service.wake_event.clear()
+        service.trigger_observation_handler(10, None)
+        assert service.trigger_observation is True
+        assert service.wake_event.is_set()
+    
+    def test_shutdown_handler_sets_wake_event(self):
+        """Test that a shutdown signal wakes the loop."""
+        from src import service
+        service.wake_event.clear()
+        service.signal_handler(15, None)
+        assert service.shutdown_requested is True
+        assert service.wake_event.is_set()
+    
+    @pytest.mark.skipif(not hasattr(signal, 'SIGUSR1'), reason="SIGUSR1 not available on this platform")
+    def test_real_signal_ends_wait_immediately(self):
+        """Test that a delivered SIGUSR1 ends a long main-thread wait right away."""
+        from src import service
+        previous = signal.signal(signal.SIGUSR1, service.trigger_observation_handler)
+        timer = threading.Timer(0.1, os.kill, args=(os.getpid(), signal.SIGUSR1))
+        try:
+            timer.start()
+            started = time.monotonic()
+            assert service.wake_event.wait(timeout=30) is True
+            assert time.monotonic() - started < 5
+            assert service.trigger_observation is True
+        finally:
+            timer.cancel()
+            signal.signal(signal.SIGUSR1, previous)
+
+
+class TestServiceSharedComponents:
+    """Test that observation cycles reuse components passed in by the service loop."""
+    
+    def test_observation_cycle_uses_passed_components(self, tmp_path):
+        """Test that passed-in components are used instead of new instances."""
+        image_path = tmp_path / 'test_image.jpg'
+        image_path.touch()
+        
+        memory_manager = Mock()
+        memory_manager.get_memory_state.return_value = {'total_count': 1, 'first_observation_date': None}
+        memory_manager.get_next_scheduled_time.return_value = None
+        llm_client = Mock()
+        hugo_generator = Mock()
+        hugo_generator.create_post.return_value = tmp_path / 'post.md'
+        
+        with patch('src.service.fetch_latest_image', return_value=image_path), \
+             patch('src.service.MemoryManager') as mock_memory_class, \
+             patch('src.service.GroqClient') as mock_groq_class, \
+             patch('src.service.HugoGenerator') as mock_hugo_class, \
+             patch('src.service.get_context_metadata', return_value={
+                 'date': 'December 13, 2025',
+                 'time': '10:00 AM',
+                 'timezone': 'CST',
+                 'day_of_week': 'Friday',
+                 'season': 'Winter',
+                 'time_of_day': 'morning',
+                 'observation_type': 'morning'
+             }), \
+             patch('src.service.generate_dynamic_prompt', return_value="Mock prompt"), \
+             patch('src.service.create_diary_entry', return_value="Test diary entry") as mock_create, \
+             patch('src.service.PirateWeatherClient'):
+            from src.service import run_observation_cycle
+            next_scheduled = run_observation_cycle(observation_type='morning', memory_manager=memory_manager,
+                                                   llm_client=llm_client, hugo_generator=hugo_generator)
+        
+        # The cycle hands back the schedule it saved, so the loop doesn't re-read it
+        assert next_scheduled == memory_manager.save_next_scheduled_time.call_args[0]
+        mock_memory_class.assert_not_called()
+        mock_groq_class.assert_not_called()
+        mock_hugo_class.assert_not_called()
+        assert mock_create.call_args[0][2] is llm_client
+        memory_manager.add_observation.assert_called_once()
+        hugo_generator.create_post.assert_called_once()
+    
+    def test_weather_and_news_fetch_during_image_download(self, tmp_path):
+        """Test that weather and news are fetched while the image is still downloading."""
+        image_path = tmp_path / 'test_image.jpg'
+        image_path.touch()
+        weather_started, news_started = threading.Event(), threading.Event()
+        
+        def slow_image(force_refresh=False):
+            # Only returns once both other fetches are running alongside it
+            assert weather_started.wait(5) and news_started.wait(5)
+            return image_path
+        
+        memory_manager = Mock()
+        memory_manager.get_memory_state.return_value = {'total_count': 1, 'first_observation_date': None}
+        memory_manager.get_next_scheduled_time.return_value = None
+        hugo_generator = Mock()
+        hugo_generator.create_post.return_value = tmp_path / 'post.md'
+        
+        with patch('src.service.fetch_latest_image', side_effect=slow_image), \
+             patch('src.service._fetch_weather',
+                   side_effect=lambda: weather_started.set() or {'summary': 'Clear', 'temperature': 40}), \
+             patch('src.service._maybe_fetch_news_articles',
+                   side_effect=lambda: news_started.set() or [{'title': 'Headline'}]), \
+             patch('src.service.get_context_metadata', return_value={
+                 'date': 'December 13, 2025',
+                 'time': '10:00 AM',
+                 'timezone': 'CST',
+                 'day_of_week': 'Friday',
+                 'season': 'Winter',
+                 'time_of_day': 'morning',
+                 'observation_type': 'morning'
+             }) as mock_context, \
+             patch('src.service.generate_dynamic_prompt', return_value="Mock prompt"), \
+             patch('src.service.create_diary_entry', return_value="Test diary entry"):
+            from src.service import run_observation_cycle
+            run_observation_cycle(observation_type='morning', memory_manager=memory_manager,
+                                  llm_client=Mock(), hugo_generator=hugo_generator)
+        
+        assert mock_context.call_args[0][0] == {'summary': 'Clear', 'temperature': 40}
+        assert mock_context.return_value['news_headlines'] == ['Headline']
+        memory_manager.add_observation.assert_called_once()
+    
+    def test_simulation_cycle_uses_passed_components(self, tmp_path):
+        """Test that simulations reuse passed-in components and still skip saving."""
+        image_path = tmp_path / 'test_image.jpg'
+        image_path.touch()
+        
+        memory_manager = Mock()
+        memory_manager.get_memory_state.return_value = {'total_count': 1, 'first_observation_date': None}
+        llm_client = Mock(_last_full_prompt="Full prompt")
+        
+        with patch('src.service.PROJECT_ROOT', tmp_path), \
+             patch('src.service.SIMULATIONS_DIR', tmp_path / 'simulations'), \
+             patch('src.service.fetch_latest_image', return_value=image_path), \
+             patch('src.service._fetch_weather', return_value={}), \
+             patch('src.service._maybe_fetch_news_articles', return_value=[]), \
+             patch('src.service.MemoryManager') as mock_memory_class, \
+             patch('src.service.GroqClient') as mock_groq_class, \
+             patch('src.service.get_context_metadata', return_value={
+                 'date': 'December 13, 2025',
+                 'time': '10:00 AM',
+                 'timezone': 'CST',
+                 'day_of_week': 'Friday',
+                 'season': 'Winter',
+                 'time_of_day': 'morning',
+                 'observation_type': 'morning'
+             }), \
+             patch('src.service.generate_dynamic_prompt', return_value="Mock prompt"), \
+             patch('src.service.create_diary_entry', return_value="Test diary entry") as mock_create:
+            from src.service import run_simulation_cycle
+            sim_path = run_simulation_cycle(observation_type='morning', memory_manager=memory_manager,
+                                            llm_client=llm_client)
+        
+        mock_memory_class.assert_not_called()
+        mock_groq_class.assert_not_called()
+        assert mock_create.call_args[0][2] is llm_client
+        memory_manager.add_observation.assert_not_called()
+        markdown = Path(sim_path).read_text()
+        assert markdown.startswith("# Simulation Observation\n\n**Generated:** ")
+        assert "## Prompt Sent to LLM\n\n```\nFull prompt\n```\n\n---\n\n" in markdown
+        assert "## Diary Entry\n\nTest diary entry\n\n---\n\n## Image\n\n" in markdown
+        assert markdown.endswith("![Observation Image](../test_image.jpg)\n\n")
+
+
+class TestServiceNewsFormatting:
+    """Test the shared news article helpers."""
+    
+    def test_format_articles_by_topic(self):
+        """Test that articles are grouped by topic with source, date and sentiment."""
+        from src.service import _format_articles_by_topic
+        
+        articles = [
+            {'title': 'A', '_cluster_topic': 'Weather', 'source': 'WWL',
+             'published_at': '2025-12-12T17:33:20Z', 'sentiment_label': 'neutral'},
+            {'title': 'B', '_cluster_topic': 'Sports', 'published_at': 'yesterday'},
+            {'title': 'C', '_cluster_topic': 'Weather'},
+        ]
+        articles_text, topic_labels = _format_articles_by_topic(articles)
+        
+        assert topic_labels == ['Weather', 'Sports']
+        assert articles_text == [
+            '\n**Weather:**',
+            '- A from WWL (published December 12, 2025 at 05:33 PM) [neutral]',
+            '- C',
+            '\n**Sports:**',
+            '- B (published yesterday)',
+        ]
+    
+    def test_build_news_prompt(self):
+        """Test that the news prompt template is filled in with topics, articles and the dynamic prompt."""
+        from src.service import NEWS_IDENTITY_CONTEXT, _build_news_prompt
+        
+        articles = [
+            {'title': 'Storm {update}', '_cluster_topic': 'Weather'},
+            {'title': 'Final score', '_cluster_topic': 'Sports'},
+        ]
+        prompt = _build_news_prompt(articles, "Dynamic {prompt}")
+        
+        assert prompt.startswith(NEWS_IDENTITY_CONTEXT)
+        assert "multiple topics: Weather, Sports." in prompt
+        assert "transmissions about Weather, Sports. The news items are:" in prompt
+        assert prompt.count("- Storm {update}") == 2
+        assert "\n\nDynamic {prompt}\n\nRemember:" in prompt
+        assert "transmissions about various topics" in _build_news_prompt([], "")
+    
+    def test_published_suffix_is_memoized(self):
+        """Test that repeated publish dates are only parsed once."""
+        from src.service import _published_suffix
+        _published_suffix.cache_clear()
+        
+        assert _published_suffix('2025-12-12T17:33:20+00:00') == ' (published December 12, 2025 at 05:33 PM)'
+        assert _published_suffix('2025-12-12T17:33:20+00:00') == ' (published December 12, 2025 at 05:33 PM)'
+        assert _published_suffix('') == ''
+        assert _published_suffix.cache_info().hits == 1
+
+
+class TestServicePrepareCycleContext:
+    """Test the shared memory/weather/context/prompt steps of the observation cycles."""
+
+    CONTEXT = {
+        'date': 'December 13, 2025',
+        'time': '10:00 AM',
+        'timezone': 'CST',
+        'day_of_week': 'Friday',
+        'season': 'Winter',
+        'time_of_day': 'morning',
+        'observation_type': 'morning'
+    }
+
+    def _prepare(self, **kwargs):
+        """Run _prepare_cycle_context with mocked memory, weather and prompt generation."""
+        from concurrent.futures import Future
+        from src.service import _prepare_cycle_context
+
+        memory_manager = Mock()
+        memory_manager.get_memory_state.return_value = {'total_count': 3, 'first_observation_date': None}
+        weather_future = Future()
+        weather_future.set_result({'summary': 'Clear', 'temperature': 61})
+
+        with patch('src.service.get_context_metadata', return_value=dict(self.CONTEXT)), \
+             patch('src.service.generate_dynamic_prompt', return_value="Mock prompt") as mock_prompt:
+            ctx = _prepare_cycle_context(memory_manager, Mock(), weather_future, observation_type='morning', **kwargs)
+        return ctx, mock_prompt
+
+    def test_image_context_includes_fetched_headlines(self):
+        """Test that image-based cycles get the optional news articles and headlines."""
+        from concurrent.futures import Future
+        news_future = Future()
+        news_future.set_result([{'title': 'Parade rolls tonight'}, {'summary': 'No title'}])
+
+        ctx, mock_prompt = self._prepare(is_unscheduled=True, news_future=news_future)
+
+        context = ctx['context_metadata']
+        assert context['is_unscheduled'] is True
+        assert context['news_headlines'] == ['Parade rolls tonight']
+        assert 'news_clusters' not in context
+        assert ctx['memory_count'] == 3
+        assert ctx['days_since_first'] == 0
+        assert ctx['weather_data'] == {'summary': 'Clear', 'temperature': 61}
+        assert ctx['optimized_prompt'] == "Mock prompt"
+        args = mock_prompt.call_args[0]
+        assert args[0] == [] and args[2] is context and args[4:] == (3, 0)
+
+    def test_news_context_groups_articles_by_cluster(self):
+        """Test that news-based cycles get cluster info and no headline list."""
+        articles = [
+            {'title': 'A', '_cluster_id': 'c1', '_cluster_topic': 'Weather'},
+            {'title': 'B', '_cluster_id': 'c2', '_cluster_topic': 'Sports'},
+        ]
+
+        ctx, _ = self._prepare(articles=articles)
+
+        context = ctx['context_metadata']
+        assert context['news_articles'] is articles
+        assert [info['cluster_id'] for info in context['news_clusters']] == ['c1', 'c2']
+        assert 'news_headlines' not in context
+
+    def test_news_cycle_tags_memory_with_cluster(self, tmp_path):
+        """Test that news-based observations are saved with their first cluster's ID."""
+        memory_manager = Mock()
+        memory_manager.get_memory_state.return_value = {'total_count': 1, 'first_observation_date': None}
+        memory_manager.get_next_scheduled_time.return_value = None
+        llm_client = Mock()
+        llm_client.create_diary_entry_from_text.return_value = "News-based entry"
+        hugo_generator = Mock()
+
+        articles = [{'title': 'A', '_cluster_id': 'c1', '_cluster_topic': 'Weather'}]
+        with patch('src.service.get_articles_from_multiple_clusters', return_value=articles), \
+             patch('src.service.get_context_metadata', return_value=dict(self.CONTEXT)), \
+             patch('src.service.generate_dynamic_prompt', return_value="Mock prompt"), \
+             patch('src.service.save_last_news_observation_date'), \
+             patch('src.service._build_and_deploy'):
+            from src.service import run_news_based_observation
+            run_news_based_observation(observation_type='morning', memory_manager=memory_manager,
+                                       llm_client=llm_client, hugo_generator=hugo_generator)
+
+        assert memory_manager.add_observation.call_args.kwargs['image_url'] == 'news://c1'
+
+
+class TestServiceLastNewsObservation:
+    """Test the cached last news observation marker."""
+    
+    @pytest.fixture
+    def marker_file(self, tmp_path):
+        """Point the marker at a temp file and reset the in-memory copy."""
+        from src import service
+        path = tmp_path / '.last_news_observation.json'
+        with patch.object(service, 'LAST_NEWS_OBSERVATION_FILE', path), \
+             patch.object(service, '_last_news_observation', None), \
+             patch.object(service, '_last_news_observation_loaded', False):
+            yield path
+    
+    def test_missing_marker(self, marker_file):
+        """Test that no marker file means no previous news observation."""
+        from src.service import get_last_news_observation_date
+        assert get_last_news_observation_date() is None
+    
+    def test_marker_is_read_once(self, marker_file):
+        """Test that the marker file is only parsed on the first call."""
+        from src.service import get_last_news_observation_date
+        marker_file.write_text('{"date": "2025-12-10T18:30:00"}')
+        
+        assert get_last_news_observation_date() == datetime(2025, 12, 10, 18, 30)
+        marker_file.unlink()
+        assert get_last_news_observation_date() == datetime(2025, 12, 10, 18, 30)
+    
+    def test_save_is_atomic_and_updates_cache(self, marker_file):
+        """Test that saving replaces the file and the next read comes from memory."""
+        from src.service import get_last_news_observation_date, save_last_news_observation_date
+        marker_file.write_text('{"date": "2025-12-10T18:30:00"}')
+        assert get_last_news_observation_date() == datetime(2025, 12, 10, 18, 30)
+        
+        save_last_news_observation_date()
+        saved = datetime.fromisoformat(json.loads(marker_file.read_text())['date'])
+        assert get_last_news_observation_date() == saved
+        assert (datetime.now() - saved) < timedelta(minutes=1)
+        assert not marker_file.with_suffix('.json.tmp').exists()
+    
+    def test_corrupt_marker_is_ignored(self, marker_file):
+        """Test that an unreadable marker is treated as no previous news observation."""
+        from src.service import get_last_news_observation_date
+        marker_file.write_text('not json')
+        assert get_last_news_observation_date() is None
+
+
+class TestServiceNewsCountdown:
+    """Test the countdown of eligible cycles to the next news-based observation."""
+    
+    @pytest.fixture(autouse=True)
+    def fresh_countdown(self, monkeypatch):
+        """Start every test without a drawn countdown."""
+        from src import service
+        monkeypatch.setattr(service, '_news_countdown', None)
+    
+    def test_countdown_drawn_once_per_news_observation(self):
+        """Test that one random draw decides how many eligible cycles pass before news."""
+        from src.service import _should_run_news_observation
+        
+        # A draw of 0.5 gives a gap of 7 cycles with a 10% chance per cycle
+        with patch('src.service.random.random', return_value=0.5) as mock_random:
+            decisions = [_should_run_news_observation(None) for _ in range(7)]
+        
+        assert decisions == [False] * 6 + [True]
+        mock_random.assert_called_once()
+    
+    def test_recent_news_observation_does_not_count_down(self):
+        """Test that cycles within NEWS_OBSERVATION_MIN_DAYS neither run news nor use up the countdown."""
+        from src import service
+        service._news_countdown = 1
+        
+        assert service._should_run_news_observation(service.NEWS_OBSERVATION_MIN_DAYS - 1) is False
+        assert service._news_countdown == 1
+        assert service._should_run_news_observation(service.NEWS_OBSERVATION_MIN_DAYS) is True
+        assert service._news_countdown is None
+    
+    def test_countdown_gap_averages_chance(self):
+        """Test that the drawn gaps match the per-cycle news chance on average."""
+        import random
+        from src import service
+        
+        with patch('src.service.random.random', random.Random(1234).random):
+            gaps = [service._draw_news_countdown() for _ in range(20000)]
+        assert min(gaps) >= 1
+        assert sum(gaps) / len(gaps) == pytest.approx(1 / service.NEWS_OBSERVATION_CHANCE, rel=0.05)
+
+
+class TestServiceNewsBuffer:
+    """Test the background-refreshed buffer of optional news articles."""
+    
+    @pytest.fixture(autouse=True)
+    def empty_buffer(self, monkeypatch):
+        """Start every test with an empty news buffer."""
+        from src import service
+        monkeypatch.setattr(service, '_news_buffer', [])
+    
+    def test_articles_sampled_from_buffer(self):
+        """Test that cycles sample copies of buffered articles without calling the news API."""
+        from src import service
+        service._news_buffer = [{'title': f'Story {i}'} for i in range(5)]
+        
+        with patch('src.service.random.random', return_value=0.1), \
+             patch('src.service.get_random_articles') as mock_fetch:
+            articles = service._maybe_fetch_news_articles()
+        
+        mock_fetch.assert_not_called()
+        assert len(articles) == 2
+        assert all(article in service._news_buffer for article in articles)
+        assert all(article is not buffered for article in articles for buffered in service._news_buffer)
+    
+    def test_empty_buffer_fetches_directly(self):
+        """Test that one-off runs without a filled buffer still get news."""
+        from src import service
+        
+        with patch('src.service.random.random', return_value=0.1), \
+             patch('src.service.get_random_articles', return_value=[{'title': 'Live'}]) as mock_fetch:
+            assert service._maybe_fetch_news_articles() == [{'title': 'Live'}]
+        mock_fetch.assert_called_once_with(count=2)
+    
+    def test_failed_refresh_keeps_buffer(self):
+        """Test that a failed or empty refresh doesn't wipe the buffer."""
+        from src import service
+        
+        with patch('src.service.get_random_articles', return_value=[{'title': 'A'}, {'title': 'B'}]) as mock_fetch:
+            assert service._refresh_news_buffer() == 2
+        mock_fetch.assert_called_once_with(count=service.NEWS_BUFFER_SIZE)
+        
+        with patch('src.service.get_random_articles', side_effect=Exception("timeout")):
+            assert service._refresh_news_buffer() == 2
+        with patch('src.service.get_random_articles', return_value=[]):
+            assert service._refresh_news_buffer() == 2
+        assert service._news_buffer == [{'title': 'A'}, {'title': 'B'}]
+
+
+class TestServiceBackgroundPublish:
+    """Test that Hugo build/deploy runs off the observation path."""
+    
+    def test_publish_runs_build_then_deploy(self):
+        """Test that a queued publish builds and then deploys."""
+        from src import service
+        hugo_generator = Mock()
+        hugo_generator.build_site.return_value = True
+        hugo_generator.deploy_site.return_value = True
+        
+        future = service.publish_site_in_background(hugo_generator)
+        assert future.result(timeout=5) is True
+        hugo_generator.build_site.assert_called_once()
+        hugo_generator.deploy_site.assert_called_once()
+    
+    def test_failed_build_skips_deploy(self):
+        """Test that deploy is skipped when the build fails."""
+        from src import service
+        hugo_generator = Mock()
+        hugo_generator.build_site.return_value = False
+        
+        assert service.publish_site_in_background(hugo_generator).result(timeout=5) is False
+        hugo_generator.deploy_site.assert_not_called()
+    
+    def test_queued_publish_is_superseded(self):
+        """Test that a build still waiting in the queue is replaced by a newer one."""
+        from src import service
+        
+        started, release = threading.Event(), threading.Event()
+        busy = Mock()
+        busy.build_site.side_effect = lambda: started.set() or release.wait(5)
+        stale, fresh = Mock(), Mock()
+        
+        running = service.publish_site_in_background(busy)
+        assert started.wait(5)
+        queued = service.publish_site_in_background(stale)
+        latest = service.publish_site_in_background(fresh)
+        release.set()
+        service.wait_for_publish()
+        
+        assert running.done() and not running.cancelled()
+        assert queued.cancelled()
+        assert latest.done()
+        stale.build_site.assert_not_called()
+        fresh.build_site.assert_called_once()
+    
+    def test_cycle_returns_before_build_finishes(self, tmp_path):
+        """Test that a cycle writes its post, then returns while the build is still running."""
+        from src import service
+        image_path = tmp_path / 'test_image.jpg'
+        image_path.touch()
+        
+        building, release = threading.Event(), threading.Event()
+        hugo_generator = Mock()
+        hugo_generator.create_post.return_value = tmp_path / 'post.md'
+        hugo_generator.build_site.side_effect = lambda: building.set() or release.wait(5)
+        memory_manager = Mock()
+        memory_manager.get_memory_state.return_value = {'total_count': 1, 'first_observation_date': None}
+        memory_manager.get_next_scheduled_time.return_value = None
+        
+        with patch('src.service.fetch_latest_image', return_value=image_path), \
+             patch('src.service._fetch_weather', return_value={}), \
+             patch('src.service._maybe_fetch_news_articles', return_value=[]), \
+             patch('src.service.get_context_metadata', return_value={
+                 'date': 'December 13, 2025',
+                 'time': '10:00 AM',
+                 'timezone': 'CST',
+                 'day_of_week': 'Friday',
+                 'season': 'Winter',
+                 'time_of_day': 'morning',
+                 'observation_type': 'morning'
+             }), \
+             patch('src.service.generate_dynamic_prompt', return_value="Mock prompt"), \
+             patch('src.service.create_diary_entry', return_value="Test diary entry"):
+            service.run_observation_cycle(observation_type='morning', memory_manager=memory_manager,
+                                          llm_client=Mock(), hugo_generator=hugo_generator,
+                                          background_publish=True)
+        
+        try:
+            # The post is written on the cycle's thread; the build is still in progress
+            hugo_generator.create_post.assert_called_once()
+            assert building.wait(5)
+            hugo_generator.deploy_site.assert_not_called()
+        finally:
+            release.set()
+            service.wait_for_publish()
+        hugo_generator.deploy_site.assert_called_once()
@@ -0,0 +1,19 @@
+"""Tests for the timezone cache."""
+from src.tz_cache import get_tz
+
+
+class TestTzCache:
+    """Test get_tz."""
+    
+    def test_returns_named_zone(self):
+        """Test that the requested zone is returned."""
+        assert str(get_tz('America/Chicago')) == 'America/Chicago'
+    
+    def test_same_object_per_name(self):
+        """Test that repeated lookups share one object."""
+        assert get_tz('America/Chicago') is get_tz('America/Chicago')
+    
+    def test_scheduler_and_service_share_zone(self):
+        """Test that scheduler and service use the same cached zone."""
+        from src import scheduler, service
+        assert scheduler.LOCATION_TZ is service.LOCATION_TZ
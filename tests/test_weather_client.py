@@ -1,13 +1,22 @@
 """Tests for weather client (mocked, no API calls)."""
 import pytest
 import json
+import os
 import tempfile
+import time
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 from unittest.mock import patch, Mock, mock_open
 from src.weather.pirate_weather import PirateWeatherClient
 
 
+def _write_cached_response(cache_file, currently, age_seconds=0):
+    """Write a raw API response to the cache file, fetched age_seconds ago."""
+    cache_file.write_text(json.dumps({'currently': currently}))
+    fetched = time.time() - age_seconds
+    os.utime(cache_file, (fetched, fetched))
+
+
 class TestPirateWeatherClient:
     """Test weather client functionality without API calls."""
     
@@ -29,6 +38,19 @@ class TestPirateWeatherClient:
         assert weather_client.api_key == 'test_key'
         assert weather_client.base_url == "https://api.pirateweather.net"
     
+    def test_clients_share_pooled_session(self, weather_client):
+        """Test that every client reuses the module's pooled HTTP session."""
+        from src.weather import pirate_weather
+        other = PirateWeatherClient(api_key='other_key')
+        assert weather_client._session is pirate_weather._SESSION
+        assert other._session is weather_client._session
+    
+    def test_session_retries_transient_errors(self, weather_client):
+        """Test that the pooled session retries transient API failures."""
+        retry = weather_client._session.get_adapter('https://api.pirateweather.net').max_retries
+        assert retry.total == 2
+        assert 503 in retry.status_forcelist
+    
     def test_load_cache_missing_file(self, weather_client):
         """Test loading cache when file doesn't exist."""
         result = weather_client._load_cache()
@@ -36,28 +58,16 @@ class TestPirateWeatherClient:
     
     def test_load_cache_expired(self, weather_client, temp_cache_dir):
         """Test loading expired cache."""
-        cache_file = temp_cache_dir / 'cache.json'
-        old_time = (datetime.now() - timedelta(hours=1)).isoformat()
-        cache_data = {
-            'cached_at': old_time,
-            'data': {'temperature': 72}
-        }
-        with open(cache_file, 'w') as f:
-            json.dump(cache_data, f)
+        _write_cached_response(temp_cache_dir / 'cache.json', {'temperature': 72}, age_seconds=3600)
         
-        result = weather_client._load_cache()
+        # The file's age alone decides; an expired file is not even read
+        with patch('pathlib.Path.read_bytes', side_effect=AssertionError("expired cache read")):
+            result = weather_client._load_cache()
         assert result is None  # Expired cache should return None
     
     def test_load_cache_valid(self, weather_client, temp_cache_dir):
         """Test loading valid cache."""
-        cache_file = temp_cache_dir / 'cache.json'
-        recent_time = datetime.now().isoformat()
-        cache_data = {
-            'cached_at': recent_time,
-            'data': {'temperature': 72, 'summary': 'Sunny'}
-        }
-        with open(cache_file, 'w') as f:
-            json.dump(cache_data, f)
+        _write_cached_response(temp_cache_dir / 'cache.json', {'temperature': 72, 'summary': 'Sunny'})
         
         result = weather_client._load_cache()
         assert result is not None
@@ -73,29 +83,38 @@ class TestPirateWeatherClient:
         result = weather_client._load_cache()
         assert result is None  # Should handle error gracefully
     
+    def test_load_cache_old_format(self, weather_client, temp_cache_dir):
+        """Test that a cache file from before raw responses were cached is ignored."""
+        cache_file = temp_cache_dir / 'cache.json'
+        cache_file.write_text(json.dumps({'cached_at': datetime.now().isoformat(),
+                                          'data': {'temperature': 72}}))
+        
+        assert weather_client._load_cache() is None
+    
     def test_save_cache(self, weather_client, temp_cache_dir):
         """Test saving cache."""
         cache_file = temp_cache_dir / 'cache.json'
-        weather_data = {'temperature': 75, 'summary': 'Cloudy'}
+        raw = json.dumps({'currently': {'temperature': 75, 'summary': 'Cloudy'}}).encode()
         
-        weather_client._save_cache(weather_data)
+        weather_client._save_cache(raw, {'temperature': 75, 'summary': 'Cloudy'})
         
-        assert cache_file.exists()
-        with open(cache_file, 'r') as f:
-            cache = json.load(f)
-            assert 'cached_at' in cache
-            assert cache['data'] == weather_data
+        assert cache_file.read_bytes() == raw
+    
+    def test_saved_cache_is_not_parsed_again(self, weather_client, temp_cache_dir):
+        """Test that the cache file is only re-read when it changes on disk."""
+        raw = json.dumps({'currently': {'temperature': 75, 'summary': 'Cloudy'}}).encode()
+        weather_client._save_cache(raw, {'temperature': 75, 'summary': 'Cloudy'})
+        
+        with patch('pathlib.Path.read_bytes', side_effect=AssertionError("cache re-read")):
+            assert weather_client._load_cache()['summary'] == 'Cloudy'
+        
+        # Another process rewrites the file
+        _write_cached_response(temp_cache_dir / 'cache.json', {'temperature': 60, 'summary': 'Rain'})
+        assert weather_client._load_cache()['summary'] == 'Rain'
     
     def test_get_current_weather_from_cache(self, weather_client, temp_cache_dir):
         """Test getting weather from valid cache."""
-        cache_file = temp_cache_dir / 'cache.json'
-        recent_time = datetime.now().isoformat()
-        cache_data = {
-            'cached_at': recent_time,
-            'data': {'temperature': 70, 'summary': 'Clear'}
-        }
-        with open(cache_file, 'w') as f:
-            json.dump(cache_data, f)
+        _write_cached_response(temp_cache_dir / 'cache.json', {'temperature': 70, 'summary': 'Clear'})
         
         result = weather_client.get_current_weather(use_cache=True)
         assert result['temperature'] == 70
@@ -103,22 +122,16 @@ class TestPirateWeatherClient:
     
     def test_get_current_weather_api_error_fallback(self, weather_client, temp_cache_dir):
         """Test API error with expired cache fallback."""
-        cache_file = temp_cache_dir / 'cache.json'
-        old_time = (datetime.now() - timedelta(hours=1)).isoformat()
-        cache_data = {
-            'cached_at': old_time,
-            'data': {'temperature': 65, 'summary': 'Old data'}
-        }
-        with open(cache_file, 'w') as f:
-            json.dump(cache_data, f)
+        _write_cached_response(temp_cache_dir / 'cache.json', {'temperature': 65, 'summary': 'Old data'},
+                               age_seconds=3600)
         
-        # Mock requests.get to raise RequestException (which triggers fallback)
+        # Mock the session's get to raise RequestException (which triggers fallback)
         # Note: The implementation checks cache first, and if expired, tries API.
         # When API fails, it tries _load_cache() again, but that will return None
         # for expired cache. So we need to test with a valid cache that becomes
         # unavailable during API call, or test the actual behavior (empty dict).
         from requests.exceptions import RequestException
-        with patch('src.weather.pirate_weather.requests.get', side_effect=RequestException("API Error")):
+        with patch('src.weather.pirate_weather._SESSION.get', side_effect=RequestException("API Error")):
             # Since cache is expired, _load_cache returns None, API fails, 
             # and fallback _load_cache() also returns None (expired)
             result = weather_client.get_current_weather(use_cache=True)
@@ -129,11 +142,27 @@ class TestPirateWeatherClient:
         """Test getting weather when cache and API both fail."""
         # Ensure no cache exists, then mock API failure
         from requests.exceptions import RequestException
-        with patch('src.weather.pirate_weather.requests.get', side_effect=RequestException("API Error")):
+        with patch('src.weather.pirate_weather._SESSION.get', side_effect=RequestException("API Error")):
             result = weather_client.get_current_weather(use_cache=True)
             # Should return empty dict when both cache and API fail
             assert result == {}  # Should return empty dict
     
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_get_current_weather_from_api(self, weather_client, temp_cache_dir, use_orjson):
+        """Test that the API response is parsed and cached with and without orjson."""
+        from src.weather import pirate_weather
+        if use_orjson and pirate_weather.orjson is None:
+            pytest.skip("orjson not installed")
+        
+        response = Mock(content=json.dumps({'currently': {'temperature': 81.5, 'summary': 'Humid'}}).encode())
+        with patch('src.weather.pirate_weather.orjson', pirate_weather.orjson if use_orjson else None), \
+             patch('src.weather.pirate_weather._SESSION.get', return_value=response):
+            result = weather_client.get_current_weather(use_cache=False)
+        
+        assert result['temperature'] == 81.5
+        assert result['summary'] == 'Humid'
+        assert (temp_cache_dir / 'cache.json').read_bytes() == response.content
+    
     def test_format_weather_empty(self, weather_client):
         """Test formatting empty weather data."""
         result = weather_client.format_weather_for_prompt({})
@@ -184,6 +213,19 @@ class TestPirateWeatherClient:
         result = weather_client.format_weather_for_prompt(weather)
         assert "overcast" in result.lower() or "cloudy" in result.lower()
     
+    @pytest.mark.parametrize('cloud_cover, label', [
+        (0.1, "Mostly clear"),
+        (0.25, "Partly cloudy"),
+        (0.5, "Mostly cloudy"),
+        (0.74, "Mostly cloudy"),
+        (0.75, "Overcast"),
+        (1.0, "Overcast"),
+    ])
+    def test_format_weather_cloud_cover_boundaries(self, weather_client, cloud_cover, label):
+        """Test that each cloud-cover bound belongs to the cloudier description."""
+        result = weather_client.format_weather_for_prompt({'cloud_cover': cloud_cover})
+        assert result.endswith(label)
+    
     def test_format_weather_all_fields(self, weather_client):
         """Test formatting with all weather fields."""
         weather = {